@@ -0,0 +1,642 @@
+#!/usr/bin/env python3
+"""
+AI-Hub 비동기 API 클라이언트
+aiohttp 기반으로 AIHubClient와 같은 기능(API 키 검증, 데이터셋 목록/정보 조회,
+API 매뉴얼 조회, 다운로드)을 asyncio 코루틴으로 제공
+
+aiohttp는 선택 의존성입니다: pip install aihub-client[async]
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - 선택 의존성
+    aiohttp = None
+
+from aihub_cache import MetadataCache, approximate_size
+from aihub_client import (
+    AIHubAPIError,
+    AIHubAuthError,
+    AIHubClient,
+    DOWNLOAD_CHUNK_SIZE,
+    MERGE_BUFFER_SIZE,
+    _DATASETS_CACHE_KEY,
+    _DownloadProgress,
+    _preallocate,
+)
+
+
+class _BodyInterrupted(AIHubAPIError):
+    """응답 본문을 받다가 연결이 끊김 (received: 끊기기 전까지 기록한 바이트 수)"""
+    
+    def __init__(self, message: str, received: int):
+        super().__init__(message)
+        self.received = received
+
+
+def _write_at(file_obj, offset: int, data: bytes):
+    """파일의 offset 위치에 data 기록 (작업자 스레드에서 실행)"""
+    file_obj.seek(offset)
+    file_obj.write(data)
+
+
+class AsyncAIHubClient:
+    """
+    AI-Hub 비동기 API 클라이언트
+    
+    설정, 메타데이터 캐시(sqlite/메모리), 응답 파싱, 압축 해제/병합은 내부의
+    AIHubClient와 공유하고, HTTP 요청만 aiohttp 연결 풀로 보냅니다. 예외는
+    AIHubClient와 같은 AIHubAPIError/AIHubAuthError를 사용합니다.
+    
+    사용 예:
+        async with AsyncAIHubClient() as client:
+            datasets = await client.get_datasets()
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = 300,
+        default_download_path: Optional[str] = None,
+        pool_idle_timeout: Optional[float] = None,
+        **client_options
+    ):
+        """
+        비동기 클라이언트 초기화
+        
+        Args:
+            api_key: AI-Hub API 키 (None이면 환경변수에서 가져옴)
+            base_url: API 기본 URL (기본값: https://api.aihub.or.kr)
+            timeout: 요청 타임아웃 (초)
+            default_download_path: 기본 다운로드 경로
+            pool_idle_timeout: 사용하지 않는 연결을 풀에 보관하는 시간 (초, 기본값: 15,
+                환경변수 AIHUB_POOL_IDLE_TIMEOUT)
+            **client_options: AIHubClient의 나머지 설정 (download_segments, cache_ttl, pool_maxsize 등)
+        
+        Raises:
+            ImportError: aiohttp가 설치되지 않았을 때
+            AIHubAuthError: API 키가 없을 때
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncAIHubClient를 사용하려면 aiohttp가 필요합니다: pip install aihub-client[async]"
+            )
+        
+        self.client = AIHubClient(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            default_download_path=default_download_path,
+            **client_options
+        )
+        self.api_key = self.client.api_key
+        self.base_url = self.client.base_url
+        self.timeout = self.client.timeout
+        self.default_download_path = self.client.default_download_path
+        self.endpoints = self.client.endpoints
+        if pool_idle_timeout is None:
+            pool_idle_timeout = float(os.getenv('AIHUB_POOL_IDLE_TIMEOUT', '15'))
+        self.pool_idle_timeout = pool_idle_timeout
+        self.logger = logging.getLogger(__name__)
+        
+        # aiohttp 세션은 실행 중인 이벤트 루프에서 만들어야 하므로 처음 요청할 때 생성
+        self._session: Optional['aiohttp.ClientSession'] = None
+        
+        # 실행 중인 메타데이터 요청 (같은 키의 동시 호출이 하나의 작업을 기다림)
+        self._inflight: Dict[Any, 'asyncio.Future'] = {}
+    
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료"""
+        await self.close()
+    
+    async def close(self):
+        """HTTP 세션과 캐시 연결 종료"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self.client.close()
+    
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """연결 풀이 설정된 aiohttp 세션 반환 (처음 사용할 때 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.client.pool_maxsize * self.client.pool_connections,
+                limit_per_host=self.client.pool_maxsize,
+                # 유휴 연결 보관 시간 (TCP keep-alive 탐지 간격과는 별개의 설정)
+                keepalive_timeout=self.pool_idle_timeout if self.client.keep_alive else None,
+                force_close=not self.client.keep_alive
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    'apikey': self.api_key,
+                    'User-Agent': 'AIHub-Python-Client/1.0'
+                },
+                # 다운로드는 오래 걸리므로 전체 시간이 아니라 연결/읽기 대기 시간만 제한
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+            )
+        return self._session
+    
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> 'aiohttp.ClientResponse':
+        """
+        HTTP 요청 실행 (호출한 쪽에서 응답을 release/close 해야 함)
+        AIHubClient와 같은 엔드포인트별 재시도 정책, 재시도 예산, 속도 제한을 사용
+        
+        Args:
+            method: HTTP 메서드 (GET, POST 등)
+            url: 요청 URL
+            params: URL 파라미터
+            headers: 추가 요청 헤더
+        
+        Returns:
+            HTTP 응답 객체 (본문은 아직 읽지 않은 상태)
+        
+        Raises:
+            AIHubAPIError: API 요청 실패시
+        """
+        policy = self.client._retry_policy(url)
+        limiter = self.client.rate_limiters.get(self.client._request_category(url))
+        attempt = 0
+        while True:
+            attempt += 1
+            if limiter is not None:
+                # 이벤트 루프를 막지 않도록 토큰이 생길 때까지 asyncio.sleep으로 대기
+                wait = limiter.reserve()
+                while wait > 0:
+                    await asyncio.sleep(wait)
+                    wait = limiter.reserve()
+            self.client.retry_budget.record_request()
+            try:
+                response = await self._get_session().request(method, url, params=params, headers=headers)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    error = AIHubAPIError(f"요청 시간 초과 ({self.timeout}초)")
+                elif isinstance(e, aiohttp.ClientConnectionError):
+                    error = AIHubAPIError("네트워크 연결 오류")
+                else:
+                    error = AIHubAPIError(f"요청 오류: {str(e)}")
+                delay = self.client._retry_delay(policy, method, attempt)
+                if delay is None:
+                    raise error
+                self.logger.warning(
+                    f"Retrying {method} {url} in {delay:.1f}s (attempt {attempt}/{policy.max_attempts}): {error}"
+                )
+                await asyncio.sleep(delay)
+                continue
+            
+            if response.status == 401:
+                response.release()
+                raise AIHubAuthError("API 키가 유효하지 않습니다.")
+            elif response.status == 403:
+                response.release()
+                raise AIHubAuthError("해당 데이터셋에 대한 접근 권한이 없습니다.")
+            elif response.status not in (200, 206, 304):
+                response.release()
+                delay = None
+                if policy.should_retry_status(response.status):
+                    delay = self.client._retry_delay(policy, method, attempt, response.headers.get('retry-after'))
+                if delay is None:
+                    raise AIHubAPIError(f"API 요청 실패: HTTP {response.status}")
+                self.logger.warning(
+                    f"Retrying {method} {url} in {delay:.1f}s "
+                    f"(attempt {attempt}/{policy.max_attempts}): HTTP {response.status}"
+                )
+                await asyncio.sleep(delay)
+                continue
+            
+            return response
+    
+    async def _read_text(self, response: 'aiohttp.ClientResponse') -> str:
+        """응답 본문을 텍스트로 읽고 연결을 풀에 반환"""
+        try:
+            return await response.text()
+        except asyncio.TimeoutError:
+            raise AIHubAPIError(f"요청 시간 초과 ({self.timeout}초)")
+        except aiohttp.ClientError as e:
+            raise AIHubAPIError(f"요청 오류: {str(e)}")
+        finally:
+            response.release()
+    
+    async def validate_api_key(self) -> bool:
+        """
+        API 키 유효성 검증
+        
+        Returns:
+            API 키가 유효한지 여부
+        """
+        try:
+            response = await self._make_request('GET', self.endpoints['validate'])
+            response.release()
+            return response.status == 200
+        except AIHubAPIError:
+            return False
+    
+    async def _cached_get(self, url: str, refresh: bool = False) -> str:
+        """
+        메타데이터 조회 (AIHubClient와 같은 디스크 캐시 사용)
+        
+        Args:
+            url: 요청 URL
+            refresh: True면 TTL과 관계없이 서버에 재검증
+        
+        Returns:
+            응답 본문
+        """
+        cache = self.client.cache
+        if cache is None:
+            return await self._read_text(await self._make_request('GET', url))
+        
+        # sqlite 조회/기록은 잠금 대기나 느린 디스크에서 블로킹되므로 작업자 스레드에서 실행
+        loop = asyncio.get_running_loop()
+        key = MetadataCache.make_key(self.api_key, url)
+        entry = await loop.run_in_executor(None, cache.get, key)
+        if entry is not None and entry['fresh'] and not refresh:
+            return entry['body']
+        
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = await self._make_request('GET', url, headers=headers)
+        if response.status == 304 and entry is not None:
+            response.release()
+            await loop.run_in_executor(None, cache.touch, key)
+            return entry['body']
+        
+        body = await self._read_text(response)
+        await loop.run_in_executor(None, functools.partial(
+            cache.put,
+            key,
+            body,
+            etag=response.headers.get('etag'),
+            last_modified=response.headers.get('last-modified')
+        ))
+        return body
+    
+    async def get_datasets(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        전체 데이터셋 목록 조회
+        
+        Args:
+            refresh: True면 캐시를 서버에 재검증
+        
+        Returns:
+            데이터셋 목록 정보
+        """
+        info_cache = self.client.info_cache
+        if info_cache is not None and not refresh:
+            datasets = info_cache.get(_DATASETS_CACHE_KEY)
+            if datasets is not None:
+                return datasets
+        
+        return await self._single_flight(('datasets', refresh), self._fetch_datasets, refresh)
+    
+    async def _fetch_datasets(self, refresh: bool) -> Dict[str, Any]:
+        """데이터셋 목록을 가져와 메모리 캐시에 저장 (get_datasets의 병합된 요청)"""
+        info_cache = self.client.info_cache
+        body = await self._cached_get(self.endpoints['datasets'], refresh=refresh)
+        datasets = self.client._parse_body(body)
+        if info_cache is not None:
+            info_cache.put(_DATASETS_CACHE_KEY, datasets, approximate_size(datasets))
+        return datasets
+    
+    async def get_dataset_info(self, dataset_key: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        특정 데이터셋의 파일 트리 정보 조회
+        
+        Args:
+            dataset_key: 데이터셋 키
+            refresh: True면 캐시를 서버에 재검증
+        
+        Returns:
+            데이터셋 파일 트리 정보
+        """
+        info_cache = self.client.info_cache
+        if info_cache is not None and not refresh:
+            dataset_info = info_cache.get(dataset_key)
+            if dataset_info is not None:
+                return dataset_info
+        
+        return await self._single_flight(('info', dataset_key, refresh), self._fetch_dataset_info, dataset_key, refresh)
+    
+    async def _fetch_dataset_info(self, dataset_key: str, refresh: bool) -> Dict[str, Any]:
+        """파일 트리 정보를 가져와 메모리 캐시에 저장 (get_dataset_info의 병합된 요청)"""
+        info_cache = self.client.info_cache
+        url = f"{self.endpoints['filetree']}/{dataset_key}.do"
+        body = await self._cached_get(url, refresh=refresh)
+        dataset_info = self.client._parse_body(body)
+        if info_cache is not None:
+            info_cache.put(dataset_key, dataset_info, approximate_size(dataset_info))
+        return dataset_info
+    
+    async def _single_flight(self, key: Any, func: Callable[..., Awaitable[Any]], *args) -> Any:
+        """
+        같은 키의 동시 호출을 하나의 작업으로 합쳐 실행
+        
+        Args:
+            key: 호출 키
+            func: 실행할 코루틴 함수
+            *args: 함수 인자
+        
+        Returns:
+            작업 결과 (먼저 호출한 쪽이 시작한 작업의 결과를 공유)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 호출자가 취소되어도 같은 작업을 기다리는 다른 호출자는 계속 대기
+        return await asyncio.shield(task)
+    
+    async def get_api_manual(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        API 매뉴얼 정보 조회
+        
+        Args:
+            refresh: True면 캐시를 서버에 재검증
+        
+        Returns:
+            API 매뉴얼 정보
+        """
+        return self.client._parse_body(await self._cached_get(self.endpoints['manual'], refresh=refresh))
+    
+    async def download_dataset(
+        self,
+        dataset_key: str,
+        file_keys: Optional[Union[str, List[str]]] = None,
+        output_path: Optional[str] = None,
+        extract: bool = True,
+        show_progress: bool = True,
+        segments: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """
+        데이터셋 다운로드
+        
+        서버가 Accept-Ranges를 지원하면 여러 바이트 구간을 동시에 받고, 지원하지 않으면
+        단일 스트림으로 받습니다. 파일 기록과 압축 해제는 작업자 스레드에서 실행되어
+        이벤트 루프를 막지 않습니다. 이어받기와 스트리밍 압축 해제는 AIHubClient를 사용하세요.
+        
+        Args:
+            dataset_key: 데이터셋 키
+            file_keys: 다운로드할 파일 키들 (None이면 전체 다운로드)
+            output_path: 다운로드 경로
+            extract: tar 파일 자동 압축 해제 여부
+            show_progress: 진행 상황 표시 여부
+            segments: 병렬 분할 다운로드 구간 수 (None이면 클라이언트 기본값)
+            progress_callback: 진행량이 바뀔 때마다 (받은 바이트, 전체 바이트)로 호출할 함수
+            cancel_event: 설정되면 다운로드를 중단하는 이벤트
+        
+        Returns:
+            다운로드 결과 정보
+        """
+        loop = asyncio.get_running_loop()
+        if output_path is None:
+            output_path = self.default_download_path
+        output_dir = Path(output_path)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        if file_keys is None:
+            file_sn = "all"
+        elif isinstance(file_keys, list):
+            file_sn = ",".join(map(str, file_keys))
+        else:
+            file_sn = str(file_keys)
+        
+        download_url = f"{self.endpoints['download']}/{dataset_key}.do"
+        params = {'fileSn': file_sn}
+        
+        import tempfile
+        
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.tar') as temp_file:
+            temp_path = temp_file.name
+        
+        try:
+            response = await self._make_request('GET', download_url, params=params)
+            total_size = int(response.headers.get('content-length', 0))
+            
+            progress_bar = None
+            if show_progress and total_size > 0:
+                from tqdm import tqdm
+                
+                progress_bar = tqdm(
+                    total=total_size,
+                    unit='B',
+                    unit_scale=True,
+                    desc=f"Downloading {dataset_key}"
+                )
+            progress = _DownloadProgress(total_size, progress_bar, progress_callback, cancel_event)
+            
+            segment_count = self.client._plan_segments(response, total_size, segments)
+            if segment_count > 1:
+                response.release()
+                await loop.run_in_executor(None, self._preallocate_file, temp_path, total_size)
+                downloaded_size = await self._download_ranges(
+                    download_url, params, temp_path,
+                    self.client._split_ranges(0, total_size, segment_count), progress
+                )
+            else:
+                downloaded_size = await self._write_body(response, temp_path, 0, progress, mode='wb')
+            
+            if progress_bar:
+                progress_bar.close()
+            progress.check()
+            
+            if extract:
+                self.logger.info("압축 파일을 해제하는 중...")
+                extracted_files = await loop.run_in_executor(
+                    None, self.client._extract_and_merge, temp_path, output_dir
+                )
+            else:
+                final_path = output_dir / f"{dataset_key}.tar"
+                Path(temp_path).replace(final_path)
+                extracted_files = [str(final_path)]
+            
+            return {
+                'success': True,
+                'dataset_key': dataset_key,
+                'file_keys': file_sn,
+                'downloaded_size': downloaded_size,
+                'resumed_size': 0,
+                'output_path': str(output_dir),
+                'extracted_files': extracted_files,
+                'message': f"데이터셋 '{dataset_key}' 다운로드 완료"
+            }
+        
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise AIHubAPIError(f"다운로드 실패: {str(e)}")
+        finally:
+            if Path(temp_path).exists():
+                Path(temp_path).unlink()
+    
+    @staticmethod
+    def _preallocate_file(path: str, size: int):
+        """다운로드 파일을 전체 크기로 미리 할당"""
+        with open(path, 'wb') as f:
+            _preallocate(f, size)
+    
+    async def _download_ranges(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        path: str,
+        ranges: List[Tuple[int, int]],
+        progress: _DownloadProgress
+    ) -> int:
+        """
+        HTTP Range 요청으로 여러 구간을 동시에 받아 미리 할당한 파일에 기록
+        
+        Args:
+            url: 다운로드 URL
+            params: URL 파라미터
+            path: 저장할 파일 경로 (미리 할당되어 있어야 함)
+            ranges: 받을 (시작, 끝) 구간 목록 - 끝 오프셋 포함
+            progress: 진행 상황 집계기
+        
+        Returns:
+            다운로드한 바이트 수
+        """
+        self.logger.info(f"Downloading {sum(end - start + 1 for start, end in ranges)} bytes in {len(ranges)} segments")
+        tasks = [
+            asyncio.ensure_future(self._download_range(url, params, path, start, end, progress))
+            for start, end in ranges
+        ]
+        try:
+            return sum(await asyncio.gather(*tasks))
+        except BaseException:
+            # 한 구간이라도 실패하면 나머지 구간도 중단
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    
+    async def _download_range(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        path: str,
+        start: int,
+        end: int,
+        progress: _DownloadProgress
+    ) -> int:
+        """
+        단일 바이트 구간 다운로드
+        
+        Args:
+            url: 다운로드 URL
+            params: URL 파라미터
+            path: 저장할 파일 경로 (미리 할당되어 있어야 함)
+            start: 시작 오프셋 (포함)
+            end: 끝 오프셋 (포함)
+            progress: 진행 상황 집계기
+        
+        Returns:
+            다운로드한 바이트 수
+        """
+        policy = self.client._retry_policy(url)
+        received = 0
+        attempt = 0
+        while True:
+            attempt += 1
+            # 본문을 받다가 연결이 끊기면 받은 위치부터 다시 요청
+            headers = {'Range': f'bytes={start + received}-{end}'}
+            response = await self._make_request('GET', url, params=params, headers=headers)
+            if response.status != 206:
+                response.release()
+                raise AIHubAPIError("서버가 구간 응답(206)을 반환하지 않았습니다.")
+            try:
+                received += await self._write_body(response, path, start + received, progress, mode='r+b')
+                break
+            except _BodyInterrupted as e:
+                received += e.received
+                delay = self.client._retry_delay(policy, 'GET', attempt)
+                if delay is None:
+                    raise AIHubAPIError(f"구간 다운로드 중단 (bytes={start}-{end}): {e}")
+                self.logger.warning(
+                    f"Segment bytes={start}-{end} interrupted at {received} bytes; "
+                    f"retrying in {delay:.1f}s (attempt {attempt}/{policy.max_attempts})"
+                )
+                await asyncio.sleep(delay)
+        
+        expected = end - start + 1
+        if received != expected:
+            raise AIHubAPIError(f"구간 다운로드 크기 불일치 (bytes={start}-{end}): {received}/{expected}")
+        return received
+    
+    async def _write_body(
+        self,
+        response: 'aiohttp.ClientResponse',
+        path: str,
+        offset: int,
+        progress: _DownloadProgress,
+        mode: str
+    ) -> int:
+        """
+        응답 본문을 스트리밍으로 읽어 파일의 offset 위치부터 기록
+        작은 청크마다 스레드로 넘기지 않도록 MERGE_BUFFER_SIZE만큼 모아서 기록
+        
+        Args:
+            response: 스트리밍 응답
+            path: 저장할 파일 경로
+            offset: 기록을 시작할 위치
+            progress: 진행 상황 집계기
+            mode: 파일 열기 모드 ('wb' 또는 'r+b')
+        
+        Returns:
+            받은 바이트 수
+        
+        Raises:
+            _BodyInterrupted: 본문을 받다가 연결이 끊기거나 시간이 초과된 경우 (받은 만큼은 기록됨)
+        """
+        loop = asyncio.get_running_loop()
+        file_obj = await loop.run_in_executor(None, open, path, mode)
+        received = 0
+        buffer = bytearray()
+        try:
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                progress.check()
+                buffer += chunk
+                received += len(chunk)
+                progress.update(len(chunk))
+                if len(buffer) >= MERGE_BUFFER_SIZE:
+                    await loop.run_in_executor(None, _write_at, file_obj, offset, bytes(buffer))
+                    offset += len(buffer)
+                    buffer.clear()
+            if buffer:
+                await loop.run_in_executor(None, _write_at, file_obj, offset, bytes(buffer))
+            return received
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            # 받은 만큼은 기록해 두어 호출한 쪽이 그 위치부터 다시 받을 수 있게 함
+            if buffer:
+                await loop.run_in_executor(None, _write_at, file_obj, offset, bytes(buffer))
+            if isinstance(e, asyncio.TimeoutError):
+                raise _BodyInterrupted(f"요청 시간 초과 ({self.timeout}초)", received) from e
+            raise _BodyInterrupted(f"요청 오류: {str(e)}", received) from e
+        finally:
+            response.release()
+            await loop.run_in_executor(None, file_obj.close)
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+AI-Hub 메타데이터 캐시
+데이터셋 목록, 파일 트리, API 매뉴얼 응답을 디스크(sqlite)에 저장하여
+여러 프로세스가 함께 사용하는 캐시 계층과, 그 앞단의 메모리 LRU 캐시 및 요청 병합기
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def default_cache_dir() -> Path:
+    """
+    기본 캐시 디렉토리 경로
+    
+    Returns:
+        AIHUB_CACHE_DIR 환경변수 또는 ~/.cache/aihub
+    """
+    cache_dir = os.getenv('AIHUB_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir)
+    return Path(os.getenv('XDG_CACHE_HOME', Path.home() / '.cache')) / 'aihub'
+
+
+class MetadataCache:
+    """
+    sqlite 기반 메타데이터 캐시
+    응답 본문과 ETag/Last-Modified를 저장하고, TTL이 지나면 조건부 요청으로 재검증
+    """
+    
+    def __init__(self, path: Path, ttl: float):
+        """
+        메타데이터 캐시 초기화
+        
+        Args:
+            path: sqlite 파일 경로
+            ttl: 재검증 없이 캐시를 사용할 시간 (초)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.logger = logging.getLogger(__name__)
+        self._local = threading.local()
+        # 모든 스레드의 연결 (close()에서 함께 닫음) 및 연결 세대 (close() 이후 스레드별 연결을 다시 엶)
+        self._connections: List[sqlite3.Connection] = []
+        self._generation = 0
+        self._connections_lock = threading.Lock()
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+    
+    @staticmethod
+    def make_key(api_key: str, url: str) -> str:
+        """
+        캐시 키 생성 (API 키별로 분리)
+        
+        Args:
+            api_key: AI-Hub API 키
+            url: 요청 URL
+        
+        Returns:
+            캐시 키
+        """
+        return hashlib.sha256(f"{api_key}\0{url}".encode('utf-8')).hexdigest()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 sqlite 연결 반환"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._generation:
+            # 연결은 만든 스레드에서만 사용하지만, close()가 다른 스레드에서 닫을 수 있도록 허용
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            # 여러 프로세스가 동시에 읽고 쓸 수 있도록 WAL 모드 사용
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            with self._connections_lock:
+                self._connections.append(conn)
+                self._local.generation = self._generation
+            self._local.conn = conn
+        return conn
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 조회
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            캐시 항목 (body, etag, last_modified, fetched_at, fresh) 또는 None
+        """
+        try:
+            row = self._connection().execute(
+                'SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Metadata cache read failed: {e}")
+            return None
+        
+        if row is None:
+            return None
+        body, etag, last_modified, fetched_at = row
+        return {
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at,
+            'fresh': time.time() - fetched_at < self.ttl
+        }
+    
+    def put(
+        self,
+        key: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """
+        캐시 항목 저장
+        
+        Args:
+            key: 캐시 키
+            body: 응답 본문
+            etag: 응답 ETag
+            last_modified: 응답 Last-Modified
+        """
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, body, etag, last_modified, fetched_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key, body, etag, last_modified, time.time())
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Metadata cache write failed: {e}")
+    
+    def touch(self, key: str):
+        """
+        재검증에 성공한 항목의 조회 시각 갱신
+        
+        Args:
+            key: 캐시 키
+        """
+        try:
+            with self._connection() as conn:
+                conn.execute('UPDATE responses SET fetched_at = ? WHERE key = ?', (time.time(), key))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Metadata cache write failed: {e}")
+    
+    def delete(self, key: str):
+        """
+        캐시 항목 삭제
+        
+        Args:
+            key: 캐시 키
+        """
+        try:
+            with self._connection() as conn:
+                conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Metadata cache write failed: {e}")
+    
+    def clear(self):
+        """전체 캐시 삭제"""
+        try:
+            with self._connection() as conn:
+                conn.execute('DELETE FROM responses')
+        except sqlite3.Error as e:
+            self.logger.warning(f"Metadata cache write failed: {e}")
+    
+    def close(self):
+        """모든 스레드의 sqlite 연결 종료 (이후 다시 사용하면 스레드별로 새 연결을 엶)"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Metadata cache close failed: {e}")
+        self._local.conn = None
+
+
+def approximate_size(value: Any) -> int:
+    """
+    파싱한 JSON 값의 대략적인 메모리 크기 (SizedLRUCache 항목 크기용)
+    dict/list 등 컨테이너와 그 안의 값을 모두 합산하며, 같은 객체는 한 번만 셈
+    
+    Args:
+        value: 파싱 결과 (dict, list, str, 숫자 등)
+    
+    Returns:
+        크기 (바이트)
+    """
+    total = 0
+    seen = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return total
+
+
+class SizedLRUCache:
+    """
+    바이트 크기 기준으로 항목을 제거하는 메모리 LRU 캐시 (스레드 안전)
+    항목 수가 아니라 항목별 대략적인 크기의 합이 max_bytes를 넘지 않도록 유지
+    """
+    
+    def __init__(self, max_bytes: int, ttl: Optional[float] = None):
+        """
+        메모리 캐시 초기화
+        
+        Args:
+            max_bytes: 최대 크기 (바이트)
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries: 'OrderedDict[Any, Tuple[Any, int, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        항목 조회 (조회한 항목은 가장 최근 사용으로 이동)
+        
+        Args:
+            key: 캐시 키
+            
+        Returns:
+            캐시된 값 (없거나 만료되었으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[2] >= self.ttl:
+                self._remove_locked(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key: Any, value: Any, size: int):
+        """
+        항목 저장 (최대 크기를 넘으면 오래된 항목부터 제거)
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            size: 값의 대략적인 크기 (바이트)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, time.monotonic())
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+                self.evictions += 1
+    
+    def invalidate(self, key: Any = None):
+        """
+        항목 무효화
+        
+        Args:
+            key: 무효화할 키 (None이면 전체)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.current_bytes = 0
+            elif key in self._entries:
+                self._remove_locked(key)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+        
+        Returns:
+            적중/실패 횟수, 항목 수, 사용 중인 크기 등
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes
+            }
+    
+    def _remove_locked(self, key: Any):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합치는 요청 병합기 (스레드 안전)
+    먼저 호출한 스레드만 함수를 실행하고, 실행 중에 같은 키로 들어온 호출은
+    새로 요청하지 않고 그 결과(또는 예외)를 함께 받음
+    """
+    
+    def __init__(self):
+        """요청 병합기 초기화"""
+        self.calls = 0
+        self.coalesced = 0
+        self._flights: Dict[Any, Future] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Any, func: Callable[..., Any], *args) -> Any:
+        """
+        키별로 한 번만 함수 실행
+        
+        Args:
+            key: 호출 키 (같은 키의 동시 호출을 합침)
+            func: 실행할 함수
+            *args: 함수 인자
+            
+        Returns:
+            함수 실행 결과 (먼저 호출한 스레드의 결과를 공유)
+        """
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.result()
+        
+        try:
+            result = func(*args)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        병합 통계
+        
+        Returns:
+            전체 호출 수, 다른 호출의 결과를 공유한 호출 수, 실행 중인 키 수
+        """
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._flights)
+            }
@@ -5,18 +5,34 @@ AI-Hub API Client
 MCP(Model Context Protocol) 지원을 고려한 구조
 """
 
+import errno
+import hashlib
 import json
 import os
-import tarfile
-import tempfile
+import re
+import shutil
+import sqlite3
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Any, Tuple, Union
 import logging
 import time
 
-import requests
-from dotenv import load_dotenv
-from tqdm import tqdm
+import aihub_codec
+from aihub_cache import MetadataCache, SingleFlight, SizedLRUCache, approximate_size, default_cache_dir
+from aihub_filetree import DatasetFileTree
+from aihub_ratelimit import TokenBucket, create_rate_limiter, shared_name
+from aihub_retry import RetryBudget, RetryPolicy
+from aihub_search import DatasetSearchIndex, catalog_digest, parse_catalog
+
+# requests, tqdm, tarfile, tempfile, dotenv는 시작 시간을 줄이기 위해 처음 필요할 때 import
+# (MCP 서버는 initialize/tools/list에 응답할 때까지 HTTP 모듈이 필요 없음)
+if TYPE_CHECKING:
+    import tarfile
+    
+    import requests
 
 
 class AIHubAPIError(Exception):
@@ -29,6 +45,498 @@ class AIHubAuthError(AIHubAPIError):
     pass
 
 
+# 다운로드 스트림 읽기 단위 (바이트)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 이 크기보다 작은 구간으로는 분할 다운로드하지 않음
+MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+
+# zero-copy 복사를 지원하지 않을 때 사용하는 병합 버퍼 크기 (바이트)
+MERGE_BUFFER_SIZE = 1024 * 1024
+
+# 여러 데이터셋 정보를 한 번에 조회할 때 동시에 보낼 기본 요청 수
+INFO_FETCH_WORKERS = 8
+
+# TCP keep-alive 설정 (초): 유휴 연결이 NAT/방화벽에서 조용히 끊기지 않도록 주기적으로 확인
+TCP_KEEPALIVE_IDLE = 60
+TCP_KEEPALIVE_INTERVAL = 20
+TCP_KEEPALIVE_COUNT = 3
+
+# 메모리 캐시에서 데이터셋 목록을 보관하는 키
+_DATASETS_CACHE_KEY = ('datasets',)
+
+# tar 멤버 중 분할 파일 이름 형식 (예: data.zip.part3)
+_PART_NAME_PATTERN = re.compile(r'^(?P<base>.+)\.part(?P<number>\d+)$')
+
+# 순서가 맞지 않게 도착한 분할 파일을 임시로 보관하는 디렉토리 이름 접두사
+SPILL_DIR_NAME = '.aihub_spill'
+
+# zero-copy 시스템 콜이 이 오류를 내면 다음 복사 방식으로 전환
+_ZERO_COPY_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF,
+    errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTSOCK
+}
+
+
+def _preallocate(file_obj, size: int):
+    """
+    파일 공간 미리 할당 (posix_fallocate를 지원하지 않으면 truncate 사용)
+    
+    Args:
+        file_obj: 쓰기 모드로 열린 파일 객체
+        size: 할당할 크기 (바이트)
+    """
+    if size <= 0:
+        return
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(file_obj.fileno(), 0, size)
+            return
+        except OSError:
+            pass
+    file_obj.truncate(size)
+
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> int:
+    """
+    src_fd의 처음부터 size 바이트를 dst_fd의 현재 위치에 복사
+    os.copy_file_range -> os.sendfile -> 고정 크기 버퍼 순으로 시도하므로
+    파일 크기와 관계없이 메모리 사용량이 일정함
+    
+    Args:
+        src_fd: 원본 파일 디스크립터 (위치 0)
+        dst_fd: 대상 파일 디스크립터
+        size: 복사할 크기 (바이트)
+        
+    Returns:
+        복사한 바이트 수
+    """
+    copied = 0
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while copied < size:
+                count = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if count == 0:
+                    return copied
+                copied += count
+            return copied
+        except OSError as e:
+            if e.errno not in _ZERO_COPY_FALLBACK_ERRNOS:
+                raise
+    
+    if hasattr(os, 'sendfile'):
+        try:
+            while copied < size:
+                count = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                if count == 0:
+                    return copied
+                copied += count
+            return copied
+        except OSError as e:
+            if e.errno not in _ZERO_COPY_FALLBACK_ERRNOS:
+                raise
+    
+    # 고정 크기 버퍼로 복사
+    os.lseek(src_fd, copied, os.SEEK_SET)
+    while copied < size:
+        chunk = os.read(src_fd, min(MERGE_BUFFER_SIZE, size - copied))
+        if not chunk:
+            break
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view):]
+        copied += len(chunk)
+    return copied
+
+
+def _socket_options(tcp_nodelay: bool, keep_alive: bool) -> List[Tuple[int, int, int]]:
+    """
+    연결 풀 소켓 옵션 생성
+    
+    Args:
+        tcp_nodelay: Nagle 알고리즘 비활성화 여부
+        keep_alive: TCP keep-alive 사용 여부
+    
+    Returns:
+        urllib3 socket_options 목록
+    """
+    import socket
+    
+    options = []
+    if tcp_nodelay:
+        options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+    if keep_alive:
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # 플랫폼에 따라 세부 설정이 없을 수 있음 (예: macOS의 TCP_KEEPIDLE)
+        for name, value in (
+            ('TCP_KEEPIDLE', TCP_KEEPALIVE_IDLE),
+            ('TCP_KEEPINTVL', TCP_KEEPALIVE_INTERVAL),
+            ('TCP_KEEPCNT', TCP_KEEPALIVE_COUNT)
+        ):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class _DownloadProgress:
+    """
+    다운로드 진행 상황 집계기
+    여러 구간(segment) 스레드의 진행량을 하나의 tqdm 진행 표시기로 합침
+    """
+    
+    def __init__(
+        self,
+        total: int,
+        progress_bar=None,
+        callback: Optional[Callable[[int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ):
+        """
+        Args:
+            total: 전체 크기 (바이트, 모르면 0)
+            progress_bar: tqdm 진행 표시기
+            callback: 진행량이 바뀔 때마다 (받은 바이트, 전체 바이트)로 호출할 함수
+            cancel_event: 외부에서 다운로드를 취소할 때 설정하는 이벤트
+        """
+        self.total = total
+        self.done = 0
+        self.progress_bar = progress_bar
+        self.callback = callback
+        self.cancel_event = cancel_event
+        self.stop_event = threading.Event()
+        self._lock = threading.Lock()
+    
+    def update(self, size: int):
+        """진행량 추가"""
+        with self._lock:
+            self.done += size
+            if self.progress_bar:
+                self.progress_bar.update(size)
+            if self.callback:
+                self.callback(self.done, self.total)
+    
+    def check(self):
+        """
+        중단 또는 취소 요청 확인
+        
+        Raises:
+            AIHubAPIError: 다른 구간이 실패했거나 다운로드가 취소되었을 때
+        """
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise AIHubAPIError("다운로드가 취소되었습니다.")
+        if self.stop_event.is_set():
+            raise AIHubAPIError("다운로드가 중단되었습니다.")
+
+
+class _ProgressReader:
+    """
+    HTTP 응답 본문을 읽기 전용 파일 객체로 감싸는 래퍼
+    읽은 바이트를 진행 상황에 반영하여 tarfile 스트림 모드에 그대로 전달
+    """
+    
+    def __init__(self, raw, progress: _DownloadProgress):
+        """
+        Args:
+            raw: urllib3 응답 객체 (response.raw)
+            progress: 진행 상황 집계기
+        """
+        self.raw = raw
+        self.progress = progress
+        self.bytes_read = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        """최대 size 바이트 읽기"""
+        self.progress.check()
+        data = self.raw.read(None if size is None or size < 0 else size)
+        if data:
+            self.bytes_read += len(data)
+            self.progress.update(len(data))
+        return data
+
+
+def _relative_member_path(name: str) -> Path:
+    """tar 멤버 이름에서 앞의 '/'와 드라이브를 제거한 상대 경로 (data 필터와 같은 규칙)"""
+    path = Path(name)
+    if path.anchor:
+        path = Path(*path.parts[1:])
+    return path
+
+
+class _PartAssembler:
+    """
+    tar 압축 해제 중 분할 파일(.partN)을 받는 즉시 최종 파일에 이어 붙이는 조립기
+    순서대로 도착한 조각은 바로 이어 붙이고, 순서가 어긋난 조각만 임시 디렉토리에
+    보관했다가 앞 조각이 도착하면 이어 붙임
+    """
+    
+    # 최종 파일을 조립하는 동안 사용하는 임시 파일 접미사
+    ASSEMBLING_SUFFIX = '.aihub_assembling'
+    
+    def __init__(self, output_dir: Path, merge_files, logger: logging.Logger):
+        """
+        Args:
+            output_dir: 출력 디렉토리
+            merge_files: 남은 조각을 병합할 함수 (parts, output_file) -> int
+            logger: 로거
+        """
+        self.output_dir = output_dir
+        # 같은 출력 디렉토리에서 동시에 압축 해제하는 작업끼리 겹치지 않도록 조립기마다 따로 생성
+        self.spill_dir: Optional[Path] = None
+        self.merge_files = merge_files
+        self.logger = logger
+        self.groups: Dict[Path, Dict[str, Any]] = {}
+        self._spill_count = 0
+    
+    def _member_path(self, member: 'tarfile.TarInfo') -> Path:
+        """
+        분할 파일 멤버의 출력 디렉토리 기준 경로
+        분할 파일은 tarfile 압축 해제를 거치지 않으므로 일반 멤버의 data 필터와 같은 규칙을
+        직접 적용 (앞의 '/'와 드라이브는 제거하고, 출력 디렉토리를 벗어나면 거부)
+        
+        Args:
+            member: 분할 파일 멤버
+            
+        Returns:
+            출력 디렉토리 기준 상대 경로
+            
+        Raises:
+            ValueError: 출력 디렉토리를 벗어나는 경우
+        """
+        import tarfile
+        
+        name = member.name
+        if hasattr(tarfile, 'data_filter'):
+            try:
+                name = tarfile.data_filter(member, str(self.output_dir)).name
+            except tarfile.FilterError as e:
+                raise ValueError(f"허용되지 않는 tar 멤버 경로: {member.name} ({e})") from e
+        
+        relative_path = _relative_member_path(name)
+        output_root = self.output_dir.resolve()
+        if output_root not in (output_root / relative_path).resolve().parents:
+            raise ValueError(f"출력 디렉토리를 벗어나는 tar 멤버 경로: {member.name}")
+        return relative_path
+    
+    def add(self, tar: 'tarfile.TarFile', member: 'tarfile.TarInfo') -> bool:
+        """
+        tar 멤버가 분할 파일이면 조립기로 처리
+        
+        Args:
+            tar: 읽고 있는 tar 파일
+            member: 현재 멤버
+            
+        Returns:
+            분할 파일로 처리했는지 여부 (False면 일반 압축 해제 대상)
+        """
+        if not member.isfile():
+            return False
+        match = _PART_NAME_PATTERN.match(Path(member.name).name)
+        if not match:
+            return False
+        member_path = self._member_path(member)
+        
+        number = int(match.group('number'))
+        final_path = self.output_dir / member_path.parent / match.group('base')
+        group = self.groups.get(final_path)
+        if group is None:
+            group = {
+                'next': None,
+                'start': None,
+                'spilled': {},
+                'member_names': [],
+                'assembly_path': final_path.with_name(final_path.name + self.ASSEMBLING_SUFFIX)
+            }
+            self.groups[final_path] = group
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+        group['member_names'].append(str(member_path))
+        
+        # 첫 조각(0 또는 1)이 도착하면 조립 시작
+        if group['start'] is None and number <= 1:
+            group['start'] = group['next'] = number
+            open(group['assembly_path'], 'wb').close()
+        
+        source = tar.extractfile(member)
+        if group['next'] is not None and number == group['next']:
+            with open(group['assembly_path'], 'ab') as outf:
+                shutil.copyfileobj(source, outf, MERGE_BUFFER_SIZE)
+                group['next'] += 1
+                # 보관해 둔 다음 조각들을 이어 붙임
+                while group['next'] in group['spilled']:
+                    spill_path = group['spilled'].pop(group['next'])
+                    with open(spill_path, 'rb') as inf:
+                        shutil.copyfileobj(inf, outf, MERGE_BUFFER_SIZE)
+                    spill_path.unlink()
+                    group['next'] += 1
+        else:
+            if self.spill_dir is None:
+                import tempfile
+                
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                self.spill_dir = Path(tempfile.mkdtemp(dir=self.output_dir, prefix=SPILL_DIR_NAME + '-'))
+            self._spill_count += 1
+            spill_path = self.spill_dir / f"{self._spill_count}.spill"
+            with open(spill_path, 'wb') as outf:
+                shutil.copyfileobj(source, outf, MERGE_BUFFER_SIZE)
+            group['spilled'][number] = spill_path
+        return True
+    
+    def finish(self) -> List[str]:
+        """
+        남은 조각을 정리하여 최종 파일 완성
+        
+        Returns:
+            완성된 파일 경로 목록
+        """
+        completed = []
+        for final_path, group in self.groups.items():
+            pieces = sorted(group['spilled'].items())
+            if group['start'] is not None:
+                pieces.append((group['start'], group['assembly_path']))
+                pieces.sort()
+            
+            if len(group['member_names']) == 1:
+                # 조각이 하나뿐이면 병합하지 않고 원래 이름으로 둠
+                target = self.output_dir / group['member_names'][0]
+                pieces[0][1].replace(target)
+                completed.append(str(target))
+                continue
+            
+            if len(pieces) == 1 and group['start'] is not None:
+                group['assembly_path'].replace(final_path)
+            else:
+                # 중간 조각이 빠졌거나 첫 조각이 늦게 도착한 경우 남은 조각을 한 번에 병합
+                self.logger.info(f"Merging {final_path.name} in {final_path.parent}")
+                paths = [path for _, path in pieces]
+                self.merge_files(paths, final_path)
+                for path in paths:
+                    path.unlink()
+            completed.append(str(final_path))
+        
+        self.cleanup()
+        return completed
+    
+    def cleanup(self):
+        """임시 조립 파일과 보관 디렉토리 삭제"""
+        for group in self.groups.values():
+            if group['assembly_path'].exists():
+                group['assembly_path'].unlink()
+        if self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+            self.spill_dir = None
+
+
+class _DownloadJournal:
+    """
+    이어받기(resume)용 다운로드 저널
+    부분 파일 옆에 JSON으로 저장되며 URL, fileSn, ETag/Last-Modified와
+    완료된 바이트 구간 목록을 기록
+    """
+    
+    # 저널 파일 저장 최소 간격 (초)
+    SAVE_INTERVAL = 1.0
+    
+    def __init__(self, path: Path, meta: Dict[str, Any], ranges: Optional[List[List[int]]] = None):
+        """
+        Args:
+            path: 저널 파일 경로
+            meta: 다운로드 식별 정보 (url, file_sn, total_size, etag, last_modified)
+            ranges: 완료된 구간 목록 ([시작, 끝) 형식, 끝 미포함)
+        """
+        self.path = Path(path)
+        self.meta = meta
+        self.ranges = ranges or []
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+    
+    @classmethod
+    def load(cls, path: Path, meta: Dict[str, Any]) -> Optional['_DownloadJournal']:
+        """
+        기존 저널 로드
+        
+        Args:
+            path: 저널 파일 경로
+            meta: 현재 다운로드 식별 정보
+            
+        Returns:
+            식별 정보가 일치하는 저널 (없거나 서버 파일이 바뀌었으면 None)
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if data.get('meta') != meta:
+            return None
+        ranges = [[int(start), int(end)] for start, end in data.get('ranges', [])]
+        return cls(path, meta, ranges)
+    
+    def add(self, start: int, length: int):
+        """
+        완료된 구간 추가 (인접 구간은 병합)
+        
+        Args:
+            start: 시작 오프셋
+            length: 길이 (바이트)
+        """
+        with self._lock:
+            end = start + length
+            merged = []
+            for r_start, r_end in self.ranges:
+                if r_end < start or r_start > end:
+                    merged.append([r_start, r_end])
+                else:
+                    start, end = min(start, r_start), max(end, r_end)
+            merged.append([start, end])
+            merged.sort()
+            self.ranges = merged
+            
+            if time.monotonic() - self._last_save >= self.SAVE_INTERVAL:
+                self._save_locked()
+    
+    def completed_bytes(self) -> int:
+        """완료된 바이트 수"""
+        with self._lock:
+            return sum(end - start for start, end in self.ranges)
+    
+    def missing(self) -> List[Tuple[int, int]]:
+        """
+        아직 받지 않은 구간 목록
+        
+        Returns:
+            (시작, 끝) 목록 - 끝 오프셋 포함
+        """
+        with self._lock:
+            gaps = []
+            offset = 0
+            for start, end in self.ranges:
+                if start > offset:
+                    gaps.append((offset, start - 1))
+                offset = max(offset, end)
+            total = self.meta['total_size']
+            if offset < total:
+                gaps.append((offset, total - 1))
+            return gaps
+    
+    def save(self):
+        """저널 파일 저장"""
+        with self._lock:
+            self._save_locked()
+    
+    def _save_locked(self):
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'meta': self.meta, 'ranges': self.ranges}, f)
+        os.replace(tmp_path, self.path)
+        self._last_save = time.monotonic()
+    
+    def remove(self):
+        """저널 파일 삭제"""
+        if self.path.exists():
+            self.path.unlink()
+
+
 class AIHubClient:
     """
     AI-Hub API 클라이언트
@@ -40,7 +548,21 @@ class AIHubClient:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: int = 300,
-        default_download_path: Optional[str] = None
+        default_download_path: Optional[str] = None,
+        download_segments: Optional[int] = None,
+        resume_downloads: Optional[bool] = None,
+        stream_extract: Optional[bool] = None,
+        merge_workers: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        cache_dir: Optional[str] = None,
+        memory_cache_bytes: Optional[int] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        keep_alive: Optional[bool] = None,
+        tcp_nodelay: Optional[bool] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        rate_limiters: Optional[Dict[str, Optional[TokenBucket]]] = None
     ):
         """
         AI-Hub API 클라이언트 초기화
@@ -50,8 +572,24 @@ class AIHubClient:
             base_url: API 기본 URL (기본값: https://api.aihub.or.kr)
             timeout: 요청 타임아웃 (초)
             default_download_path: 기본 다운로드 경로
+            download_segments: 병렬 분할 다운로드 구간 수 (1이면 단일 스트림)
+            resume_downloads: 실패한 다운로드를 다음 호출에서 이어받을지 여부
+            stream_extract: tar 파일을 디스크에 저장하지 않고 받는 즉시 압축 해제할지 여부
+            merge_workers: 분할 파일 그룹을 동시에 병합할 작업자 수
+            cache_ttl: 메타데이터 캐시를 재검증 없이 사용할 시간 (초, 0이면 캐시 사용 안 함)
+            cache_dir: 메타데이터 캐시 디렉토리 (여러 프로세스가 공유)
+            memory_cache_bytes: 파일 트리 메모리 캐시 최대 크기 (바이트, 0이면 사용 안 함)
+            pool_connections: 연결 풀을 유지할 호스트 수
+            pool_maxsize: 호스트별로 재사용할 최대 연결 수 (동시 요청 수 이상으로 설정)
+            keep_alive: 유휴 연결에 TCP keep-alive 사용 여부
+            tcp_nodelay: TCP_NODELAY(Nagle 알고리즘 비활성화) 사용 여부
+            retry_policies: 엔드포인트별 재시도 정책 ('default' 또는 endpoints의 키 -
+                예: 'download', 'filetree')
+            retry_budget: 재시도 예산 (None이면 환경변수 AIHUB_RETRY_BUDGET 비율로 생성)
+            rate_limiters: 요청 종류별 토큰 버킷 ('metadata', 'download' - None이면 제한 없음)
         """
         # 환경변수 로드
+        from dotenv import load_dotenv
         load_dotenv()
         
         # API 설정
@@ -59,20 +597,87 @@ class AIHubClient:
         self.base_url = base_url or os.getenv('AIHUB_API_BASE_URL', 'https://api.aihub.or.kr')
         self.timeout = timeout or int(os.getenv('AIHUB_DOWNLOAD_TIMEOUT', '300'))
         self.default_download_path = default_download_path or os.getenv('AIHUB_DEFAULT_DOWNLOAD_PATH', './downloads')
+        self.download_segments = max(1, download_segments or int(os.getenv('AIHUB_DOWNLOAD_SEGMENTS', '4')))
+        if resume_downloads is None:
+            resume_downloads = os.getenv('AIHUB_DOWNLOAD_RESUME', 'false').lower() in ('1', 'true', 'yes')
+        self.resume_downloads = resume_downloads
+        if stream_extract is None:
+            stream_extract = os.getenv('AIHUB_STREAM_EXTRACT', 'false').lower() in ('1', 'true', 'yes')
+        self.stream_extract = stream_extract
+        self.merge_workers = max(1, merge_workers or int(os.getenv('AIHUB_MERGE_WORKERS', '4')))
         
         if not self.api_key:
             raise AIHubAuthError("API 키가 설정되지 않았습니다. 환경변수 AIHUB_API_KEY를 설정하거나 api_key 파라미터를 전달하세요.")
         
-        # HTTP 세션 설정
-        self.session = requests.Session()
-        self.session.headers.update({
-            'apikey': self.api_key,
-            'User-Agent': 'AIHub-Python-Client/1.0'
-        })
+        # 연결 풀 설정
+        self.pool_connections = max(1, pool_connections or int(os.getenv('AIHUB_POOL_CONNECTIONS', '4')))
+        self.pool_maxsize = max(1, pool_maxsize or int(os.getenv('AIHUB_POOL_MAXSIZE', '32')))
+        if keep_alive is None:
+            keep_alive = os.getenv('AIHUB_KEEP_ALIVE', 'true').lower() in ('1', 'true', 'yes')
+        self.keep_alive = keep_alive
+        if tcp_nodelay is None:
+            tcp_nodelay = os.getenv('AIHUB_TCP_NODELAY', 'true').lower() in ('1', 'true', 'yes')
+        self.tcp_nodelay = tcp_nodelay
+        
+        # 재시도 정책 설정 (다운로드는 대기 시간 상한을 길게)
+        max_attempts = int(os.getenv('AIHUB_RETRY_MAX_ATTEMPTS', '3'))
+        backoff_base = float(os.getenv('AIHUB_RETRY_BACKOFF', '0.5'))
+        self.retry_policies = {
+            'default': RetryPolicy(max_attempts=max_attempts, backoff_base=backoff_base),
+            'download': RetryPolicy(max_attempts=max_attempts, backoff_base=backoff_base, backoff_max=60.0)
+        }
+        self.retry_policies.update(retry_policies or {})
+        self.retry_budget = retry_budget or RetryBudget(ratio=float(os.getenv('AIHUB_RETRY_BUDGET', '0.2')))
+        
+        # HTTP 세션 (requests import를 미루기 위해 첫 요청 때 생성)
+        self._session: Optional['requests.Session'] = None
+        self._session_lock = threading.Lock()
         
         # 로깅 설정
         self.logger = logging.getLogger(__name__)
         
+        # 메타데이터 캐시 설정
+        if cache_ttl is None:
+            cache_ttl = float(os.getenv('AIHUB_CACHE_TTL', '3600'))
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache: Optional[MetadataCache] = None
+        if cache_ttl > 0:
+            try:
+                self.cache = MetadataCache(self.cache_dir / 'metadata.sqlite3', ttl=cache_ttl)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning(f"Metadata cache disabled: {e}")
+        
+        # 파일 트리 메모리 캐시 설정 (디스크 캐시 앞단)
+        if memory_cache_bytes is None:
+            memory_cache_bytes = int(float(os.getenv('AIHUB_MEMORY_CACHE_MB', '64')) * 1024 * 1024)
+        self.info_cache: Optional[SizedLRUCache] = None
+        if cache_ttl > 0 and memory_cache_bytes > 0:
+            self.info_cache = SizedLRUCache(memory_cache_bytes, ttl=cache_ttl)
+        
+        # 같은 메타데이터를 동시에 요청하면 한 번만 가져와 결과를 공유
+        self.inflight = SingleFlight()
+        
+        # 요청 속도 제한 (메타데이터/다운로드 예산 분리, 공유 시 같은 API 키의 모든 프로세스가 한 예산 사용)
+        shared = os.getenv('AIHUB_RATE_LIMIT_SHARED', 'false').lower() in ('1', 'true', 'yes')
+        self.rate_limiters: Dict[str, Optional[TokenBucket]] = {}
+        for category in ('metadata', 'download'):
+            rate = float(os.getenv(f'AIHUB_{category.upper()}_RATE', '0'))
+            burst = int(os.getenv(f'AIHUB_{category.upper()}_BURST', '0')) or None
+            shared_path = None
+            if shared:
+                shared_path = self.cache_dir / 'ratelimit' / f"{shared_name(category, self.api_key)}.bucket"
+            try:
+                self.rate_limiters[category] = create_rate_limiter(rate, burst, shared_path)
+            except OSError as e:
+                self.logger.warning(f"Shared rate limit disabled: {e}")
+                self.rate_limiters[category] = create_rate_limiter(rate, burst)
+        self.rate_limiters.update(rate_limiters or {})
+        
+        # 데이터셋 검색 색인 (처음 검색할 때 로드)
+        self._search_index: Optional[DatasetSearchIndex] = None
+        self._search_source: Optional[Dict[str, Any]] = None
+        self._search_lock = threading.Lock()
+        
         # API 엔드포인트
         self.endpoints = {
             'validate': f'{self.base_url}/api/keyValidate.do',
@@ -82,13 +687,85 @@ class AIHubClient:
             'download': f'{self.base_url}/down/0.5'
         }
     
+    @property
+    def session(self) -> 'requests.Session':
+        """HTTP 세션 (처음 사용할 때 생성)"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+    
+    def _create_session(self) -> 'requests.Session':
+        """
+        연결 풀이 설정된 HTTP 세션 생성
+        
+        Returns:
+            API 키 헤더와 연결 풀 어댑터가 설정된 세션
+        """
+        from aihub_http import create_session
+        
+        return create_session(
+            {
+                'apikey': self.api_key,
+                'User-Agent': 'AIHub-Python-Client/1.0'
+            },
+            _socket_options(self.tcp_nodelay, self.keep_alive),
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        HTTP 연결 풀 사용 통계
+        
+        Returns:
+            호스트별 생성한 연결 수, 처리한 요청 수, 재사용 대기 중인 연결 수
+        """
+        hosts = []
+        seen = set()
+        adapters = self._session.adapters.values() if self._session is not None else ()
+        for adapter in adapters:
+            manager = getattr(adapter, 'poolmanager', None)
+            if manager is None or id(manager) in seen:
+                continue
+            seen.add(id(manager))
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                # 풀 큐는 빈 자리(None)로 미리 채워져 있으므로 실제 연결만 셈
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool is not None else 0
+                hosts.append({
+                    'scheme': pool.scheme,
+                    'host': pool.host,
+                    'port': pool.port,
+                    'connections_created': pool.num_connections,
+                    'requests': pool.num_requests,
+                    'idle_connections': idle
+                })
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'keep_alive': self.keep_alive,
+            'tcp_nodelay': self.tcp_nodelay,
+            'hosts': hosts
+        }
+    
     def __enter__(self):
         """컨텍스트 매니저 진입"""
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료"""
-        self.session.close()
+        self.close()
+    
+    def close(self):
+        """HTTP 세션(만들어진 경우)과 캐시 연결 종료"""
+        if self._session is not None:
+            self._session.close()
+        if self.cache is not None:
+            self.cache.close()
     
     def _make_request(
         self,
@@ -96,10 +773,14 @@ class AIHubClient:
         url: str,
         params: Optional[Dict] = None,
         **kwargs
-    ) -> requests.Response:
+    ) -> 'requests.Response':
         """
         HTTP 요청 실행
         
+        일시적인 오류(429/5xx 응답, 연결 오류, 시간 초과)는 엔드포인트의 재시도 정책에 따라
+        지수 백오프와 지터(또는 Retry-After)만큼 기다린 뒤 재시도합니다.
+        재시도를 포함한 모든 시도는 요청 종류별 토큰 버킷의 속도 제한을 따릅니다.
+        
         Args:
             method: HTTP 메서드 (GET, POST 등)
             url: 요청 URL
@@ -110,32 +791,115 @@ class AIHubClient:
             HTTP 응답 객체
             
         Raises:
-            AIHubAPIError: API 요청 실패시
+            AIHubAPIError: API 요청 실패시 (재시도를 모두 소진한 경우 포함)
         """
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                timeout=self.timeout,
-                **kwargs
-            )
+        import requests
+        
+        policy = self._retry_policy(url)
+        limiter = self.rate_limiters.get(self._request_category(url))
+        attempt = 0
+        while True:
+            attempt += 1
+            if limiter is not None:
+                limiter.acquire()
+            self.retry_budget.record_request()
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    timeout=self.timeout,
+                    **kwargs
+                )
+            except requests.exceptions.RequestException as e:
+                error = self._request_error(e)
+                delay = self._retry_delay(policy, method, attempt)
+                if delay is None:
+                    raise error
+                self.logger.warning(
+                    f"Retrying {method} {url} in {delay:.1f}s (attempt {attempt}/{policy.max_attempts}): {error}"
+                )
+                time.sleep(delay)
+                continue
             
             if response.status_code == 401:
                 raise AIHubAuthError("API 키가 유효하지 않습니다.")
             elif response.status_code == 403:
                 raise AIHubAuthError("해당 데이터셋에 대한 접근 권한이 없습니다.")
-            elif response.status_code != 200:
-                raise AIHubAPIError(f"API 요청 실패: HTTP {response.status_code}")
+            elif response.status_code not in (200, 206, 304):
+                delay = None
+                if policy.should_retry_status(response.status_code):
+                    delay = self._retry_delay(policy, method, attempt, response.headers.get('retry-after'))
+                response.close()
+                if delay is None:
+                    raise AIHubAPIError(f"API 요청 실패: HTTP {response.status_code}")
+                self.logger.warning(
+                    f"Retrying {method} {url} in {delay:.1f}s "
+                    f"(attempt {attempt}/{policy.max_attempts}): HTTP {response.status_code}"
+                )
+                time.sleep(delay)
+                continue
             
             return response
+    
+    def _request_error(self, error: 'requests.exceptions.RequestException') -> AIHubAPIError:
+        """requests 예외를 AIHubAPIError로 변환"""
+        import requests
+        
+        if isinstance(error, requests.exceptions.Timeout):
+            return AIHubAPIError(f"요청 시간 초과 ({self.timeout}초)")
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return AIHubAPIError("네트워크 연결 오류")
+        return AIHubAPIError(f"요청 오류: {str(error)}")
+    
+    def _request_category(self, url: str) -> str:
+        """요청 URL의 속도 제한 종류 ('download' 또는 'metadata')"""
+        return 'download' if url.startswith(self.endpoints['download']) else 'metadata'
+    
+    def _retry_policy(self, url: str) -> RetryPolicy:
+        """
+        URL에 해당하는 엔드포인트의 재시도 정책
+        
+        Args:
+            url: 요청 URL
+            
+        Returns:
+            가장 길게 일치하는 엔드포인트의 정책 (없으면 'default')
+        """
+        matched = None
+        for name, endpoint in self.endpoints.items():
+            if url.startswith(endpoint) and (matched is None or len(endpoint) > len(self.endpoints[matched])):
+                matched = name
+        return self.retry_policies.get(matched, self.retry_policies['default'])
+    
+    def _retry_delay(
+        self,
+        policy: RetryPolicy,
+        method: str,
+        attempt: int,
+        retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        재시도 대기 시간 결정 (재시도하면 예산을 1회 사용)
+        
+        Args:
+            policy: 재시도 정책
+            method: HTTP 메서드
+            attempt: 방금 실패한 시도 번호 (1부터)
+            retry_after: 응답의 Retry-After 헤더 값
             
-        except requests.exceptions.Timeout:
-            raise AIHubAPIError(f"요청 시간 초과 ({self.timeout}초)")
-        except requests.exceptions.ConnectionError:
-            raise AIHubAPIError("네트워크 연결 오류")
-        except requests.exceptions.RequestException as e:
-            raise AIHubAPIError(f"요청 오류: {str(e)}")
+        Returns:
+            대기 시간 (초, 재시도하지 않으면 None)
+        """
+        if not policy.allows(method, attempt):
+            return None
+        delay = policy.delay(attempt, retry_after)
+        if delay is None:
+            return None
+        if not self.retry_budget.try_acquire():
+            self.logger.warning("Retry budget exhausted; not retrying")
+            return None
+        return delay
     
     def validate_api_key(self) -> bool:
         """
@@ -150,49 +914,328 @@ class AIHubClient:
         except AIHubAPIError:
             return False
     
-    def get_datasets(self) -> Dict[str, Any]:
+    def _cached_get(self, url: str, refresh: bool = False) -> str:
         """
-        전체 데이터셋 목록 조회
+        메타데이터 조회 (캐시 사용)
+        TTL 안의 캐시는 그대로 사용하고, 만료된 캐시는 ETag/If-Modified-Since로 재검증
         
+        Args:
+            url: 요청 URL
+            refresh: True면 TTL과 관계없이 서버에 재검증
+            
         Returns:
-            데이터셋 목록 정보
+            응답 본문
+        """
+        if self.cache is None:
+            return self._make_request('GET', url).text
+        
+        key = MetadataCache.make_key(self.api_key, url)
+        entry = self.cache.get(key)
+        if entry is not None and entry['fresh'] and not refresh:
+            return entry['body']
+        
+        # 조건부 요청 헤더 설정
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = self._make_request('GET', url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(key)
+            return entry['body']
+        
+        body = response.text
+        self.cache.put(
+            key,
+            body,
+            etag=response.headers.get('etag'),
+            last_modified=response.headers.get('last-modified')
+        )
+        return body
+    
+    @staticmethod
+    def _parse_body(body: str) -> Dict[str, Any]:
+        """
+        응답 본문 파싱
+        
+        Args:
+            body: 응답 본문
+            
+        Returns:
+            JSON 응답이면 파싱 결과, 아니면 {'raw_response': 본문}
         """
-        response = self._make_request('GET', self.endpoints['datasets'])
         try:
-            return response.json()
-        except json.JSONDecodeError:
+            return aihub_codec.loads(body)
+        except ValueError:
             # JSON이 아닌 경우 텍스트로 반환
-            return {'raw_response': response.text}
+            return {'raw_response': body}
     
-    def get_dataset_info(self, dataset_key: str) -> Dict[str, Any]:
+    def get_datasets(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        전체 데이터셋 목록 조회
+        파싱 결과는 메모리 캐시에 보관되어 여러 호출이 공유하므로 수정하지 마세요.
+        여러 스레드가 동시에 호출하면 HTTP 요청은 한 번만 보내고 결과를 함께 받습니다.
+        
+        Args:
+            refresh: True면 캐시를 서버에 재검증
+            
+        Returns:
+            데이터셋 목록 정보
+        """
+        if self.info_cache is not None and not refresh:
+            datasets = self.info_cache.get(_DATASETS_CACHE_KEY)
+            if datasets is not None:
+                return datasets
+        
+        return self.inflight.do(('datasets', refresh), self._fetch_datasets, refresh)
+    
+    def _fetch_datasets(self, refresh: bool) -> Dict[str, Any]:
+        """데이터셋 목록을 가져와 메모리 캐시에 저장 (get_datasets의 병합된 요청)"""
+        body = self._cached_get(self.endpoints['datasets'], refresh=refresh)
+        datasets = self._parse_body(body)
+        if self.info_cache is not None:
+            self.info_cache.put(_DATASETS_CACHE_KEY, datasets, approximate_size(datasets))
+        return datasets
+    
+    def get_datasets_cache_entry(self) -> Optional[Dict[str, Any]]:
+        """
+        데이터셋 목록의 디스크 캐시 항목 (요청 없이 조회)
+        
+        Returns:
+            캐시 항목 (body, etag, last_modified, fetched_at, fresh) - 캐시를 사용하지 않거나 없으면 None
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(MetadataCache.make_key(self.api_key, self.endpoints['datasets']))
+    
+    def get_dataset_info(self, dataset_key: str, refresh: bool = False) -> Dict[str, Any]:
         """
         특정 데이터셋의 파일 트리 정보 조회
         
+        파싱 결과는 메모리 캐시에 보관되어 여러 호출이 공유하므로 수정하지 마세요.
+        같은 데이터셋을 여러 스레드가 동시에 조회하면 HTTP 요청은 한 번만 보냅니다.
+        
         Args:
             dataset_key: 데이터셋 키
+            refresh: True면 캐시를 서버에 재검증
             
         Returns:
             데이터셋 파일 트리 정보
         """
+        if self.info_cache is not None and not refresh:
+            dataset_info = self.info_cache.get(dataset_key)
+            if dataset_info is not None:
+                return dataset_info
+        
+        return self.inflight.do(('info', dataset_key, refresh), self._fetch_dataset_info, dataset_key, refresh)
+    
+    def _fetch_dataset_info(self, dataset_key: str, refresh: bool) -> Dict[str, Any]:
+        """파일 트리 정보를 가져와 메모리 캐시에 저장 (get_dataset_info의 병합된 요청)"""
         url = f"{self.endpoints['filetree']}/{dataset_key}.do"
-        response = self._make_request('GET', url)
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return {'raw_response': response.text}
+        body = self._cached_get(url, refresh=refresh)
+        dataset_info = self._parse_body(body)
+        if self.info_cache is not None:
+            self.info_cache.put(dataset_key, dataset_info, approximate_size(dataset_info))
+        return dataset_info
     
-    def get_api_manual(self) -> Dict[str, Any]:
+    def get_api_manual(self, refresh: bool = False) -> Dict[str, Any]:
         """
         API 매뉴얼 정보 조회
         
+        Args:
+            refresh: True면 캐시를 서버에 재검증
+            
         Returns:
             API 매뉴얼 정보
         """
-        response = self._make_request('GET', self.endpoints['manual'])
+        return self._parse_body(self._cached_get(self.endpoints['manual'], refresh=refresh))
+    
+    def get_dataset_file_tree(self, dataset_key: str, refresh: bool = False) -> DatasetFileTree:
+        """
+        특정 데이터셋의 파일 트리를 경로/fileSn 색인이 있는 구조로 조회
+        파싱한 트리는 메모리 캐시에 보관되어 반복 조회 시 다시 파싱하지 않음
+        
+        Args:
+            dataset_key: 데이터셋 키
+            refresh: True면 캐시를 서버에 재검증
+            
+        Returns:
+            데이터셋 파일 트리 (트리 텍스트가 아닌 응답이면 빈 트리)
+        """
+        cache_key = (dataset_key, 'tree')
+        if self.info_cache is not None and not refresh:
+            tree = self.info_cache.get(cache_key)
+            if tree is not None:
+                return tree
+        
+        dataset_info = self.get_dataset_info(dataset_key, refresh=refresh)
+        tree = DatasetFileTree.parse(dataset_info.get('raw_response', ''))
+        if self.info_cache is not None:
+            self.info_cache.put(cache_key, tree, tree.nbytes)
+        return tree
+    
+    def iter_datasets_info(
+        self,
+        dataset_keys: List[str],
+        max_workers: Optional[int] = None,
+        refresh: bool = False,
+        file_tree: bool = False
+    ) -> Iterator[Tuple[str, Optional[Any], Optional[AIHubAPIError]]]:
+        """
+        여러 데이터셋 정보를 동시에 조회하여 완료되는 순서대로 반환
+        
+        같은 세션과 캐시를 공유하므로 이미 캐시된 데이터셋은 요청 없이 바로 반환됩니다.
+        반복을 중간에 멈추면 아직 시작하지 않은 조회는 취소됩니다.
+        
+        Args:
+            dataset_keys: 데이터셋 키 목록 (중복은 한 번만 조회)
+            max_workers: 동시에 보낼 최대 요청 수 (None이면 INFO_FETCH_WORKERS)
+            refresh: True면 캐시를 서버에 재검증
+            file_tree: True면 get_dataset_file_tree 결과(DatasetFileTree)를 반환
+            
+        Yields:
+            (데이터셋 키, 조회 결과, 오류) - 실패한 키는 결과가 None이고 오류가 설정됨
+        """
+        keys = list(dict.fromkeys(str(key) for key in dataset_keys))
+        if not keys:
+            return
+        fetch = self.get_dataset_file_tree if file_tree else self.get_dataset_info
+        workers = max(1, min(max_workers or INFO_FETCH_WORKERS, len(keys)))
+        
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aihub-info")
+        futures = {executor.submit(fetch, key, refresh): key for key in keys}
         try:
-            return response.json()
-        except json.JSONDecodeError:
-            return {'raw_response': response.text}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    yield key, future.result(), None
+                except AIHubAPIError as e:
+                    yield key, None, e
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def get_datasets_info(
+        self,
+        dataset_keys: List[str],
+        max_workers: Optional[int] = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        여러 데이터셋 정보를 동시에 조회
+        
+        Args:
+            dataset_keys: 데이터셋 키 목록
+            max_workers: 동시에 보낼 최대 요청 수 (None이면 INFO_FETCH_WORKERS)
+            refresh: True면 캐시를 서버에 재검증
+            
+        Returns:
+            {'results': {키: 데이터셋 정보}, 'errors': {키: 오류 메시지}}
+        """
+        results = {}
+        errors = {}
+        for key, dataset_info, error in self.iter_datasets_info(dataset_keys, max_workers, refresh):
+            if error is not None:
+                errors[key] = str(error)
+            else:
+                results[key] = dataset_info
+        return {'results': results, 'errors': errors}
+    
+    def get_search_index(self, refresh: bool = False) -> DatasetSearchIndex:
+        """
+        데이터셋 검색 색인 조회
+        데이터셋 목록이 바뀌었을 때만 색인을 다시 만들고 캐시 디렉토리에 저장
+        
+        Args:
+            refresh: True면 데이터셋 목록을 서버에 재검증
+            
+        Returns:
+            검색 색인
+        """
+        datasets = self.get_datasets(refresh=refresh)
+        
+        with self._search_lock:
+            # 메모리 캐시의 같은 목록 객체면 해시 계산 없이 재사용
+            if self._search_index is not None and datasets is self._search_source:
+                return self._search_index
+            
+            digest = catalog_digest(datasets)
+            index = self._search_index
+            if index is not None and index.digest == digest:
+                self._search_source = datasets
+                return index
+            
+            index_path = self.cache_dir / 'search_index.json'
+            index = DatasetSearchIndex.load(index_path)
+            if index is None or index.digest != digest:
+                index = DatasetSearchIndex.build(parse_catalog(datasets), digest)
+                if self.cache is not None:
+                    try:
+                        index.save(index_path)
+                    except OSError as e:
+                        self.logger.warning(f"Search index save failed: {e}")
+            self._search_index = index
+            self._search_source = datasets
+            return index
+    
+    def search_datasets(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        데이터셋 이름 검색
+        
+        Args:
+            query: 검색어
+            limit: 반환할 최대 결과 수
+            offset: 건너뛸 결과 수 (페이지 처리용)
+            refresh: True면 데이터셋 목록을 서버에 재검증
+            
+        Returns:
+            전체 결과 수와 점수 순으로 정렬된 결과 목록
+        """
+        return self.get_search_index(refresh=refresh).search(query, limit=limit, offset=offset)
+    
+    def invalidate_dataset_info(self, dataset_key: Optional[str] = None):
+        """
+        파일 트리 캐시 무효화 (메모리와 디스크 모두)
+        
+        Args:
+            dataset_key: 무효화할 데이터셋 키 (None이면 메모리 캐시 전체)
+        """
+        if self.info_cache is not None:
+            self.info_cache.invalidate(dataset_key)
+            if dataset_key is not None:
+                self.info_cache.invalidate((dataset_key, 'tree'))
+        if self.cache is not None and dataset_key is not None:
+            url = f"{self.endpoints['filetree']}/{dataset_key}.do"
+            self.cache.delete(MetadataCache.make_key(self.api_key, url))
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        메모리 캐시 통계
+        
+        Returns:
+            파일 트리 메모리 캐시의 적중/실패 횟수와 사용량, 동시 요청 병합 통계
+        """
+        if self.info_cache is None:
+            return {'enabled': False, 'coalescing': self.inflight.stats()}
+        return {'enabled': True, **self.info_cache.stats(), 'coalescing': self.inflight.stats()}
+    
+    def clear_cache(self):
+        """메타데이터 캐시 전체 삭제 (메모리와 디스크 모두)"""
+        if self.info_cache is not None:
+            self.info_cache.invalidate()
+        if self.cache is not None:
+            self.cache.clear()
+        self._search_source = None
     
     def download_dataset(
         self,
@@ -200,17 +1243,38 @@ class AIHubClient:
         file_keys: Optional[Union[str, List[str]]] = None,
         output_path: Optional[str] = None,
         extract: bool = True,
-        show_progress: bool = True
+        show_progress: bool = True,
+        segments: Optional[int] = None,
+        resume: Optional[bool] = None,
+        stream_extract: Optional[bool] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> Dict[str, Any]:
         """
         데이터셋 다운로드
         
+        서버가 Accept-Ranges를 지원하면 본문을 여러 바이트 구간으로 나누어
+        동시에 받고, 지원하지 않으면 단일 스트림으로 받습니다.
+        
+        이어받기 모드에서는 output_path 아래에 부분 파일과 저널을 남겨두고,
+        다음 호출에서 남은 구간만 Range 요청으로 받습니다.
+        
+        스트리밍 압축 해제 모드에서는 tar 파일을 디스크에 저장하지 않고 응답을
+        받는 즉시 압축을 해제합니다. 단일 스트림으로만 동작하며, 이어받기 모드와
+        함께 지정하면 이어받기가 우선합니다.
+        
         Args:
             dataset_key: 데이터셋 키
             file_keys: 다운로드할 파일 키들 (None이면 전체 다운로드)
             output_path: 다운로드 경로
             extract: tar 파일 자동 압축 해제 여부
             show_progress: 진행 상황 표시 여부
+            segments: 병렬 분할 다운로드 구간 수 (None이면 클라이언트 기본값)
+            resume: 이어받기 모드 사용 여부 (None이면 클라이언트 기본값)
+            stream_extract: 스트리밍 압축 해제 사용 여부 (None이면 클라이언트 기본값)
+            progress_callback: 진행량이 바뀔 때마다 (받은 바이트, 전체 바이트)로 호출할 함수
+                (여러 구간 스레드에서 호출되므로 가볍게 유지해야 함)
+            cancel_event: 설정되면 다운로드를 중단하는 이벤트 (이어받기 모드에서는 부분 파일 보존)
             
         Returns:
             다운로드 결과 정보
@@ -234,20 +1298,43 @@ class AIHubClient:
         download_url = f"{self.endpoints['download']}/{dataset_key}.do"
         params = {'fileSn': file_sn}
         
-        # 임시 파일로 다운로드
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.tar') as temp_file:
-            temp_path = temp_file.name
+        if resume is None:
+            resume = self.resume_downloads
+        if stream_extract is None:
+            stream_extract = self.stream_extract
+        stream_mode = extract and stream_extract and not resume
         
-        try:
-            # 스트리밍 다운로드
-            response = self._make_request('GET', download_url, params=params, stream=True)
+        if stream_mode:
+            # 스트리밍 압축 해제: tar 파일을 디스크에 저장하지 않음
+            temp_path = None
+        elif resume:
+            # 이어받기: 출력 디렉토리에 부분 파일을 남김
+            temp_path = str(output_dir / self._partial_file_name(dataset_key, file_sn))
+        else:
+            # 임시 파일로 다운로드
+            import tempfile
             
-            # 파일 크기 확인
-            total_size = int(response.headers.get('content-length', 0))
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.tar') as temp_file:
+                temp_path = temp_file.name
+        journal = None
+        
+        try:
+            # 이어받기는 본문 없이 크기와 ETag만 필요하므로 첫 바이트만 요청
+            # (서버가 Range를 무시하면 200 전체 응답을 그대로 사용)
+            probe_headers = {'Range': 'bytes=0-0'} if resume and not stream_mode else None
+            response = self._make_request('GET', download_url, params=params, headers=probe_headers, stream=True)
+            total_size = self._response_total_size(response)
+            if response.status_code == 206 and not self._supports_ranges(response, total_size):
+                # 구간 응답을 이어받기에 쓸 수 없으면 전체 본문을 다시 요청
+                response.close()
+                response = self._make_request('GET', download_url, params=params, stream=True)
+                total_size = self._response_total_size(response)
             
             # 진행 상황 표시기 설정
             progress_bar = None
             if show_progress and total_size > 0:
+                from tqdm import tqdm
+                
                 progress_bar = tqdm(
                     total=total_size,
                     unit='B',
@@ -256,49 +1343,383 @@ class AIHubClient:
                 )
             
             # 파일 다운로드
-            downloaded_size = 0
-            with open(temp_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        if progress_bar:
-                            progress_bar.update(len(chunk))
+            progress = _DownloadProgress(total_size, progress_bar, progress_callback, cancel_event)
+            segment_count = self._plan_segments(response, total_size, segments)
+            resumed_size = 0
+            extracted_files = None
+            if stream_mode:
+                self.logger.info("다운로드와 동시에 압축 파일을 해제하는 중...")
+                extracted_files, downloaded_size = self._extract_stream(response, output_dir, progress)
+            elif resume and self._supports_ranges(response, total_size):
+                response.close()
+                journal = self._open_journal(temp_path, download_url, file_sn, response, total_size)
+                resumed_size = journal.completed_bytes()
+                if resumed_size:
+                    self.logger.info(f"Resuming {dataset_key} from {resumed_size}/{total_size} bytes")
+                    progress.update(resumed_size)
+                self._download_ranges(
+                    download_url, params, temp_path, journal.missing(),
+                    max(1, segment_count), progress, journal
+                )
+                downloaded_size = journal.completed_bytes()
+                if downloaded_size != total_size:
+                    raise AIHubAPIError(f"다운로드 크기 불일치: {downloaded_size}/{total_size}")
+            elif segment_count > 1:
+                response.close()
+                with open(temp_path, 'wb') as f:
+                    _preallocate(f, total_size)
+                downloaded_size = self._download_ranges(
+                    download_url, params, temp_path, self._split_ranges(0, total_size, segment_count),
+                    segment_count, progress
+                )
+            else:
+                downloaded_size = self._download_stream(response, temp_path, progress)
+                if total_size and downloaded_size != total_size:
+                    raise AIHubAPIError(f"다운로드 크기 불일치: {downloaded_size}/{total_size}")
             
             if progress_bar:
                 progress_bar.close()
+            progress.check()
             
             # 압축 해제
-            extracted_files = []
-            if extract:
+            if extracted_files is not None:
+                pass
+            elif extract:
                 self.logger.info("압축 파일을 해제하는 중...")
                 extracted_files = self._extract_and_merge(temp_path, output_dir)
             else:
                 # tar 파일을 출력 디렉토리로 이동
                 final_path = output_dir / f"{dataset_key}.tar"
-                Path(temp_path).rename(final_path)
+                Path(temp_path).replace(final_path)
                 extracted_files = [str(final_path)]
             
+            if resume:
+                # 완료된 이어받기 부분 파일과 저널 정리
+                if journal is not None:
+                    journal.remove()
+                if Path(temp_path).exists():
+                    Path(temp_path).unlink()
+            
             return {
                 'success': True,
                 'dataset_key': dataset_key,
                 'file_keys': file_sn,
                 'downloaded_size': downloaded_size,
+                'resumed_size': resumed_size,
                 'output_path': str(output_dir),
                 'extracted_files': extracted_files,
                 'message': f"데이터셋 '{dataset_key}' 다운로드 완료"
             }
             
         except Exception as e:
-            # 임시 파일 정리
-            if Path(temp_path).exists():
+            if journal is not None:
+                # 이어받기 모드: 부분 파일과 저널을 보존
+                journal.save()
+            elif not resume and temp_path and Path(temp_path).exists():
+                # 임시 파일 정리
                 Path(temp_path).unlink()
             raise AIHubAPIError(f"다운로드 실패: {str(e)}")
         finally:
             # 임시 파일 정리
-            if Path(temp_path).exists():
+            if not resume and temp_path and Path(temp_path).exists():
                 Path(temp_path).unlink()
     
+    @staticmethod
+    def _partial_file_name(dataset_key: str, file_sn: str) -> str:
+        """
+        이어받기용 부분 파일 이름
+        
+        Args:
+            dataset_key: 데이터셋 키
+            file_sn: 파일 키 문자열
+            
+        Returns:
+            부분 파일 이름 (파일 키 조합마다 다름)
+        """
+        if file_sn == "all":
+            return f"{dataset_key}.tar.download"
+        digest = hashlib.sha1(file_sn.encode('utf-8')).hexdigest()[:10]
+        return f"{dataset_key}_{digest}.tar.download"
+    
+    def _open_journal(
+        self,
+        partial_path: str,
+        url: str,
+        file_sn: str,
+        response: 'requests.Response',
+        total_size: int
+    ) -> _DownloadJournal:
+        """
+        이어받기 저널 열기 (서버 파일이 바뀌었으면 새로 시작)
+        
+        Args:
+            partial_path: 부분 파일 경로
+            url: 다운로드 URL
+            file_sn: 파일 키 문자열
+            response: 다운로드 요청의 첫 응답
+            total_size: 전체 크기 (바이트)
+            
+        Returns:
+            다운로드 저널
+        """
+        meta = {
+            'url': url,
+            'file_sn': file_sn,
+            'total_size': total_size,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified')
+        }
+        journal_path = Path(partial_path + '.json')
+        
+        journal = None
+        if Path(partial_path).exists() and Path(partial_path).stat().st_size == total_size:
+            journal = _DownloadJournal.load(journal_path, meta)
+        
+        if journal is None:
+            journal = _DownloadJournal(journal_path, meta)
+            with open(partial_path, 'wb') as f:
+                _preallocate(f, total_size)
+            journal.save()
+        return journal
+    
+    def _plan_segments(
+        self,
+        response: 'requests.Response',
+        total_size: int,
+        segments: Optional[int] = None
+    ) -> int:
+        """
+        분할 다운로드 구간 수 결정
+        
+        Args:
+            response: 다운로드 요청의 첫 응답
+            total_size: 전체 크기 (바이트)
+            segments: 요청된 구간 수 (None이면 클라이언트 기본값)
+            
+        Returns:
+            사용할 구간 수 (1이면 단일 스트림)
+        """
+        count = segments or self.download_segments
+        if count <= 1 or not self._supports_ranges(response, total_size):
+            return 1
+        return max(1, min(count, total_size // MIN_SEGMENT_SIZE))
+    
+    @staticmethod
+    def _response_total_size(response: 'requests.Response') -> int:
+        """
+        다운로드 전체 크기 (구간 응답이면 Content-Range의 전체 크기, 아니면 Content-Length)
+        
+        Args:
+            response: 다운로드 요청의 첫 응답
+            
+        Returns:
+            전체 크기 (바이트, 모르면 0)
+        """
+        if response.status_code == 206:
+            total = response.headers.get('content-range', '').rpartition('/')[2]
+            return int(total) if total.isdigit() else 0
+        return int(response.headers.get('content-length', 0))
+    
+    @staticmethod
+    def _supports_ranges(response: 'requests.Response', total_size: int) -> bool:
+        """
+        응답이 바이트 구간(Range) 요청을 지원하는지 확인
+        
+        Args:
+            response: 다운로드 요청의 첫 응답 (AsyncAIHubClient의 aiohttp 응답도 허용하므로 헤더만 사용)
+            total_size: 전체 크기 (바이트)
+            
+        Returns:
+            Range 요청 지원 여부
+        """
+        if total_size <= 0:
+            return False
+        # 구간 응답(206)은 Content-Range가 있으면 Accept-Ranges 없이도 지원하는 것으로 봄
+        if not response.headers.get('content-range') and response.headers.get('accept-ranges', '').lower() != 'bytes':
+            return False
+        # 전송 인코딩이 적용된 본문은 바이트 구간이 원본과 일치하지 않음
+        return not response.headers.get('content-encoding')
+    
+    def _download_stream(
+        self,
+        response: 'requests.Response',
+        path: str,
+        progress: _DownloadProgress
+    ) -> int:
+        """
+        단일 스트림으로 응답 본문을 파일에 저장
+        
+        Args:
+            response: 스트리밍 응답
+            path: 저장할 파일 경로
+            progress: 진행 상황 집계기
+            
+        Returns:
+            다운로드한 바이트 수
+        """
+        downloaded_size = 0
+        with open(path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                progress.check()
+                if chunk:
+                    f.write(chunk)
+                    downloaded_size += len(chunk)
+                    progress.update(len(chunk))
+        return downloaded_size
+    
+    def _download_ranges(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        path: str,
+        ranges: List[Tuple[int, int]],
+        workers: int,
+        progress: _DownloadProgress,
+        journal: Optional[_DownloadJournal] = None
+    ) -> int:
+        """
+        HTTP Range 요청으로 여러 구간을 동시에 받아 미리 할당한 파일에 기록
+        
+        Args:
+            url: 다운로드 URL
+            params: URL 파라미터
+            path: 저장할 파일 경로 (미리 할당되어 있어야 함)
+            ranges: 받을 (시작, 끝) 구간 목록 - 끝 오프셋 포함
+            workers: 동시에 받을 구간 수
+            progress: 진행 상황 집계기
+            journal: 완료 구간을 기록할 이어받기 저널
+            
+        Returns:
+            다운로드한 바이트 수
+        """
+        if not ranges:
+            return 0
+        
+        # 남은 구간이 workers개 정도가 되도록 큰 구간을 나눔
+        remaining = sum(end - start + 1 for start, end in ranges)
+        target = max(MIN_SEGMENT_SIZE, -(-remaining // workers))
+        tasks = []
+        for start, end in ranges:
+            pieces = -(-(end - start + 1) // target)
+            tasks.extend(self._split_ranges(start, end + 1, pieces))
+        self.logger.info(f"Downloading {remaining} bytes in {len(tasks)} segments")
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [
+                executor.submit(self._download_range, url, params, path, start, end, progress, journal)
+                for start, end in tasks
+            ]
+            try:
+                return sum(future.result() for future in futures)
+            except BaseException:
+                # 한 구간이라도 실패하면 나머지 구간도 중단
+                progress.stop_event.set()
+                raise
+    
+    def _download_range(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        path: str,
+        start: int,
+        end: int,
+        progress: _DownloadProgress,
+        journal: Optional[_DownloadJournal] = None
+    ) -> int:
+        """
+        단일 바이트 구간 다운로드
+        
+        Args:
+            url: 다운로드 URL
+            params: URL 파라미터
+            path: 저장할 파일 경로 (미리 할당되어 있어야 함)
+            start: 시작 오프셋 (포함)
+            end: 끝 오프셋 (포함)
+            progress: 진행 상황 집계기
+            journal: 완료 구간을 기록할 이어받기 저널
+            
+        Returns:
+            다운로드한 바이트 수
+        """
+        import requests
+        
+        policy = self._retry_policy(url)
+        expected = end - start + 1
+        received = 0
+        attempt = 0
+        while True:
+            attempt += 1
+            # 본문을 받다가 연결이 끊기면 받은 위치부터 다시 요청
+            headers = {'Range': f'bytes={start + received}-{end}'}
+            if journal is not None and journal.meta.get('etag'):
+                # 서버 파일이 바뀌었으면 206 대신 전체 응답(200)을 받도록 함
+                headers['If-Range'] = journal.meta['etag']
+            response = self._make_request('GET', url, params=params, headers=headers, stream=True)
+            try:
+                if response.status_code != 206:
+                    raise AIHubAPIError("서버가 구간 응답(206)을 반환하지 않았습니다.")
+                
+                # 저널에 기록한 구간이 곧바로 디스크에 반영되도록 버퍼링 없이 기록
+                with open(path, 'r+b', buffering=0) as f:
+                    f.seek(start + received)
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        progress.check()
+                        if chunk:
+                            view = memoryview(chunk)
+                            while view:
+                                view = view[f.write(view):]
+                            if journal is not None:
+                                journal.add(start + received, len(chunk))
+                            received += len(chunk)
+                            progress.update(len(chunk))
+                if received >= expected:
+                    break
+                # 본문이 오류 없이 짧게 끝난 경우도 끊긴 것으로 보고 받은 위치부터 다시 요청
+                error = f"short body ({received}/{expected} bytes)"
+            except requests.exceptions.RequestException as e:
+                error = str(e)
+            finally:
+                response.close()
+            
+            delay = self._retry_delay(policy, 'GET', attempt)
+            if delay is None:
+                raise AIHubAPIError(f"구간 다운로드 중단 (bytes={start}-{end}): {error}")
+            self.logger.warning(
+                f"Segment bytes={start}-{end} interrupted at {received} bytes; "
+                f"retrying in {delay:.1f}s (attempt {attempt}/{policy.max_attempts})"
+            )
+            time.sleep(delay)
+        
+        if received != expected:
+            raise AIHubAPIError(
+                f"구간 다운로드 크기 불일치 (bytes={start}-{end}): {received}/{expected}"
+            )
+        return received
+    
+    @staticmethod
+    def _split_ranges(start: int, stop: int, count: int) -> List[Tuple[int, int]]:
+        """
+        [start, stop) 구간을 count개의 연속된 바이트 구간으로 분할
+        
+        Args:
+            start: 시작 오프셋
+            stop: 끝 오프셋 (미포함)
+            count: 구간 수
+            
+        Returns:
+            (시작, 끝) 목록 - 끝 오프셋 포함
+        """
+        size = stop - start
+        count = max(1, min(count, size))
+        step, remainder = divmod(size, count)
+        ranges = []
+        offset = start
+        for i in range(count):
+            length = step + (1 if i < remainder else 0)
+            ranges.append((offset, offset + length - 1))
+            offset += length
+        return ranges
+    
     def _extract_and_merge(self, tar_path: str, output_dir: Path) -> List[str]:
         """
         tar 파일 압축 해제 및 분할 파일 병합
@@ -310,64 +1731,202 @@ class AIHubClient:
         Returns:
             추출된 파일 목록
         """
-        extracted_files = []
+        import tarfile
         
-        # tar 파일 압축 해제
+        # tar 파일 압축 해제 (분할 파일은 압축 해제와 동시에 병합)
         with tarfile.open(tar_path, 'r') as tar:
-            tar.extractall(output_dir)
-            extracted_files = [str(output_dir / member.name) for member in tar.getmembers()]
+            extracted_files = self._extract_members(tar, output_dir)
         
-        # 분할 파일 병합
+        # 기존에 남아 있던 분할 파일 병합
         self._merge_part_files(output_dir)
         
         return extracted_files
     
-    def _merge_part_files(self, directory: Path):
+    def _extract_members(self, tar: 'tarfile.TarFile', output_dir: Path) -> List[str]:
+        """
+        tar 멤버를 순서대로 압축 해제
+        분할 파일(.partN)은 디스크에 따로 풀지 않고 도착하는 즉시 최종 파일에 이어 붙임
+        
+        Args:
+            tar: 읽고 있는 tar 파일 (스트림 모드 가능)
+            output_dir: 출력 디렉토리
+            
+        Returns:
+            추출된 파일 목록
+        """
+        import tarfile
+        
+        assembler = _PartAssembler(output_dir, self._merge_files, self.logger)
+        extracted_files = []
+        
+        def regular_members():
+            for member in tar:
+                if assembler.add(tar, member):
+                    continue
+                extracted_files.append(str(output_dir / _relative_member_path(member.name)))
+                yield member
+        
+        try:
+            if hasattr(tarfile, 'data_filter'):
+                # 분할 파일과 같은 기준(data 필터)으로 경로 검사
+                tar.extractall(output_dir, members=regular_members(), filter='data')
+            else:
+                tar.extractall(output_dir, members=regular_members())
+            extracted_files.extend(assembler.finish())
+        except BaseException:
+            assembler.cleanup()
+            raise
+        return extracted_files
+    
+    def _extract_stream(
+        self,
+        response: 'requests.Response',
+        output_dir: Path,
+        progress: _DownloadProgress
+    ) -> Tuple[List[str], int]:
+        """
+        HTTP 응답을 tar 스트림 모드로 읽으며 멤버를 바로 압축 해제
+        
+        Args:
+            response: 스트리밍 응답
+            output_dir: 출력 디렉토리
+            progress: 진행 상황 집계기
+            
+        Returns:
+            (추출된 파일 목록, 다운로드한 바이트 수)
+        """
+        import tarfile
+        
+        # Content-Encoding(gzip 등)이 적용된 경우 디코딩된 본문을 전달
+        response.raw.decode_content = True
+        reader = _ProgressReader(response.raw, progress)
+        
+        try:
+            with tarfile.open(fileobj=reader, mode='r|*') as tar:
+                extracted_files = self._extract_members(tar, output_dir)
+        finally:
+            response.close()
+        
+        # 기존에 남아 있던 분할 파일 병합
+        self._merge_part_files(output_dir)
+        
+        return extracted_files, reader.bytes_read
+    
+    def _merge_part_files(self, directory: Path, workers: Optional[int] = None) -> Dict[str, Any]:
         """
         분할된 .part 파일들을 병합
+        서로 독립적인 파일 그룹은 작업자 풀에서 동시에 병합하며, 큰 그룹부터 처리
         
         Args:
             directory: 대상 디렉토리
-        """
-        # 모든 하위 디렉토리 탐색
-        for root in directory.rglob('*'):
-            if not root.is_dir():
-                continue
+            workers: 동시에 병합할 그룹 수 (None이면 클라이언트 기본값)
             
-            # .part 파일들 찾기
-            part_files = list(root.glob('*.part*'))
-            if not part_files:
-                continue
+        Returns:
+            병합 통계 (병합한 파일 수, 바이트 수, 소요 시간, 초당 바이트 수)
+        """
+        started = time.monotonic()
+        workers = max(1, workers or self.merge_workers)
+        
+        # 큰 그룹부터 병합해 마지막에 큰 파일 하나만 남는 상황을 피함
+        groups = self._find_part_groups(directory)
+        groups.sort(key=lambda group: group[2], reverse=True)
+        
+        merged_bytes = 0
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(workers, len(groups))) as executor:
+                futures = [
+                    executor.submit(self._merge_group, root, base_name, parts)
+                    for root, base_name, _, parts in groups
+                ]
+                merged_bytes = sum(future.result() for future in futures)
+        
+        elapsed = time.monotonic() - started
+        stats = {
+            'merged_files': len(groups),
+            'merged_bytes': merged_bytes,
+            'elapsed_seconds': elapsed,
+            'bytes_per_second': merged_bytes / elapsed if elapsed > 0 else 0.0
+        }
+        if groups:
+            self.logger.info(
+                f"Merged {len(groups)} files, {merged_bytes} bytes "
+                f"({stats['bytes_per_second'] / (1024 * 1024):.1f} MiB/s)"
+            )
+        return stats
+    
+    def _find_part_groups(self, directory: Path) -> List[Tuple[Path, str, int, List[Path]]]:
+        """
+        디렉토리를 한 번만 탐색하여 병합할 분할 파일 그룹 수집
+        
+        Args:
+            directory: 대상 디렉토리
             
+        Returns:
+            (디렉토리, 원본 파일명, 전체 크기, 번호순 분할 파일 목록) 목록
+        """
+        groups = []
+        for root, _, file_names in os.walk(directory):
             # 파일명별로 그룹화
-            file_groups = {}
-            for part_file in part_files:
-                # 파일명에서 .part 이전 부분 추출
-                base_name = part_file.name.split('.part')[0]
-                if base_name not in file_groups:
-                    file_groups[base_name] = []
-                file_groups[base_name].append(part_file)
-            
-            # 각 그룹별로 병합
+            file_groups: Dict[str, List[Path]] = {}
+            for file_name in file_names:
+                # 압축 해제 중 조립기와 같은 분할 파일 이름 형식 사용
+                match = _PART_NAME_PATTERN.match(file_name)
+                if not match:
+                    continue
+                file_groups.setdefault(match.group('base'), []).append(Path(root) / file_name)
+            
             for base_name, parts in file_groups.items():
                 if len(parts) <= 1:
                     continue
-                
                 # 파트 번호 순으로 정렬
                 parts.sort(key=lambda x: self._extract_part_number(x.name))
-                
-                # 병합
-                output_file = root / base_name
-                self.logger.info(f"Merging {base_name} in {root}")
-                
-                with open(output_file, 'wb') as outf:
-                    for part in parts:
-                        with open(part, 'rb') as inf:
-                            outf.write(inf.read())
-                
-                # 분할 파일들 삭제
-                for part in parts:
-                    part.unlink()
+                total_size = sum(part.stat().st_size for part in parts)
+                groups.append((Path(root), base_name, total_size, parts))
+        return groups
+    
+    def _merge_group(self, root: Path, base_name: str, parts: List[Path]) -> int:
+        """
+        분할 파일 그룹 하나를 병합하고 분할 파일 삭제
+        
+        Args:
+            root: 분할 파일이 있는 디렉토리
+            base_name: 원본 파일명
+            parts: 번호순 분할 파일 목록
+            
+        Returns:
+            병합한 바이트 수
+        """
+        output_file = root / base_name
+        self.logger.info(f"Merging {base_name} in {root}")
+        merged_bytes = self._merge_files(parts, output_file)
+        
+        # 분할 파일들 삭제
+        for part in parts:
+            part.unlink()
+        return merged_bytes
+    
+    def _merge_files(self, parts: List[Path], output_file: Path) -> int:
+        """
+        분할 파일들을 순서대로 이어 붙여 하나의 파일로 저장
+        출력 파일은 전체 크기만큼 미리 할당하고, 내용은 zero-copy로 복사
+        
+        Args:
+            parts: 순서대로 정렬된 분할 파일 목록
+            output_file: 출력 파일 경로
+            
+        Returns:
+            병합한 바이트 수
+        """
+        total_size = sum(part.stat().st_size for part in parts)
+        written = 0
+        with open(output_file, 'wb') as outf:
+            _preallocate(outf, total_size)
+            for part in parts:
+                with open(part, 'rb') as inf:
+                    written += _copy_fd(inf.fileno(), outf.fileno(), os.fstat(inf.fileno()).st_size)
+            if written != total_size:
+                outf.truncate(written)
+        return written
     
     def _extract_part_number(self, filename: str) -> int:
         """
@@ -379,13 +1938,8 @@ class AIHubClient:
         Returns:
             파트 번호 (없으면 0)
         """
-        try:
-            if '.part' in filename:
-                part_str = filename.split('.part')[1]
-                return int(part_str) if part_str.isdigit() else 0
-            return 0
-        except (ValueError, IndexError):
-            return 0
+        match = _PART_NAME_PATTERN.match(filename)
+        return int(match.group('number')) if match else 0
 
 
 # MCP용 함수들
@@ -468,8 +2022,6 @@ def download_dataset_mcp(
 
 if __name__ == "__main__":
     # 간단한 테스트
-    import sys
-    
     try:
         with create_aihub_client() as client:
             print("API 키 검증 중...")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+AI-Hub JSON 코덱
+orjson 또는 msgspec이 설치되어 있으면 빠른 백엔드로, 없으면 표준 json 모듈로
+MCP 메시지와 API 응답을 인코딩/디코딩하며, 어느 백엔드를 쓰든 출력은 표준
+json 모듈과 바이트 단위로 같음
+"""
+
+import json
+import os
+import re
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgspec = None
+
+# 빠른 백엔드의 지수 표기 후보 (예: 1e16, 2.5e-7 - 표준 json은 1e+16, 2.5e-07)
+# 첫 글자가 고정 문자라 정규식 엔진이 빠른 검색을 사용함
+_EXPONENT_PATTERN = re.compile(rb'e[-0-9]')
+
+
+def _select_backend() -> str:
+    """환경변수 AIHUB_JSON_BACKEND(auto, orjson, msgspec, json)에 따라 사용할 백엔드 선택"""
+    requested = os.getenv('AIHUB_JSON_BACKEND', 'auto').lower()
+    if requested in ('auto', 'orjson') and orjson is not None:
+        return 'orjson'
+    if requested in ('auto', 'msgspec') and msgspec is not None:
+        return 'msgspec'
+    return 'json'
+
+
+BACKEND = _select_backend()
+
+if BACKEND == 'msgspec':
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_decoder = msgspec.json.Decoder()
+
+
+def _float_mismatch(data: bytes) -> bool:
+    """
+    빠른 백엔드의 출력에 표준 json과 표기가 다를 수 있는 실수가 있는지 여부
+    지수 표기(1e16)와 0.0001 미만의 소수(0.00001 - 표준 json은 1e-05)를 찾으며,
+    문자열 안의 같은 패턴도 걸리지만 그 경우에는 표준 json으로 다시 인코딩할 뿐이므로 안전
+    """
+    if b'0.0000' in data:
+        return True
+    for match in _EXPONENT_PATTERN.finditer(data):
+        if data[match.start() - 1:match.start()].isdigit():
+            return True
+    return False
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    JSON 디코딩
+    
+    Args:
+        data: JSON 문자열 또는 UTF-8 바이트
+    
+    Returns:
+        디코딩 결과 (json.loads와 같음)
+    
+    Raises:
+        json.JSONDecodeError: JSON 형식이 아닐 때
+    """
+    if BACKEND == 'orjson':
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN, 64비트를 넘는 정수 등 빠른 백엔드가 거부하는 입력은 표준 json에 맡김
+            pass
+    elif BACKEND == 'msgspec':
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError:
+            pass
+    return json.loads(data)
+
+
+def _fast_dumpb(obj: Any, indent: bool) -> Optional[bytes]:
+    """빠른 백엔드로 인코딩 (표준 json과 출력이 같다고 확인할 수 없으면 None)"""
+    data = None
+    if BACKEND == 'orjson':
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # 문자열이 아닌 키, 64비트를 넘는 정수 등
+            return None
+    elif BACKEND == 'msgspec' and not indent:
+        try:
+            data = _msgspec_encoder.encode(obj)
+        except (TypeError, ValueError, msgspec.EncodeError):
+            return None
+    if data is None or _float_mismatch(data):
+        return None
+    return data
+
+
+def _stdlib_dumps(obj: Any, indent: bool) -> str:
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    JSON 인코딩 (ensure_ascii=False)
+    
+    표준 JSON 타입(dict, list, str, int, float, bool, None - NaN/Infinity 제외)에 대해 출력은
+    json.dumps(obj, ensure_ascii=False, separators=(',', ':')) 또는
+    json.dumps(obj, ensure_ascii=False, indent=2)와 바이트 단위로 같습니다.
+    
+    Args:
+        obj: 인코딩할 값
+        indent: True면 2칸 들여쓰기, False면 공백 없는 한 줄
+    
+    Returns:
+        JSON 문자열
+    
+    Raises:
+        TypeError: JSON으로 인코딩할 수 없는 값
+    """
+    data = _fast_dumpb(obj, indent)
+    if data is not None:
+        return data.decode('utf-8')
+    return _stdlib_dumps(obj, indent)
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """
+    JSON 인코딩 (UTF-8 바이트 - 출력 스트림에 바로 기록할 때 문자열 변환을 생략)
+    
+    Args:
+        obj: 인코딩할 값
+        indent: True면 2칸 들여쓰기, False면 공백 없는 한 줄
+    
+    Returns:
+        dumps 결과를 UTF-8로 인코딩한 것과 같은 바이트
+    
+    Raises:
+        TypeError: JSON으로 인코딩할 수 없는 값
+    """
+    data = _fast_dumpb(obj, indent)
+    if data is not None:
+        return data
+    return _stdlib_dumps(obj, indent).encode('utf-8')
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Optional
 
 from aihub_client import AIHubClient, AIHubAPIError, AIHubAuthError
+from aihub_filetree import format_size
 
 
 class AIHubCLI:
@@ -100,10 +101,19 @@ class AIHubCLI:
         
         try:
             print(f"\n📄 데이터셋 '{dataset_key}' 정보를 조회하고 있습니다...")
+            tree = self.client.get_dataset_file_tree(dataset_key)
             dataset_info = self.client.get_dataset_info(dataset_key)
             
             # 결과 표시
-            if isinstance(dataset_info, dict) and 'raw_response' in dataset_info:
+            if len(tree):
+                print(f"\n📊 데이터셋 '{dataset_key}' 파일 트리:")
+                print(f"📦 전체 크기: {format_size(tree.total_size())}, 파일 수: {tree.file_count:,}")
+                files = tree.files_under()
+                for file_info in files[:20]:
+                    print(f"  • [{file_info['file_sn']}] {file_info['path']} ({format_size(file_info['size'])})")
+                if len(files) > 20:
+                    print(f"  ... 및 {len(files) - 20}개 파일 더")
+            elif isinstance(dataset_info, dict) and 'raw_response' in dataset_info:
                 print("\n응답:")
                 print(dataset_info['raw_response'][:1000])
                 if len(dataset_info['raw_response']) > 1000:
@@ -214,7 +224,7 @@ class AIHubCLI:
         
         # 기존 클라이언트 정리
         if self.client:
-            self.client.session.close()
+            self.client.close()
         
         # 새로운 클라이언트로 초기화
         if self.initialize_client(new_api_key):
@@ -274,7 +284,7 @@ class AIHubCLI:
         
         # 정리
         if self.client:
-            self.client.session.close()
+            self.client.close()
 
 
 def main():
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+AI-Hub 데이터셋 파일 트리 모델
+/info/{dataset_key}.do 의 트리 텍스트를 파싱하여 경로/fileSn 색인과
+디렉토리별 크기 합계를 가진 압축된 구조로 보관
+"""
+
+import re
+import sys
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+# 트리 가지 표시 (예: "│  ├─라벨링데이터", "│  └─TL.zip | 3 MB | 66065")
+_BRANCH_MARKERS = ('├─', '└─')
+
+# 파일 줄 형식: "이름 | 크기 | fileSn"
+_FILE_LINE_PATTERN = re.compile(r'^(?P<name>.+?)\s*\|\s*(?P<size>[^|]+?)\s*\|\s*(?P<sn>\d+)\s*$')
+
+# 크기 표기 형식 (예: "3 MB", "1.5 GB", "512 B")
+_SIZE_PATTERN = re.compile(r'^(?P<value>[\d.,]+)\s*(?P<unit>[KMGTP]?B)$', re.IGNORECASE)
+
+_SIZE_UNITS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024 ** 2,
+    'GB': 1024 ** 3,
+    'TB': 1024 ** 4,
+    'PB': 1024 ** 5,
+}
+
+
+def parse_size(text: str) -> int:
+    """
+    크기 표기를 바이트 수로 변환
+    
+    Args:
+        text: 크기 표기 (예: "3 MB")
+    
+    Returns:
+        바이트 수 (알 수 없는 형식이면 0)
+    """
+    match = _SIZE_PATTERN.match(text.strip())
+    if not match:
+        return 0
+    value = float(match.group('value').replace(',', ''))
+    return int(value * _SIZE_UNITS[match.group('unit').upper()])
+
+
+def format_size(size: int) -> str:
+    """
+    바이트 수를 읽기 쉬운 크기 표기로 변환
+    
+    Args:
+        size: 바이트 수
+    
+    Returns:
+        크기 표기 (예: "1.5 GB")
+    """
+    value = float(size)
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if value < 1024 or unit == 'TB':
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} PB"
+
+
+class DatasetFileTree:
+    """
+    데이터셋 파일 트리
+    노드는 트리 텍스트 순서(전위 순회)대로 병렬 배열에 저장되므로
+    한 디렉토리의 하위 노드는 [index, subtree_end[index]) 연속 구간을 차지
+    """
+    
+    __slots__ = (
+        'names', 'parents', 'sizes', 'file_sns', 'paths',
+        'subtree_end', 'file_counts', '_path_index', '_sn_index'
+    )
+    
+    def __init__(self):
+        self.names: List[str] = []
+        self.parents: List[int] = []
+        # 파일은 파일 크기, 디렉토리는 하위 파일 크기 합계
+        self.sizes: List[int] = []
+        # 디렉토리는 -1
+        self.file_sns: List[int] = []
+        self.paths: List[str] = []
+        self.subtree_end: List[int] = []
+        self.file_counts: List[int] = []
+        self._path_index: Dict[str, int] = {}
+        self._sn_index: Dict[int, int] = {}
+    
+    @classmethod
+    def parse(cls, text: str) -> 'DatasetFileTree':
+        """
+        트리 텍스트 파싱
+        
+        Args:
+            text: /info/{dataset_key}.do 응답 본문
+        
+        Returns:
+            파일 트리 (트리 줄이 없으면 빈 트리)
+        """
+        tree = cls()
+        # (가지 표시 열 위치, 노드 번호) 스택
+        stack: List[List[int]] = []
+        
+        for line in text.splitlines():
+            column = -1
+            for marker in _BRANCH_MARKERS:
+                position = line.find(marker)
+                if position >= 0 and (column < 0 or position < column):
+                    column = position
+            if column < 0:
+                continue
+            
+            label = line[column + 2:].strip()
+            if not label:
+                continue
+            
+            while stack and stack[-1][0] >= column:
+                stack.pop()
+            parent = stack[-1][1] if stack else -1
+            
+            match = _FILE_LINE_PATTERN.match(label)
+            if match:
+                tree._add(match.group('name'), parent, parse_size(match.group('size')), int(match.group('sn')))
+            else:
+                stack.append([column, tree._add(label, parent, 0, -1)])
+        
+        tree._finalize()
+        return tree
+    
+    def _add(self, name: str, parent: int, size: int, file_sn: int) -> int:
+        """노드 추가"""
+        index = len(self.names)
+        path = f"{self.paths[parent]}/{name}" if parent >= 0 else name
+        self.names.append(name)
+        self.parents.append(parent)
+        self.sizes.append(size)
+        self.file_sns.append(file_sn)
+        self.paths.append(path)
+        self._path_index[path] = index
+        if file_sn >= 0:
+            self._sn_index[file_sn] = index
+        return index
+    
+    def _finalize(self):
+        """디렉토리별 크기/파일 수 합계와 하위 구간 계산"""
+        count = len(self.names)
+        self.subtree_end = [index + 1 for index in range(count)]
+        self.file_counts = [1 if sn >= 0 else 0 for sn in self.file_sns]
+        # 자식이 부모보다 뒤에 있으므로 역순으로 부모에 합산
+        for index in range(count - 1, -1, -1):
+            parent = self.parents[index]
+            if parent >= 0:
+                self.sizes[parent] += self.sizes[index]
+                self.file_counts[parent] += self.file_counts[index]
+                self.subtree_end[parent] = max(self.subtree_end[parent], self.subtree_end[index])
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @property
+    def file_count(self) -> int:
+        """전체 파일 수"""
+        return len(self._sn_index)
+    
+    @property
+    def nbytes(self) -> int:
+        """메모리 사용량 근사값 (바이트)"""
+        return sum(sys.getsizeof(path) for path in self.paths) + len(self.names) * 8 * 10
+    
+    def find(self, path: str) -> Optional[int]:
+        """
+        경로로 노드 번호 조회
+        
+        Args:
+            path: 노드 경로 ("/"로 구분)
+        
+        Returns:
+            노드 번호 (없으면 None)
+        """
+        return self._path_index.get(path.strip('/'))
+    
+    def path_of(self, file_sn: int) -> Optional[str]:
+        """
+        fileSn으로 파일 경로 조회
+        
+        Args:
+            file_sn: 파일 번호
+        
+        Returns:
+            파일 경로 (없으면 None)
+        """
+        index = self._sn_index.get(int(file_sn))
+        return self.paths[index] if index is not None else None
+    
+    def node(self, index: int) -> Dict[str, Any]:
+        """
+        노드 정보
+        
+        Args:
+            index: 노드 번호
+        
+        Returns:
+            경로, 크기, fileSn(파일만), 파일 수(디렉토리만)
+        """
+        if self.file_sns[index] >= 0:
+            return {
+                'path': self.paths[index],
+                'size': self.sizes[index],
+                'file_sn': self.file_sns[index]
+            }
+        return {
+            'path': self.paths[index],
+            'size': self.sizes[index],
+            'file_count': self.file_counts[index],
+            'is_dir': True
+        }
+    
+    def _range(self, path: str = '') -> range:
+        """경로 아래 노드 번호 구간 (빈 경로는 전체)"""
+        if not path.strip('/'):
+            return range(len(self.names))
+        index = self.find(path)
+        if index is None:
+            raise KeyError(path)
+        return range(index, self.subtree_end[index])
+    
+    def files_under(self, path: str = '', offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        경로 아래 파일 (트리 순서)
+        
+        Args:
+            path: 디렉토리 또는 파일 경로 (빈 경로는 전체)
+            offset: 건너뛸 파일 수 (페이지 처리용)
+            limit: 반환할 최대 파일 수 (None이면 전부)
+        
+        Returns:
+            파일 정보 목록 (요청한 구간의 파일만 dict로 변환)
+        
+        Raises:
+            KeyError: 경로가 없을 때
+        """
+        indices = (index for index in self._range(path) if self.file_sns[index] >= 0)
+        stop = None if limit is None else offset + limit
+        return [self.node(index) for index in islice(indices, offset, stop)]
+    
+    def total_size(self, path: str = '') -> int:
+        """
+        경로 아래 파일 크기 합계
+        
+        Args:
+            path: 디렉토리 또는 파일 경로 (빈 경로는 전체)
+        
+        Returns:
+            크기 합계 (바이트)
+        
+        Raises:
+            KeyError: 경로가 없을 때
+        """
+        if not path.strip('/'):
+            return sum(size for size, parent in zip(self.sizes, self.parents) if parent < 0)
+        index = self.find(path)
+        if index is None:
+            raise KeyError(path)
+        return self.sizes[index]
+    
+    def count_files(self, path: str = '') -> int:
+        """
+        경로 아래 파일 수 (미리 합산한 디렉토리별 파일 수 사용)
+        
+        Args:
+            path: 디렉토리 또는 파일 경로 (빈 경로는 전체)
+        
+        Returns:
+            파일 수
+        
+        Raises:
+            KeyError: 경로가 없을 때
+        """
+        if not path.strip('/'):
+            return sum(count for count, parent in zip(self.file_counts, self.parents) if parent < 0)
+        index = self.find(path)
+        if index is None:
+            raise KeyError(path)
+        return self.file_counts[index]
+    
+    def _child_indices(self, path: str = '') -> Iterator[int]:
+        """경로 바로 아래 노드 번호 (자식의 하위 구간은 건너뛰어 바로 아래 노드만 방문)"""
+        if not path.strip('/'):
+            index, end = 0, len(self.names)
+        else:
+            parent = self.find(path)
+            if parent is None:
+                raise KeyError(path)
+            index, end = parent + 1, self.subtree_end[parent]
+        while index < end:
+            yield index
+            index = self.subtree_end[index]
+    
+    def children(self, path: str = '', limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        경로 바로 아래 노드
+        
+        Args:
+            path: 디렉토리 경로 (빈 경로는 최상위)
+            limit: 반환할 최대 노드 수 (None이면 전부)
+        
+        Returns:
+            노드 정보 목록
+        
+        Raises:
+            KeyError: 경로가 없을 때
+        """
+        return [self.node(index) for index in islice(self._child_indices(path), limit)]
+    
+    def count_children(self, path: str = '') -> int:
+        """
+        경로 바로 아래 노드 수
+        
+        Raises:
+            KeyError: 경로가 없을 때
+        """
+        return sum(1 for _ in self._child_indices(path))
+    
+    def summary(self, path: str = '', child_limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        경로 요약
+        
+        Args:
+            path: 디렉토리 경로 (빈 경로는 전체)
+            child_limit: children에 담을 최대 노드 수 (None이면 전부, 0이면 생략)
+        
+        Returns:
+            전체 크기, 파일 수, 바로 아래 노드 수와 노드 목록 (child_limit이 0이면 목록 생략)
+        
+        Raises:
+            KeyError: 경로가 없을 때
+        """
+        total_size = self.total_size(path)
+        data = {
+            'path': path.strip('/'),
+            'total_size': total_size,
+            'total_size_text': format_size(total_size),
+            'file_count': self.count_files(path),
+            'child_count': self.count_children(path)
+        }
+        if child_limit != 0:
+            data['children'] = self.children(path, limit=child_limit)
+        return data
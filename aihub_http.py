@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+AI-Hub HTTP 전송 계층
+requests 세션에 연결 풀 어댑터를 설정하며, requests를 불러오는 데 시간이 걸리므로
+AIHubClient가 첫 요청을 보낼 때 이 모듈을 import함
+"""
+
+from typing import List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    소켓 옵션을 지정할 수 있는 HTTP 어댑터
+    requests 기본 어댑터는 urllib3 기본 소켓 옵션만 사용하므로 연결 풀 생성 시 전달
+    """
+    
+    __attrs__ = HTTPAdapter.__attrs__ + ['socket_options']
+    
+    def __init__(self, socket_options: List[Tuple[int, int, int]], **kwargs):
+        # HTTPAdapter.__init__이 init_poolmanager를 호출하므로 먼저 설정
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault('socket_options', self.socket_options)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def create_session(
+    headers: dict,
+    socket_options: List[Tuple[int, int, int]],
+    pool_connections: int,
+    pool_maxsize: int
+) -> requests.Session:
+    """
+    연결 풀이 설정된 HTTP 세션 생성
+    
+    Args:
+        headers: 모든 요청에 보낼 헤더
+        socket_options: urllib3 socket_options 목록
+        pool_connections: 연결 풀을 유지할 호스트 수
+        pool_maxsize: 호스트별로 재사용할 최대 연결 수
+    
+    Returns:
+        헤더와 연결 풀 어댑터가 설정된 세션
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = PoolAdapter(socket_options, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
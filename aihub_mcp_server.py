@@ -4,18 +4,79 @@ AI-Hub MCP Server
 Model Context Protocol 서버로 AI-Hub API 기능을 제공
 """
 
-import json
+import asyncio
+import base64
+import hashlib
 import logging
+import os
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+import aihub_codec
 from aihub_client import AIHubClient, AIHubAPIError, AIHubAuthError
+from aihub_filetree import format_size
+from aihub_search import DatasetSearchIndex
+from aihub_snapshot import CatalogSnapshot, snapshot_path
 
 # MCP 관련 import (실제 MCP 라이브러리가 있다면 해당 라이브러리 사용)
 # from mcp import Server, Tool, Resource
 # 여기서는 MCP 서버 구조를 시뮬레이션합니다.
 
+# 페이지 크기 기본값/최대값 (응답 하나의 크기와 처리 시간을 제한)
+DATASETS_PAGE_SIZE = 100
+MAX_DATASETS_PAGE_SIZE = 1000
+FILES_PAGE_SIZE = 200
+MAX_FILES_PAGE_SIZE = 2000
+
+# stdout에 응답을 나누어 기록하는 단위 (바이트, write 호출 하나의 크기만 제한)
+WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def encode_cursor(offset: int, scope: str) -> str:
+    """
+    페이지 커서 생성
+    
+    Args:
+        offset: 다음 페이지 시작 위치
+        scope: 커서가 가리키는 대상 (목록 해시, 데이터셋 키와 경로 등)
+    
+    Returns:
+        불투명한 커서 문자열
+    """
+    tag = hashlib.sha1(scope.encode('utf-8')).hexdigest()[:12]
+    return base64.urlsafe_b64encode(f"{offset}:{tag}".encode('ascii')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str], scope: str) -> int:
+    """
+    페이지 커서 해석
+    
+    Args:
+        cursor: encode_cursor로 만든 커서 (None이면 첫 페이지)
+        scope: 커서를 만들 때의 대상
+    
+    Returns:
+        페이지 시작 위치
+    
+    Raises:
+        ValueError: 형식이 잘못되었거나 대상(목록 내용 등)이 바뀐 커서
+    """
+    if not cursor:
+        return 0
+    try:
+        text = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii')
+        offset, tag = text.split(':', 1)
+        offset = int(offset)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("invalid cursor")
+    if offset < 0 or tag != hashlib.sha1(scope.encode('utf-8')).hexdigest()[:12]:
+        raise ValueError("invalid cursor")
+    return offset
+
 
 class MCPTool:
     """MCP 도구 클래스"""
@@ -25,19 +86,254 @@ class MCPTool:
         self.parameters = parameters
 
 
+class ProgressNotifier:
+    """
+    MCP notifications/progress 전송기
+    다운로드 진행 콜백으로 사용하며, 알림이 너무 자주 전송되지 않도록
+    최소 간격(MIN_INTERVAL)이 지났거나 진행률이 MIN_PERCENT 이상 바뀐 경우에만 전송
+    """
+    
+    MIN_INTERVAL = 0.5
+    MIN_PERCENT = 1.0
+    
+    def __init__(self, progress_token: Any, send: Callable[[Dict[str, Any]], None]):
+        """
+        Args:
+            progress_token: 요청의 params._meta.progressToken
+            send: JSON-RPC 알림 메시지를 전송하는 함수 (다른 스레드에서 호출됨)
+        """
+        self.progress_token = progress_token
+        self.send = send
+        self._last_time = 0.0
+        self._last_percent = -self.MIN_PERCENT
+        self._lock = threading.Lock()
+    
+    def __call__(self, done: int, total: int):
+        """진행량 갱신 (조건을 만족하면 알림 전송)"""
+        now = time.monotonic()
+        percent = done * 100 / total if total > 0 else 0.0
+        with self._lock:
+            finished = total > 0 and done >= total
+            if not finished and now - self._last_time < self.MIN_INTERVAL \
+                    and percent - self._last_percent < self.MIN_PERCENT:
+                return
+            self._last_time = now
+            self._last_percent = percent
+        
+        params: Dict[str, Any] = {"progressToken": self.progress_token, "progress": done}
+        if total > 0:
+            params["total"] = total
+        self.send({
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": params
+        })
+
+
+class DownloadJob:
+    """백그라운드 다운로드 작업 상태"""
+    
+    def __init__(self, job_id: str, dataset_key: str, parameters: Dict[str, Any]):
+        self.job_id = job_id
+        self.dataset_key = dataset_key
+        self.parameters = parameters
+        # queued -> running -> completed / failed / cancelled
+        self.status = "queued"
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.cancel_event = threading.Event()
+        self.future: Optional[Future] = None
+    
+    def update_progress(self, done: int, total: int):
+        """다운로드 진행량 갱신 (다운로드 스레드에서 호출)"""
+        self.bytes_done = done
+        self.bytes_total = total
+    
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        작업 상태를 응답용 딕셔너리로 변환
+        
+        Returns:
+            진행량, 평균 속도(바이트/초), 남은 시간 추정치(초)를 포함한 상태
+        """
+        end = self.finished_at or time.time()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        throughput = self.bytes_done / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.status == "running" and throughput > 0 and self.bytes_total > 0:
+            eta = round(max(self.bytes_total - self.bytes_done, 0) / throughput, 1)
+        
+        data = {
+            "job_id": self.job_id,
+            "dataset_key": self.dataset_key,
+            "file_keys": self.parameters.get("file_keys"),
+            "status": self.status,
+            "bytes_done": self.bytes_done,
+            "bytes_total": self.bytes_total,
+            "percent": round(self.bytes_done * 100 / self.bytes_total, 1) if self.bytes_total else None,
+            "throughput": round(throughput),
+            "eta_seconds": eta,
+            "elapsed_seconds": round(elapsed, 1),
+            "created_at": self.created_at
+        }
+        if self.result is not None:
+            data["result"] = self.result
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+class DownloadJobManager:
+    """
+    백그라운드 다운로드 작업 관리자
+    동시에 실행할 작업 수가 제한된 작업자 풀에서 다운로드를 실행하고, 완료된 작업은
+    최근 MAX_FINISHED_JOBS개까지 상태 조회를 위해 보관
+    """
+    
+    MAX_FINISHED_JOBS = 100
+    
+    def __init__(self, max_jobs: int = 2):
+        """
+        Args:
+            max_jobs: 동시에 실행할 다운로드 작업 수
+        """
+        self.max_jobs = max_jobs
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="aihub-download")
+        self._jobs: Dict[str, DownloadJob] = {}
+        self._lock = threading.Lock()
+    
+    def submit(
+        self,
+        dataset_key: str,
+        parameters: Dict[str, Any],
+        run: Callable[[DownloadJob], Dict[str, Any]]
+    ) -> DownloadJob:
+        """
+        다운로드 작업 등록
+        
+        Args:
+            dataset_key: 데이터셋 키
+            parameters: 도구 호출 파라미터
+            run: 작업을 받아 다운로드를 실행하고 결과를 반환하는 함수
+        
+        Returns:
+            등록된 작업
+        """
+        import uuid
+        
+        job = DownloadJob(uuid.uuid4().hex[:12], dataset_key, parameters)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._prune_locked()
+        job.future = self._executor.submit(self._run, job, run)
+        return job
+    
+    def _run(self, job: DownloadJob, run: Callable[[DownloadJob], Dict[str, Any]]):
+        """작업자 스레드에서 다운로드 실행"""
+        with self._lock:
+            if job.cancel_event.is_set():
+                # cancel()이 future.cancel()보다 먼저 실행이 시작된 경우
+                job.status = "cancelled"
+                job.finished_at = time.time()
+                return
+            job.status = "running"
+            job.started_at = time.time()
+        try:
+            job.result = run(job)
+            job.status = "completed"
+        except Exception as e:
+            job.error = str(e)
+            job.status = "cancelled" if job.cancel_event.is_set() else "failed"
+            if job.status == "failed":
+                self.logger.warning(f"Download job {job.job_id} failed: {e}")
+        finally:
+            job.finished_at = time.time()
+    
+    def get(self, job_id: str) -> Optional[DownloadJob]:
+        """작업 조회 (없으면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def list(self) -> List[DownloadJob]:
+        """등록 순서대로 전체 작업 목록"""
+        with self._lock:
+            return list(self._jobs.values())
+    
+    def cancel(self, job_id: str) -> Optional[DownloadJob]:
+        """
+        작업 취소
+        대기 중인 작업은 바로 취소하고, 실행 중인 작업은 다음 청크를 받을 때 중단됨
+        
+        Args:
+            job_id: 작업 ID
+        
+        Returns:
+            취소 요청한 작업 (없으면 None)
+        """
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return job
+        with self._lock:
+            job.cancel_event.set()
+            if job.future is not None and job.future.cancel():
+                job.status = "cancelled"
+                job.finished_at = time.time()
+        return job
+    
+    def shutdown(self):
+        """실행 중인 작업을 모두 취소하고 작업자 풀 종료"""
+        for job in self.list():
+            self.cancel(job.job_id)
+        self._executor.shutdown(wait=False)
+    
+    def _prune_locked(self):
+        """오래된 완료 작업 정리"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+
 class AIHubMCPServer:
     """AI-Hub MCP 서버"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_download_jobs: Optional[int] = None):
         """
         MCP 서버 초기화
         
         Args:
             api_key: AI-Hub API 키
+            max_download_jobs: 동시에 실행할 백그라운드 다운로드 수 (None이면 환경변수 또는 2)
         """
         self.client = AIHubClient(api_key=api_key)
         self.logger = logging.getLogger(__name__)
         
+        if max_download_jobs is None:
+            max_download_jobs = int(os.getenv('AIHUB_MAX_DOWNLOAD_JOBS', '2'))
+        self.jobs = DownloadJobManager(max_jobs=max(1, max_download_jobs))
+        
+        # 카탈로그 스냅샷 (첫 list_datasets/search_datasets를 바로 처리하고, 오래되면 백그라운드에서 갱신)
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._snapshot_path: Optional[Path] = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_refreshing = False
+        # 마지막 갱신 시도 시각 (실패하거나 내용이 같아도 TTL 동안 다시 시도하지 않음)
+        self._snapshot_checked_at = 0.0
+        enabled = os.getenv('AIHUB_CATALOG_SNAPSHOT', 'true').lower() in ('1', 'true', 'yes')
+        if enabled and self.client.cache is not None:
+            self._snapshot_path = snapshot_path(self.client.cache_dir, self.client.api_key)
+            self._snapshot = CatalogSnapshot.load(self._snapshot_path)
+            self._refresh_snapshot_if_stale()
+        
         # 도구 정의
         self.tools = self._define_tools()
     
@@ -46,33 +342,124 @@ class AIHubMCPServer:
         return [
             MCPTool(
                 name="list_datasets",
-                description="AI-Hub의 전체 데이터셋 목록을 조회합니다.",
+                description="AI-Hub의 데이터셋 목록(키, 이름)을 페이지 단위로 조회합니다. 다음 페이지는 응답의 next_cursor로 조회합니다.",
                 parameters={
                     "type": "object",
-                    "properties": {},
+                    "properties": {
+                        "cursor": {
+                            "type": "string",
+                            "description": "이전 응답의 next_cursor (생략시 첫 페이지)"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": f"페이지당 데이터셋 수 (기본값: {DATASETS_PAGE_SIZE}, 최대 {MAX_DATASETS_PAGE_SIZE})",
+                            "default": DATASETS_PAGE_SIZE
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "캐시를 무시하고 서버에서 다시 확인할지 여부 (기본값: false)"
+                        }
+                    },
                     "required": []
                 }
             ),
+            MCPTool(
+                name="search_datasets",
+                description="데이터셋 이름으로 AI-Hub 데이터셋을 검색합니다. 전체 목록 대신 관련도 순으로 정렬된 결과를 페이지 단위로 반환합니다.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "검색어 (한국어/영문)"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "반환할 최대 결과 수 (기본값: 10, 최대 100)",
+                            "default": 10
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "건너뛸 결과 수 (이전 응답의 next_offset 사용)",
+                            "default": 0
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
             MCPTool(
                 name="get_dataset_info",
-                description="특정 데이터셋의 상세 정보와 파일 트리를 조회합니다.",
+                description="특정 데이터셋의 상세 정보와 파일 트리를 조회합니다. 디렉토리별 크기 합계와 파일별 경로, 크기, fileSn을 반환하며, 파일 목록은 페이지 단위로 나뉩니다(next_cursor). 바로 아래 노드 목록(children)은 첫 페이지에만 최대 limit개 포함됩니다.",
                 parameters={
                     "type": "object",
                     "properties": {
                         "dataset_key": {
                             "type": "string",
                             "description": "조회할 데이터셋의 키"
+                        },
+                        "path": {
+                            "type": "string",
+                            "description": "이 경로 아래의 파일만 조회 (생략시 전체)"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "이전 응답의 next_cursor (생략시 첫 페이지)"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": f"페이지당 파일 수 (기본값: {FILES_PAGE_SIZE}, 최대 {MAX_FILES_PAGE_SIZE})",
+                            "default": FILES_PAGE_SIZE
+                        },
+                        "include_raw": {
+                            "type": "boolean",
+                            "description": "원본 트리 텍스트도 함께 반환할지 여부 (기본값: false)"
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "캐시를 무시하고 서버에서 다시 확인할지 여부 (기본값: false)"
                         }
                     },
                     "required": ["dataset_key"]
                 }
             ),
+            MCPTool(
+                name="get_datasets_info",
+                description="여러 데이터셋의 파일 트리 요약(전체 크기, 파일 수)을 동시에 조회합니다. 데이터셋별로 성공/실패가 따로 보고됩니다.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "dataset_keys": {
+                            "type": "array",
+                            "description": "조회할 데이터셋 키 목록",
+                            "items": {"type": "string"}
+                        },
+                        "include_files": {
+                            "type": "boolean",
+                            "description": "데이터셋별 파일 목록도 함께 반환할지 여부 (기본값: false)"
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "동시에 보낼 최대 요청 수 (기본값: 8, 최대 32)"
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "캐시를 무시하고 서버에서 다시 확인할지 여부 (기본값: false)"
+                        }
+                    },
+                    "required": ["dataset_keys"]
+                }
+            ),
             MCPTool(
                 name="get_api_manual",
                 description="AI-Hub API 매뉴얼과 사용 가이드를 조회합니다.",
                 parameters={
                     "type": "object",
-                    "properties": {},
+                    "properties": {
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "캐시를 무시하고 서버에서 다시 확인할지 여부 (기본값: false)"
+                        }
+                    },
                     "required": []
                 }
             ),
@@ -99,11 +486,66 @@ class AIHubMCPServer:
                             "type": "boolean",
                             "description": "자동 압축 해제 여부 (기본값: true)",
                             "default": True
+                        },
+                        "resume": {
+                            "type": "boolean",
+                            "description": "중단된 다운로드 이어받기 여부 (부분 파일과 저널을 다운로드 경로에 보존)"
+                        },
+                        "stream_extract": {
+                            "type": "boolean",
+                            "description": "tar 파일을 디스크에 저장하지 않고 받는 즉시 압축 해제할지 여부"
+                        },
+                        "background": {
+                            "type": "boolean",
+                            "description": "백그라운드 작업으로 실행하고 작업 ID를 바로 반환할지 여부 (기본값: false)",
+                            "default": False
                         }
                     },
                     "required": ["dataset_key"]
                 }
             ),
+            MCPTool(
+                name="download_status",
+                description="백그라운드 다운로드 작업의 진행 상황(받은 바이트, 속도, 남은 시간)을 조회합니다.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "job_id": {
+                            "type": "string",
+                            "description": "download_dataset이 반환한 작업 ID"
+                        }
+                    },
+                    "required": ["job_id"]
+                }
+            ),
+            MCPTool(
+                name="list_downloads",
+                description="백그라운드 다운로드 작업 목록과 상태를 조회합니다.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "status": {
+                            "type": "string",
+                            "description": "이 상태의 작업만 조회 (queued, running, completed, failed, cancelled)"
+                        }
+                    },
+                    "required": []
+                }
+            ),
+            MCPTool(
+                name="cancel_download",
+                description="대기 중이거나 실행 중인 백그라운드 다운로드 작업을 취소합니다.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "job_id": {
+                            "type": "string",
+                            "description": "취소할 작업 ID"
+                        }
+                    },
+                    "required": ["job_id"]
+                }
+            ),
             MCPTool(
                 name="validate_api_key",
                 description="현재 설정된 API 키의 유효성을 검증합니다.",
@@ -126,26 +568,43 @@ class AIHubMCPServer:
             for tool in self.tools
         ]
     
-    def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    def execute_tool(
+        self,
+        tool_name: str,
+        parameters: Dict[str, Any],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
         """
         도구 실행
         
         Args:
             tool_name: 실행할 도구 이름
             parameters: 도구 실행 파라미터
+            progress: 진행 콜백 (완료량, 전체량) - download_dataset은 바이트,
+                get_datasets_info는 데이터셋 수 기준
             
         Returns:
             실행 결과
         """
         try:
             if tool_name == "list_datasets":
-                return self._list_datasets()
+                return self._list_datasets(parameters)
+            elif tool_name == "search_datasets":
+                return self._search_datasets(parameters)
             elif tool_name == "get_dataset_info":
                 return self._get_dataset_info(parameters)
+            elif tool_name == "get_datasets_info":
+                return self._get_datasets_info(parameters, progress)
             elif tool_name == "get_api_manual":
-                return self._get_api_manual()
+                return self._get_api_manual(parameters)
             elif tool_name == "download_dataset":
-                return self._download_dataset(parameters)
+                return self._download_dataset(parameters, progress)
+            elif tool_name == "download_status":
+                return self._download_status(parameters)
+            elif tool_name == "list_downloads":
+                return self._list_downloads(parameters)
+            elif tool_name == "cancel_download":
+                return self._cancel_download(parameters)
             elif tool_name == "validate_api_key":
                 return self._validate_api_key()
             else:
@@ -175,15 +634,153 @@ class AIHubMCPServer:
                 "error_type": "unexpected_error"
             }
     
-    def _list_datasets(self) -> Dict[str, Any]:
-        """데이터셋 목록 조회"""
-        datasets = self.client.get_datasets()
+    def _catalog_index(self, refresh: bool = False) -> DatasetSearchIndex:
+        """
+        데이터셋 검색 색인 조회
+        스냅샷이 있으면 (오래되었더라도) 바로 사용하고, 오래된 스냅샷은 백그라운드에서 갱신
+        
+        Args:
+            refresh: True면 스냅샷을 사용하지 않고 데이터셋 목록을 서버에 재검증
+        
+        Returns:
+            검색 색인
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and not refresh:
+            self._refresh_snapshot_if_stale()
+            return snapshot.index
+        
+        index = self.client.get_search_index(refresh=refresh)
+        if self._snapshot_path is not None:
+            self._save_snapshot(index)
+        return index
+    
+    def _catalog_entries(self, refresh: bool = False) -> Tuple[List[Dict[str, str]], str]:
+        """
+        데이터셋 목록 조회 (스냅샷이 있으면 검색용 역색인은 디코딩하지 않음)
+        
+        Args:
+            refresh: True면 스냅샷을 사용하지 않고 데이터셋 목록을 서버에 재검증
+        
+        Returns:
+            ({'dataset_key', 'name'} 목록, 목록 해시)
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and not refresh:
+            self._refresh_snapshot_if_stale()
+            return snapshot.entries, snapshot.digest
+        index = self._catalog_index(refresh=refresh)
+        return index.entries, index.digest
+    
+    def _catalog_datasets(self, refresh: bool = False) -> Dict[str, Any]:
+        """데이터셋 목록 응답 (스냅샷이 있으면 스냅샷에서)"""
+        snapshot = self._snapshot
+        if snapshot is not None and not refresh:
+            return snapshot.datasets
+        return self.client.get_datasets(refresh=refresh)
+    
+    def _save_snapshot(self, index: DatasetSearchIndex):
+        """
+        색인을 만든 데이터셋 목록을 스냅샷으로 저장
+        (디스크 캐시 항목의 본문과 ETag, 조회 시각을 함께 기록)
+        """
+        entry = self.client.get_datasets_cache_entry()
+        if entry is None:
+            return
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.digest == index.digest and snapshot.fetched_at >= entry['fetched_at']:
+            return
+        try:
+            self._snapshot = CatalogSnapshot.write(
+                self._snapshot_path,
+                entry['body'],
+                index,
+                etag=entry['etag'],
+                last_modified=entry['last_modified'],
+                fetched_at=entry['fetched_at']
+            )
+        except OSError as e:
+            self.logger.warning(f"Catalog snapshot save failed: {e}")
+    
+    def _refresh_snapshot_if_stale(self):
+        """스냅샷이 캐시 TTL보다 오래되었으면 백그라운드 갱신 시작 (한 번에 하나만)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        checked_at = max(snapshot.fetched_at, self._snapshot_checked_at)
+        if time.time() - checked_at < self.client.cache.ttl:
+            return
+        with self._snapshot_lock:
+            if self._snapshot_refreshing:
+                return
+            self._snapshot_refreshing = True
+            self._snapshot_checked_at = time.time()
+        threading.Thread(target=self._refresh_snapshot, name="aihub-snapshot", daemon=True).start()
+    
+    def _refresh_snapshot(self):
+        """데이터셋 목록을 재검증(ETag)하고 스냅샷 갱신"""
+        try:
+            # 메모리 캐시의 색인을 그대로 받으면 조회 시각이 바뀌지 않으므로 서버에 재검증
+            # (304면 디스크 캐시의 조회 시각만 갱신되어 스냅샷에도 기록됨)
+            self._save_snapshot(self.client.get_search_index(refresh=True))
+        except AIHubAPIError as e:
+            # 캐시 TTL이 지난 뒤 다시 시도하며, 그동안은 이전 스냅샷으로 응답
+            self.logger.warning(f"Catalog snapshot refresh failed: {e}")
+        except Exception:
+            self.logger.exception("Catalog snapshot refresh failed")
+        finally:
+            with self._snapshot_lock:
+                self._snapshot_refreshing = False
+    
+    def _list_datasets(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """데이터셋 목록 조회 (페이지 단위)"""
+        refresh = parameters.get("refresh", False)
+        entries, digest = self._catalog_entries(refresh=refresh)
+        if not entries:
+            # 목록 형식을 해석하지 못한 응답은 그대로 반환
+            return {
+                "success": True,
+                "data": self._catalog_datasets(refresh=refresh),
+                "tool": "list_datasets"
+            }
+        
+        limit = min(max(int(parameters.get("limit", DATASETS_PAGE_SIZE)), 1), MAX_DATASETS_PAGE_SIZE)
+        try:
+            # 목록이 바뀌면 이전 커서는 무효 (같은 위치가 다른 데이터셋을 가리키므로)
+            offset = decode_cursor(parameters.get("cursor"), digest)
+        except ValueError:
+            return self._invalid_cursor()
+        
+        end = offset + limit
         return {
             "success": True,
-            "data": datasets,
+            "data": {
+                "total": len(entries),
+                "datasets": entries[offset:end],
+                "next_cursor": encode_cursor(end, digest) if end < len(entries) else None
+            },
             "tool": "list_datasets"
         }
     
+    def _search_datasets(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """데이터셋 검색"""
+        query = parameters.get("query")
+        if not query:
+            return {
+                "success": False,
+                "error": "query parameter is required",
+                "error_type": "missing_parameter"
+            }
+        
+        limit = min(max(int(parameters.get("limit", 10)), 1), 100)
+        offset = max(int(parameters.get("offset", 0)), 0)
+        results = self._catalog_index().search(query, limit=limit, offset=offset)
+        return {
+            "success": True,
+            "data": {"query": query, **results},
+            "tool": "search_datasets"
+        }
+    
     def _get_dataset_info(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """데이터셋 정보 조회"""
         dataset_key = parameters.get("dataset_key")
@@ -194,24 +791,128 @@ class AIHubMCPServer:
                 "error_type": "missing_parameter"
             }
         
-        dataset_info = self.client.get_dataset_info(dataset_key)
+        refresh = parameters.get("refresh", False)
+        tree = self.client.get_dataset_file_tree(dataset_key, refresh=refresh)
+        if not len(tree):
+            # 트리 텍스트가 아닌 응답은 그대로 반환
+            dataset_info = self.client.get_dataset_info(dataset_key)
+            return {
+                "success": True,
+                "data": dataset_info,
+                "dataset_key": dataset_key,
+                "tool": "get_dataset_info"
+            }
+        
+        path = parameters.get("path") or ""
+        limit = min(max(int(parameters.get("limit", FILES_PAGE_SIZE)), 1), MAX_FILES_PAGE_SIZE)
+        scope = f"{dataset_key}:{path.strip('/')}"
+        try:
+            offset = decode_cursor(parameters.get("cursor"), scope)
+        except ValueError:
+            return self._invalid_cursor()
+        try:
+            # 바로 아래 노드 목록은 첫 페이지에만 최대 limit개 포함 (전체 수는 child_count)
+            data = tree.summary(path, child_limit=limit if offset == 0 else 0)
+            data["files"] = tree.files_under(path, offset=offset, limit=limit)
+        except KeyError:
+            return {
+                "success": False,
+                "error": f"Path not found: {path}",
+                "error_type": "invalid_parameter"
+            }
+        end = offset + limit
+        data["next_cursor"] = encode_cursor(end, scope) if end < data["file_count"] else None
+        if parameters.get("include_raw", False):
+            data["raw_response"] = self.client.get_dataset_info(dataset_key).get("raw_response")
+        
         return {
             "success": True,
-            "data": dataset_info,
+            "data": data,
             "dataset_key": dataset_key,
             "tool": "get_dataset_info"
         }
     
-    def _get_api_manual(self) -> Dict[str, Any]:
+    @staticmethod
+    def _invalid_cursor() -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": "Invalid or expired cursor; request the first page again",
+            "error_type": "invalid_parameter"
+        }
+    
+    def _get_datasets_info(
+        self,
+        parameters: Dict[str, Any],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """여러 데이터셋 정보 동시 조회"""
+        dataset_keys = parameters.get("dataset_keys")
+        if isinstance(dataset_keys, str):
+            dataset_keys = [key.strip() for key in dataset_keys.split(",") if key.strip()]
+        if not dataset_keys:
+            return {
+                "success": False,
+                "error": "dataset_keys parameter is required",
+                "error_type": "missing_parameter"
+            }
+        
+        dataset_keys = list(dict.fromkeys(str(key) for key in dataset_keys))
+        max_concurrency = min(max(int(parameters.get("max_concurrency", 8)), 1), 32)
+        include_files = parameters.get("include_files", False)
+        results = []
+        errors = []
+        fetched = self.client.iter_datasets_info(
+            dataset_keys,
+            max_workers=max_concurrency,
+            refresh=parameters.get("refresh", False),
+            file_tree=True
+        )
+        for done, (dataset_key, tree, error) in enumerate(fetched, 1):
+            if error is not None:
+                errors.append({
+                    "dataset_key": dataset_key,
+                    "error": str(error),
+                    "error_type": "authentication_error" if isinstance(error, AIHubAuthError) else "api_error"
+                })
+            elif not len(tree):
+                # 트리 텍스트가 아닌 응답은 그대로 반환
+                results.append({"dataset_key": dataset_key, "data": self.client.get_dataset_info(dataset_key)})
+            else:
+                item = {
+                    "dataset_key": dataset_key,
+                    "total_size": tree.total_size(),
+                    "total_size_text": format_size(tree.total_size()),
+                    "file_count": tree.file_count
+                }
+                if include_files:
+                    item["files"] = tree.files_under()
+                results.append(item)
+            if progress is not None:
+                progress(done, len(dataset_keys))
+        
+        return {
+            "success": True,
+            "data": {
+                "results": results,
+                "errors": errors
+            },
+            "tool": "get_datasets_info"
+        }
+    
+    def _get_api_manual(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """API 매뉴얼 조회"""
-        manual = self.client.get_api_manual()
+        manual = self.client.get_api_manual(refresh=parameters.get("refresh", False))
         return {
             "success": True,
             "data": manual,
             "tool": "get_api_manual"
         }
     
-    def _download_dataset(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    def _download_dataset(
+        self,
+        parameters: Dict[str, Any],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
         """데이터셋 다운로드"""
         dataset_key = parameters.get("dataset_key")
         if not dataset_key:
@@ -221,24 +922,103 @@ class AIHubMCPServer:
                 "error_type": "missing_parameter"
             }
         
-        file_keys = parameters.get("file_keys")
-        output_path = parameters.get("output_path")
-        extract = parameters.get("extract", True)
-        
-        result = self.client.download_dataset(
-            dataset_key=dataset_key,
-            file_keys=file_keys,
-            output_path=output_path,
-            extract=extract,
-            show_progress=False  # MCP에서는 진행률 표시 비활성화
-        )
+        if parameters.get("background", False):
+            job = self.jobs.submit(
+                dataset_key,
+                parameters,
+                lambda job: self._run_download(parameters, job.update_progress, job.cancel_event)
+            )
+            return {
+                "success": True,
+                "data": job.to_dict(),
+                "tool": "download_dataset"
+            }
         
+        result = self._run_download(parameters, progress)
         return {
             "success": True,
             "data": result,
             "tool": "download_dataset"
         }
     
+    def _run_download(
+        self,
+        parameters: Dict[str, Any],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """download_dataset 도구 파라미터로 다운로드 실행"""
+        return self.client.download_dataset(
+            dataset_key=parameters["dataset_key"],
+            file_keys=parameters.get("file_keys"),
+            output_path=parameters.get("output_path"),
+            extract=parameters.get("extract", True),
+            show_progress=False,  # MCP에서는 진행률 표시 비활성화
+            resume=parameters.get("resume"),
+            stream_extract=parameters.get("stream_extract"),
+            progress_callback=progress_callback,
+            cancel_event=cancel_event
+        )
+    
+    def _download_status(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """백그라운드 다운로드 상태 조회"""
+        job_id = parameters.get("job_id")
+        if not job_id:
+            return {
+                "success": False,
+                "error": "job_id parameter is required",
+                "error_type": "missing_parameter"
+            }
+        
+        job = self.jobs.get(job_id)
+        if job is None:
+            return {
+                "success": False,
+                "error": f"Download job not found: {job_id}",
+                "error_type": "invalid_parameter"
+            }
+        return {
+            "success": True,
+            "data": job.to_dict(),
+            "tool": "download_status"
+        }
+    
+    def _list_downloads(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """백그라운드 다운로드 목록 조회"""
+        status = parameters.get("status")
+        jobs = [job.to_dict() for job in self.jobs.list() if not status or job.status == status]
+        return {
+            "success": True,
+            "data": {
+                "max_jobs": self.jobs.max_jobs,
+                "jobs": jobs
+            },
+            "tool": "list_downloads"
+        }
+    
+    def _cancel_download(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """백그라운드 다운로드 취소"""
+        job_id = parameters.get("job_id")
+        if not job_id:
+            return {
+                "success": False,
+                "error": "job_id parameter is required",
+                "error_type": "missing_parameter"
+            }
+        
+        job = self.jobs.cancel(job_id)
+        if job is None:
+            return {
+                "success": False,
+                "error": f"Download job not found: {job_id}",
+                "error_type": "invalid_parameter"
+            }
+        return {
+            "success": True,
+            "data": job.to_dict(),
+            "tool": "cancel_download"
+        }
+    
     def _validate_api_key(self) -> Dict[str, Any]:
         """API 키 유효성 검증"""
         is_valid = self.client.validate_api_key()
@@ -255,19 +1035,52 @@ class AIHubMCPServer:
 class MCPServerProtocol:
     """MCP 서버 프로토콜 시뮬레이션"""
     
-    def __init__(self, aihub_server: AIHubMCPServer):
+    def __init__(self, aihub_server: AIHubMCPServer, batch_workers: int = 8, compact: bool = False):
+        """
+        Args:
+            aihub_server: AI-Hub MCP 서버
+            batch_workers: 배치 요청 안의 호출을 동시에 실행할 작업자 수
+            compact: 도구 결과를 들여쓰기 없이 직렬화할지 여부 (응답 크기 감소)
+        """
         self.aihub_server = aihub_server
+        self.batch_workers = batch_workers
+        self.compact = compact
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_lock = threading.Lock()
     
-    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def handle_request(
+        self,
+        request: Union[Dict[str, Any], List[Any]],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         MCP 요청 처리
         
         Args:
-            request: MCP 요청
+            request: MCP 요청 또는 JSON-RPC 배치 요청 (요청 객체 배열)
+            notify: 요청 처리 중 JSON-RPC 알림을 전송하는 함수
+                (지정하고 요청에 params._meta.progressToken이 있으면 진행 알림 전송)
             
         Returns:
-            MCP 응답
+            MCP 응답 (배치 요청이면 응답 배열, 응답할 항목이 없는 배치면 None)
         """
+        if isinstance(request, list):
+            return self.handle_batch(request, notify)
+        if not isinstance(request, dict):
+            return self._invalid_request()
+        
+        response = self._handle_message(request, notify)
+        # id가 없는 알림에는 응답하지 않음 (JSON-RPC 2.0)
+        if self._is_notification(request):
+            return None
+        return response
+    
+    def _handle_message(
+        self,
+        request: Dict[str, Any],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """요청 객체 하나를 메서드별로 처리"""
         method = request.get("method")
         params = request.get("params", {})
         request_id = request.get("id")
@@ -286,7 +1099,12 @@ class MCPServerProtocol:
                 tool_name = params.get("name")
                 arguments = params.get("arguments", {})
                 
-                result = self.aihub_server.execute_tool(tool_name, arguments)
+                progress = None
+                progress_token = (params.get("_meta") or {}).get("progressToken")
+                if notify is not None and progress_token is not None:
+                    progress = ProgressNotifier(progress_token, notify)
+                
+                result = self.aihub_server.execute_tool(tool_name, arguments, progress)
                 
                 return {
                     "jsonrpc": "2.0",
@@ -295,7 +1113,7 @@ class MCPServerProtocol:
                         "content": [
                             {
                                 "type": "text",
-                                "text": json.dumps(result, indent=2, ensure_ascii=False)
+                                "text": aihub_codec.dumps(result, indent=not self.compact)
                             }
                         ]
                     }
@@ -317,6 +1135,14 @@ class MCPServerProtocol:
                     }
                 }
             
+            elif method == "notifications/initialized":
+                # 초기화 완료 알림 (처리할 내용 없음, id 없이 오면 응답도 생략)
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": {}
+                }
+            
             else:
                 return {
                     "jsonrpc": "2.0",
@@ -336,20 +1162,190 @@ class MCPServerProtocol:
                     "message": f"Internal error: {str(e)}"
                 }
             }
+    
+    
+    def handle_batch(
+        self,
+        requests: List[Any],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        JSON-RPC 배치 요청 처리
+        배치 안의 요청은 서로 독립적이므로 작업자 풀에서 동시에 실행하고,
+        응답은 요청 순서대로 하나의 배열로 반환 (id가 없는 알림은 응답 생략)
+        
+        Args:
+            requests: 요청 객체 배열
+            notify: 요청 처리 중 JSON-RPC 알림을 전송하는 함수
+            
+        Returns:
+            응답 배열 (빈 배치는 오류 응답, 모두 알림이면 None)
+        """
+        if not requests:
+            return self._invalid_request()
+        
+        if len(requests) == 1:
+            responses = [self._handle_batch_item(requests[0], notify)]
+        else:
+            executor = self._get_batch_executor()
+            responses = list(executor.map(lambda item: self._handle_batch_item(item, notify), requests))
+        
+        responses = [response for response in responses if response is not None]
+        return responses or None
+    
+    def _handle_batch_item(
+        self,
+        request: Any,
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """배치 항목 하나 처리 (중첩 배열은 허용하지 않음, 알림이면 None)"""
+        if not isinstance(request, dict):
+            return self._invalid_request()
+        return self.handle_request(request, notify)
+    
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        """배치 작업자 풀 (처음 사용할 때 생성)"""
+        with self._batch_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.batch_workers),
+                    thread_name_prefix="aihub-batch"
+                )
+            return self._batch_executor
+    
+    def close(self):
+        """배치 작업자 풀과 백그라운드 다운로드 작업 종료"""
+        self.aihub_server.jobs.shutdown()
+        with self._batch_lock:
+            if self._batch_executor is not None:
+                self._batch_executor.shutdown(wait=False)
+                self._batch_executor = None
+    
+    @staticmethod
+    def _is_notification(request: Any) -> bool:
+        """id가 없는 JSON-RPC 알림인지 여부"""
+        return isinstance(request, dict) and "method" in request and "id" not in request
+    
+    @staticmethod
+    def _invalid_request() -> Dict[str, Any]:
+        return {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": -32600,
+                "message": "Invalid Request"
+            }
+        }
 
 
-def create_mcp_server(api_key: Optional[str] = None) -> MCPServerProtocol:
+def create_mcp_server(api_key: Optional[str] = None, compact: Optional[bool] = None) -> MCPServerProtocol:
     """
     MCP 서버 생성
     
     Args:
         api_key: AI-Hub API 키
+        compact: 도구 결과를 들여쓰기 없이 직렬화할지 여부 (None이면 환경변수 AIHUB_MCP_COMPACT)
         
     Returns:
         MCP 서버 프로토콜
     """
+    if compact is None:
+        compact = os.getenv('AIHUB_MCP_COMPACT', 'false').lower() in ('1', 'true', 'yes')
     aihub_server = AIHubMCPServer(api_key=api_key)
-    return MCPServerProtocol(aihub_server)
+    return MCPServerProtocol(aihub_server, compact=compact)
+
+
+def write_message(stream, message: Union[Dict[str, Any], List[Dict[str, Any]]]):
+    """
+    JSON-RPC 메시지를 한 줄로 기록
+    바이너리 버퍼가 있는 스트림(stdout)에는 인코딩한 바이트를 문자열로 바꾸지 않고
+    WRITE_CHUNK_SIZE 단위로 나누어 기록함. 메시지 전체를 먼저 인코딩하므로 나누어 쓰는 것은
+    write 호출 하나의 크기만 제한하며, 메모리 사용량은 도구 결과의 페이지 크기로 제한됨
+    (도구 결과 텍스트가 이미 메시지 안의 문자열이라 점진적 인코딩으로도 줄지 않음)
+    
+    Args:
+        stream: 출력 스트림 (stdout)
+        message: JSON-RPC 메시지
+    """
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(aihub_codec.dumps(message) + "\n")
+        stream.flush()
+        return
+    
+    data = memoryview(aihub_codec.dumpb(message))
+    # 텍스트 계층에 남아 있는 출력을 먼저 내보내 순서를 유지
+    stream.flush()
+    for start in range(0, len(data), WRITE_CHUNK_SIZE):
+        buffer.write(data[start:start + WRITE_CHUNK_SIZE])
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+async def serve_stdio(mcp_server: MCPServerProtocol, max_workers: int = 4):
+    """
+    stdin/stdout JSON-RPC 서버 루프 (asyncio)
+    
+    stdin은 별도 스레드에서 읽어 이벤트 루프를 막지 않고, tools/call 요청은
+    크기가 제한된 작업자 풀에서 동시에 실행합니다. 응답은 완료되는 순서대로
+    기록되며 클라이언트는 id로 요청과 응답을 대응시킵니다. 배치 요청(배열)은
+    안의 호출을 동시에 실행한 뒤 응답 배열 하나로 보냅니다. 요청에
+    progressToken이 있으면 처리 중에 notifications/progress 알림을 보냅니다.
+    
+    Args:
+        mcp_server: MCP 서버 프로토콜
+        max_workers: 동시에 실행할 도구 호출 수
+    """
+    loop = asyncio.get_running_loop()
+    # 요청 줄은 디코딩 없이 바이트로 읽어 JSON 코덱에 바로 전달
+    stdin = getattr(sys.stdin, "buffer", sys.stdin)
+    # stdin 읽기 전용 스레드 (도구 실행 작업자와 분리)
+    stdin_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aihub-stdin")
+    tool_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aihub-tool")
+    writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aihub-stdout")
+    write_lock = asyncio.Lock()
+    pending = set()
+    
+    async def write_response(response: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        async with write_lock:
+            # 큰 응답을 쓰는 동안에도 이벤트 루프가 다른 요청을 받을 수 있도록 기록 스레드에서 실행
+            await loop.run_in_executor(writer_executor, write_message, sys.stdout, response)
+    
+    def notify(message: Dict[str, Any]):
+        # 작업자 스레드에서 호출되므로 이벤트 루프에 전송을 예약
+        asyncio.run_coroutine_threadsafe(write_response(message), loop)
+    
+    async def dispatch(request: Union[Dict[str, Any], List[Any]]):
+        if isinstance(request, list) or (isinstance(request, dict) and request.get("method") == "tools/call"):
+            # 오래 걸리는 도구 호출과 배치 요청은 작업자 풀에서 실행
+            response = await loop.run_in_executor(tool_executor, mcp_server.handle_request, request, notify)
+        else:
+            response = mcp_server.handle_request(request)
+        if response is not None:
+            await write_response(response)
+    
+    try:
+        while True:
+            line = await loop.run_in_executor(stdin_executor, stdin.readline)
+            if not line:
+                break
+            try:
+                request = aihub_codec.loads(line)
+            except ValueError:
+                continue
+            
+            task = asyncio.ensure_future(dispatch(request))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        
+        # stdin이 닫히면 실행 중인 요청의 응답을 모두 보낸 뒤 종료
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        mcp_server.close()
+        tool_executor.shutdown(wait=False)
+        writer_executor.shutdown(wait=True)
+        stdin_executor.shutdown(wait=False)
 
 
 def main():
@@ -359,6 +1355,18 @@ def main():
     parser = argparse.ArgumentParser(description="AI-Hub MCP Server")
     parser.add_argument("--api-key", help="AI-Hub API key")
     parser.add_argument("--test", action="store_true", help="Run in test mode")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=int(os.getenv("AIHUB_MCP_MAX_WORKERS", "4")),
+        help="Maximum number of concurrent tool calls"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        default=None,
+        help="Serialize tool results without indentation"
+    )
     args = parser.parse_args()
     
     # 로깅 설정
@@ -369,7 +1377,7 @@ def main():
     
     try:
         # MCP 서버 생성
-        mcp_server = create_mcp_server(api_key=args.api_key)
+        mcp_server = create_mcp_server(api_key=args.api_key, compact=args.compact)
         
         if args.test:
             # 테스트 모드
@@ -407,16 +1415,10 @@ def main():
             # 실제 MCP 서버 모드 (stdin/stdout을 통한 JSON-RPC)
             print("🚀 AI-Hub MCP Server starting...", file=sys.stderr)
             
-            for line in sys.stdin:
-                try:
-                    request = json.loads(line.strip())
-                    response = mcp_server.handle_request(request)
-                    print(json.dumps(response, ensure_ascii=False))
-                    sys.stdout.flush()
-                except json.JSONDecodeError:
-                    continue
-                except KeyboardInterrupt:
-                    break
+            try:
+                asyncio.run(serve_stdio(mcp_server, max_workers=max(1, args.max_workers)))
+            except KeyboardInterrupt:
+                pass
                     
     except Exception as e:
         print(f"❌ MCP Server error: {e}", file=sys.stderr)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+AI-Hub API 요청 속도 제한
+토큰 버킷으로 초당 요청 수를 제한하며,
+파일 잠금을 사용하면 같은 호스트의 여러 프로세스가 하나의 예산을 공유
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# 공유 토큰 버킷 파일 형식: (남은 토큰, 마지막 갱신 시각)
+_BUCKET_STATE = struct.Struct('<dd')
+
+
+def shared_name(category: str, api_key: str) -> str:
+    """
+    공유 예산 파일 이름 (API 키별로 분리, 키는 해시로만 기록)
+    
+    Args:
+        category: 예산 종류 ('metadata' 또는 'download')
+        api_key: AI-Hub API 키
+    
+    Returns:
+        파일 이름 접두사
+    """
+    digest = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:12]
+    return f"{category}-{digest}"
+
+
+class TokenBucket:
+    """
+    프로세스 내 토큰 버킷 (스레드 안전)
+    초당 rate개의 토큰이 최대 burst개까지 쌓이며, 요청마다 토큰 1개를 사용
+    """
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 한꺼번에 허용할 최대 요청 수 (None이면 max(1, rate))
+        """
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        토큰 1개 사용 시도
+        
+        Returns:
+            0이면 토큰을 사용함, 양수면 다시 시도하기 전까지 기다릴 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+    
+    def acquire(self):
+        """토큰을 얻을 때까지 대기"""
+        while True:
+            wait = self.reserve()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    파일 잠금으로 여러 프로세스가 공유하는 토큰 버킷
+    버킷 상태(남은 토큰, 갱신 시각)를 작은 파일에 저장하고 flock으로 보호
+    """
+    
+    def __init__(self, path: Path, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            path: 버킷 상태 파일 경로
+            rate: 초당 허용 요청 수 (모든 프로세스 합계)
+            burst: 한꺼번에 허용할 최대 요청 수
+        """
+        super().__init__(rate, burst)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+    
+    def reserve(self) -> float:
+        """
+        토큰 1개 사용 시도 (프로세스 간 공유)
+        
+        Returns:
+            0이면 토큰을 사용함, 양수면 다시 시도하기 전까지 기다릴 시간 (초)
+        """
+        # 같은 프로세스의 스레드끼리는 먼저 직렬화하여 잠금 경합을 줄임
+        with self._lock:
+            fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                data = os.pread(fd, _BUCKET_STATE.size, 0)
+                # 프로세스 사이에서 비교해야 하므로 단조 시계 대신 벽시계 사용
+                now = time.time()
+                if len(data) == _BUCKET_STATE.size:
+                    tokens, updated = _BUCKET_STATE.unpack(data)
+                    tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+                else:
+                    tokens = float(self.burst)
+                if tokens >= 1:
+                    tokens -= 1
+                    wait = 0.0
+                else:
+                    wait = (1 - tokens) / self.rate
+                os.pwrite(fd, _BUCKET_STATE.pack(tokens, now), 0)
+                return wait
+            finally:
+                # 파일을 닫으면 잠금도 해제됨
+                os.close(fd)
+
+
+def create_rate_limiter(
+    rate: float,
+    burst: Optional[int] = None,
+    shared_path: Optional[Path] = None
+) -> Optional[TokenBucket]:
+    """
+    토큰 버킷 생성
+    
+    Args:
+        rate: 초당 허용 요청 수 (0 이하면 제한 없음)
+        burst: 한꺼번에 허용할 최대 요청 수
+        shared_path: 여러 프로세스가 공유할 버킷 상태 파일 경로 (None이면 프로세스 내)
+    
+    Returns:
+        토큰 버킷 (제한이 없으면 None)
+    """
+    if rate <= 0:
+        return None
+    if shared_path is not None:
+        if fcntl is not None:
+            return FileTokenBucket(shared_path, rate, burst)
+        logging.getLogger(__name__).warning("File locks are not supported on this platform; rate limit is per-process")
+    return TokenBucket(rate, burst)
+
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+AI-Hub API 재시도 정책
+일시적인 게이트웨이 오류(502/503/504, 429)와 네트워크 오류를 지수 백오프와
+지터로 재시도하고, 재시도 예산으로 재시도가 서버 부하를 키우지 않도록 제한
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import FrozenSet, Iterable, Optional
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 재시도해도 안전한(멱등) HTTP 메서드
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 값을 대기 시간(초)으로 변환
+    
+    Args:
+        value: 헤더 값 (초 단위 숫자 또는 HTTP 날짜)
+    
+    Returns:
+        대기 시간 (알 수 없는 형식이면 None)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    # HTTP 날짜 형식은 드물므로 email 패키지는 필요할 때만 import
+    from email.utils import parsedate_to_datetime
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    엔드포인트별 재시도 정책
+    attempt번째 실패 후 대기 시간은 [0, min(backoff_max, backoff_base * 2^(attempt-1))]
+    구간의 균등 난수(full jitter)이며, 서버가 Retry-After를 보내면 그 값을 우선 사용
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0
+    ):
+        """
+        Args:
+            max_attempts: 첫 요청을 포함한 최대 시도 횟수 (1이면 재시도 안 함)
+            backoff_base: 첫 재시도의 최대 대기 시간 (초)
+            backoff_max: 대기 시간 상한 (초)
+            retry_statuses: 재시도할 HTTP 상태 코드
+            methods: 재시도할 HTTP 메서드 (기본값: 멱등 메서드만)
+            respect_retry_after: Retry-After 헤더를 따를지 여부
+            max_retry_after: 이보다 긴 Retry-After는 재시도하지 않음 (초)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.methods: FrozenSet[str] = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+    
+    def allows(self, method: str, attempt: int) -> bool:
+        """
+        attempt번째 시도가 실패한 뒤 재시도할 수 있는지 여부
+        
+        Args:
+            method: HTTP 메서드
+            attempt: 방금 실패한 시도 번호 (1부터)
+        
+        Returns:
+            재시도 가능 여부
+        """
+        return attempt < self.max_attempts and method.upper() in self.methods
+    
+    def should_retry_status(self, status_code: int) -> bool:
+        """재시도할 상태 코드인지 여부"""
+        return status_code in self.retry_statuses
+    
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        재시도 전 대기 시간
+        
+        Args:
+            attempt: 방금 실패한 시도 번호 (1부터)
+            retry_after: 응답의 Retry-After 헤더 값
+        
+        Returns:
+            대기 시간 (초, Retry-After가 max_retry_after보다 길면 None - 재시도하지 않음)
+        """
+        if self.respect_retry_after:
+            wait = parse_retry_after(retry_after)
+            if wait is not None:
+                return wait if wait <= self.max_retry_after else None
+        cap = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
+
+
+class RetryBudget:
+    """
+    재시도 예산 (스레드 안전)
+    최근 window초 동안 재시도 횟수가 min_retries + ratio * 요청 수를 넘지 않도록 제한하여
+    서버 장애 시 모든 요청이 재시도로 몰려 부하를 키우는 것을 방지
+    """
+    
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        """
+        Args:
+            ratio: 요청 수 대비 허용할 재시도 비율
+            min_retries: 요청 수와 관계없이 window 동안 허용할 재시도 수
+            window: 집계 구간 (초)
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+        self._lock = threading.Lock()
+    
+    def record_request(self):
+        """요청 1회 기록"""
+        with self._lock:
+            now = time.monotonic()
+            self._requests.append(now)
+            self._expire_locked(now)
+    
+    def try_acquire(self) -> bool:
+        """
+        재시도 1회 사용
+        
+        Returns:
+            예산이 남아 있어 재시도할 수 있으면 True
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire_locked(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+    
+    def _expire_locked(self, now: float):
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
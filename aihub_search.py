@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+AI-Hub 데이터셋 검색 색인
+데이터셋 목록(/info/dataset.do)으로 역색인을 만들어 디스크에 저장하고,
+한국어(음절 bigram)와 영문/숫자 단어 기준으로 순위가 매겨진 검색 결과를 제공
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 색인 파일 형식 버전 (형식이 바뀌면 기존 색인을 다시 만듦)
+INDEX_VERSION = 1
+
+# 데이터셋 목록 줄 형식: "593, 소음 환경 음성인식 데이터"
+_CATALOG_LINE_PATTERN = re.compile(r'^\s*(?P<key>\d+)\s*,\s*(?P<name>.+?)\s*$')
+
+# 한글 음절 또는 영문/숫자 연속 구간
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+# BM25 파라미터
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰 분리
+    한글은 조사/어미가 붙어도 찾을 수 있도록 음절 bigram으로 나누고,
+    한 음절 단어는 그대로 사용. 영문/숫자는 단어 단위로 사용.
+    
+    Args:
+        text: 원문
+    
+    Returns:
+        토큰 목록
+    """
+    tokens = []
+    for word in _TOKEN_PATTERN.findall(text.lower()):
+        if '가' <= word[0] <= '힣':
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def parse_catalog(datasets: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    데이터셋 목록 응답을 (데이터셋 키, 이름) 목록으로 변환
+    
+    Args:
+        datasets: AIHubClient.get_datasets() 결과
+    
+    Returns:
+        {'dataset_key', 'name'} 목록
+    """
+    entries = []
+    if isinstance(datasets, dict) and 'raw_response' in datasets:
+        for line in datasets['raw_response'].splitlines():
+            match = _CATALOG_LINE_PATTERN.match(line)
+            if match:
+                entries.append({'dataset_key': match.group('key'), 'name': match.group('name')})
+        return entries
+    
+    # JSON 응답: 데이터셋 항목 목록으로 가정
+    items = datasets
+    if isinstance(datasets, dict):
+        items = next((value for value in datasets.values() if isinstance(value, list)), [])
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        key = item.get('datasetKey', item.get('dataset_key', item.get('key')))
+        name = item.get('datasetName', item.get('dataset_name', item.get('name')))
+        if key is not None and name:
+            entries.append({'dataset_key': str(key), 'name': str(name)})
+    return entries
+
+
+def catalog_digest(datasets: Dict[str, Any]) -> str:
+    """
+    데이터셋 목록 내용 해시 (색인 재생성 여부 판단용)
+    
+    Args:
+        datasets: AIHubClient.get_datasets() 결과
+    
+    Returns:
+        SHA-1 16진수 문자열
+    """
+    body = json.dumps(datasets, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(body.encode('utf-8')).hexdigest()
+
+
+class DatasetSearchIndex:
+    """
+    데이터셋 검색 역색인
+    토큰 -> [(문서 번호, 출현 횟수)] 목록과 문서 길이를 보관하고 BM25로 순위 계산
+    """
+    
+    def __init__(
+        self,
+        entries: List[Dict[str, str]],
+        postings: Dict[str, List[List[int]]],
+        lengths: List[int],
+        digest: str = ''
+    ):
+        """
+        Args:
+            entries: 데이터셋 목록
+            postings: 토큰별 [문서 번호, 출현 횟수] 목록
+            lengths: 문서별 토큰 수
+            digest: 색인을 만든 데이터셋 목록 해시
+        """
+        self.entries = entries
+        self.postings = postings
+        self.lengths = lengths
+        self.digest = digest
+        self.average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+    
+    @classmethod
+    def build(cls, entries: List[Dict[str, str]], digest: str = '') -> 'DatasetSearchIndex':
+        """
+        색인 생성
+        
+        Args:
+            entries: 데이터셋 목록
+            digest: 데이터셋 목록 해시
+        
+        Returns:
+            검색 색인
+        """
+        postings: Dict[str, List[List[int]]] = {}
+        lengths = []
+        for doc_id, entry in enumerate(entries):
+            tokens = tokenize(f"{entry['dataset_key']} {entry['name']}")
+            lengths.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                postings.setdefault(token, []).append([doc_id, count])
+        return cls(entries, postings, lengths, digest)
+    
+    @classmethod
+    def load(cls, path: Path) -> Optional['DatasetSearchIndex']:
+        """
+        저장된 색인 로드
+        
+        Args:
+            path: 색인 파일 경로
+        
+        Returns:
+            검색 색인 (없거나 형식이 다르면 None)
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != INDEX_VERSION:
+            return None
+        return cls(data['entries'], data['postings'], data['lengths'], data.get('digest', ''))
+    
+    def save(self, path: Path):
+        """
+        색인 저장 (원자적 교체)
+        
+        Args:
+            path: 색인 파일 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'version': INDEX_VERSION,
+                    'digest': self.digest,
+                    'entries': self.entries,
+                    'postings': self.postings,
+                    'lengths': self.lengths
+                },
+                f,
+                ensure_ascii=False,
+                separators=(',', ':')
+            )
+        os.replace(tmp_path, path)
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def search(self, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+        """
+        검색
+        
+        Args:
+            query: 검색어
+            limit: 반환할 최대 결과 수
+            offset: 건너뛸 결과 수 (페이지 처리용)
+        
+        Returns:
+            전체 결과 수와 점수 순으로 정렬된 결과 목록
+        """
+        scores: Dict[int, float] = {}
+        document_count = len(self.entries)
+        for token in set(tokenize(query)):
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, count in postings:
+                norm = 1 - _BM25_B + _BM25_B * self.lengths[doc_id] / (self.average_length or 1)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * count * (_BM25_K1 + 1) / (count + _BM25_K1 * norm)
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        page = ranked[offset:offset + limit]
+        next_offset = offset + limit if offset + limit < len(ranked) else None
+        return {
+            'total': len(ranked),
+            'offset': offset,
+            'limit': limit,
+            'next_offset': next_offset,
+            'results': [
+                {**self.entries[doc_id], 'score': round(score, 4)}
+                for doc_id, score in page
+            ]
+        }
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+AI-Hub 카탈로그 스냅샷
+마지막으로 받은 데이터셋 목록 응답과 미리 만든 검색 색인을 파일 하나에 저장하여,
+새로 시작한 MCP 서버가 디스크 캐시 조회나 네트워크 요청 없이 바로 응답할 수 있게 함
+(파일은 mmap으로 열고 필요한 구간만 디코딩)
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aihub_codec
+from aihub_search import INDEX_VERSION, DatasetSearchIndex
+
+# 스냅샷 파일 형식 버전 (형식이 바뀌면 기존 스냅샷을 무시)
+SNAPSHOT_VERSION = 1
+
+# 파일 머리: (매직, 형식 버전, 메타데이터 길이) 뒤에 메타데이터 JSON과 구간들이 이어짐
+_MAGIC = b'AIHUBSNP'
+_HEADER = struct.Struct('<8sII')
+
+
+def snapshot_path(cache_dir: Path, api_key: str) -> Path:
+    """
+    스냅샷 파일 경로 (API 키별로 분리, 키는 해시로만 기록)
+    
+    Args:
+        cache_dir: 메타데이터 캐시 디렉토리
+        api_key: AI-Hub API 키
+    
+    Returns:
+        스냅샷 파일 경로
+    """
+    digest = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:12]
+    return Path(cache_dir) / f"catalog-{digest}.snapshot"
+
+
+class CatalogSnapshot:
+    """
+    데이터셋 목록 스냅샷
+    메타데이터(ETag, 조회 시각, 목록 해시)는 열 때 읽고, 나머지 구간은 처음 사용할 때
+    mmap에서 디코딩 (목록 조회는 데이터셋 항목만, 검색은 역색인까지 디코딩)
+    """
+    
+    def __init__(
+        self,
+        meta: Dict[str, Any],
+        buffer: Optional[mmap.mmap] = None,
+        index: Optional[DatasetSearchIndex] = None,
+        body: Optional[str] = None
+    ):
+        """
+        Args:
+            meta: 스냅샷 메타데이터 (etag, last_modified, fetched_at, digest, sections)
+            buffer: 파일을 연 mmap (디코딩할 구간이 남아 있을 때)
+            index: 이미 디코딩한 검색 색인
+            body: 이미 디코딩한 데이터셋 목록 응답 본문
+        """
+        self.meta = meta
+        self._buffer = buffer
+        self._index = index
+        self._entries = index.entries if index is not None else None
+        self._body = body
+        self._datasets: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def etag(self) -> Optional[str]:
+        return self.meta.get('etag')
+    
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.meta.get('last_modified')
+    
+    @property
+    def fetched_at(self) -> float:
+        return self.meta.get('fetched_at', 0.0)
+    
+    @property
+    def digest(self) -> str:
+        return self.meta.get('digest', '')
+    
+    @classmethod
+    def load(cls, path: Path) -> Optional['CatalogSnapshot']:
+        """
+        스냅샷 열기
+        
+        Args:
+            path: 스냅샷 파일 경로
+        
+        Returns:
+            스냅샷 (없거나 형식/버전이 다르면 None)
+        """
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # ValueError: 빈 파일
+            return None
+        
+        try:
+            magic, version, meta_size = _HEADER.unpack_from(buffer, 0)
+            if magic != _MAGIC or version != SNAPSHOT_VERSION:
+                raise ValueError("unsupported snapshot format")
+            meta = aihub_codec.loads(buffer[_HEADER.size:_HEADER.size + meta_size])
+            if meta.get('index_version') != INDEX_VERSION:
+                raise ValueError("unsupported index version")
+            for offset, size in meta['sections'].values():
+                if offset + size > len(buffer):
+                    raise ValueError("truncated snapshot")
+        except (struct.error, ValueError, KeyError, TypeError, AttributeError):
+            buffer.close()
+            return None
+        return cls(meta, buffer)
+    
+    @classmethod
+    def write(
+        cls,
+        path: Path,
+        body: str,
+        index: DatasetSearchIndex,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        fetched_at: float = 0.0
+    ) -> 'CatalogSnapshot':
+        """
+        스냅샷 저장 (원자적 교체 - 이미 파일을 연 다른 프로세스는 이전 내용을 계속 읽음)
+        
+        Args:
+            path: 스냅샷 파일 경로
+            body: 데이터셋 목록 응답 본문
+            index: 본문으로 만든 검색 색인
+            etag: 응답 ETag
+            last_modified: 응답 Last-Modified
+            fetched_at: 응답을 받은(재검증한) 시각
+        
+        Returns:
+            저장한 내용의 스냅샷 (디코딩된 상태)
+        """
+        sections = [
+            ('catalog', body.encode('utf-8')),
+            ('entries', aihub_codec.dumpb(index.entries)),
+            ('postings', aihub_codec.dumpb({'postings': index.postings, 'lengths': index.lengths}))
+        ]
+        meta = {
+            'index_version': INDEX_VERSION,
+            'digest': index.digest,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at,
+            'sections': {}
+        }
+        # 구간 위치는 메타데이터 길이에 따라 달라지므로 길이가 변하지 않을 때까지 계산
+        meta_size = 0
+        while True:
+            offset = _HEADER.size + meta_size
+            for name, data in sections:
+                meta['sections'][name] = [offset, len(data)]
+                offset += len(data)
+            meta_data = aihub_codec.dumpb(meta)
+            if len(meta_data) == meta_size:
+                break
+            meta_size = len(meta_data)
+        
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, len(meta_data)))
+            f.write(meta_data)
+            for _, data in sections:
+                f.write(data)
+        os.replace(tmp_path, path)
+        return cls(meta, index=index, body=body)
+    
+    def _section(self, name: str) -> bytes:
+        offset, size = self.meta['sections'][name]
+        return self._buffer[offset:offset + size]
+    
+    def _release_locked(self):
+        """모든 구간을 디코딩했으면 mmap을 닫음 (Windows에서는 열린 파일을 교체할 수 없음)"""
+        if self._buffer is not None and self._index is not None and self._body is not None:
+            self._buffer.close()
+            self._buffer = None
+    
+    @property
+    def entries(self) -> List[Dict[str, str]]:
+        """데이터셋 목록 ({'dataset_key', 'name'} - 검색 색인의 문서 순서와 같음)"""
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = aihub_codec.loads(self._section('entries'))
+        return self._entries
+    
+    @property
+    def index(self) -> DatasetSearchIndex:
+        """미리 만든 검색 색인"""
+        if self._index is None:
+            entries = self.entries
+            with self._lock:
+                if self._index is None:
+                    data = aihub_codec.loads(self._section('postings'))
+                    self._index = DatasetSearchIndex(entries, data['postings'], data['lengths'], self.digest)
+                    self._release_locked()
+        return self._index
+    
+    @property
+    def body(self) -> str:
+        """데이터셋 목록 응답 본문"""
+        if self._body is None:
+            with self._lock:
+                if self._body is None:
+                    self._body = self._section('catalog').decode('utf-8')
+                    self._release_locked()
+        return self._body
+    
+    @property
+    def datasets(self) -> Dict[str, Any]:
+        """데이터셋 목록 (AIHubClient.get_datasets()와 같은 형식)"""
+        if self._datasets is None:
+            try:
+                self._datasets = aihub_codec.loads(self.body)
+            except ValueError:
+                self._datasets = {'raw_response': self.body}
+        return self._datasets
+    
+    def close(self):
+        """열린 mmap 닫기"""
+        with self._lock:
+            if self._buffer is not None:
+                self._buffer.close()
+                self._buffer = None
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+JSON 코덱 벤치마크
+MCP 전송 경로(요청 디코딩, 도구 결과 인코딩, 응답 줄 인코딩)와 API 응답 파싱에서
+표준 json과 aihub_codec의 처리 시간을 비교하고, 출력이 바이트 단위로 같은지 확인
+
+사용법:
+    python benchmarks/bench_codec.py
+    python benchmarks/bench_codec.py --datasets 20000 --output codec.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import aihub_codec  # noqa: E402
+
+
+def make_catalog(count: int) -> Dict[str, Any]:
+    """데이터셋 목록과 비슷한 크기/문자 구성의 JSON 응답"""
+    return {
+        'datasets': [
+            {
+                'datasetKey': str(index),
+                'datasetName': f'소음 환경 음성인식 데이터 {index} (Korean speech corpus)',
+                'size': 1024 * 1024 * (index % 5000),
+                'score': round(index / 7, 4)
+            }
+            for index in range(count)
+        ]
+    }
+
+
+def make_tool_result(count: int) -> Dict[str, Any]:
+    """get_dataset_info 도구 결과와 비슷한 파일 목록"""
+    return {
+        'success': True,
+        'data': {
+            'path': '',
+            'total_size': 10737418240 * count,
+            'total_size_text': '10.0 GB',
+            'file_count': count,
+            'files': [
+                {
+                    'path': f'593.소음 환경 음성인식 데이터/01.데이터/1.Training/원천데이터/TS{index}.zip',
+                    'size': 10737418240,
+                    'file_sn': 66000 + index
+                }
+                for index in range(count)
+            ],
+            'next_cursor': None
+        },
+        'dataset_key': '593',
+        'tool': 'get_dataset_info'
+    }
+
+
+def measure(func: Callable[[], Any], min_time: float) -> float:
+    """func를 min_time초 이상 반복 실행한 평균 시간 (초)"""
+    func()
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / runs
+
+
+def run(datasets: int, files: int, min_time: float) -> Dict[str, Any]:
+    """벤치마크 실행"""
+    catalog = make_catalog(datasets)
+    catalog_text = json.dumps(catalog, ensure_ascii=False)
+    tool_result = make_tool_result(files)
+    request_line = json.dumps({
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'tools/call',
+        'params': {'name': 'get_dataset_info', 'arguments': {'dataset_key': '593', 'limit': 200}}
+    }).encode('utf-8') + b'\n'
+    response = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'result': {'content': [{'type': 'text', 'text': json.dumps(tool_result, ensure_ascii=False, indent=2)}]}
+    }
+    
+    cases: List[Dict[str, Any]] = [
+        {
+            'name': 'request_decode',
+            'stdlib': lambda: json.loads(request_line),
+            'codec': lambda: aihub_codec.loads(request_line)
+        },
+        {
+            'name': 'catalog_decode',
+            'stdlib': lambda: json.loads(catalog_text),
+            'codec': lambda: aihub_codec.loads(catalog_text)
+        },
+        {
+            'name': 'tool_result_encode_indent',
+            'stdlib': lambda: json.dumps(tool_result, ensure_ascii=False, indent=2),
+            'codec': lambda: aihub_codec.dumps(tool_result, indent=True)
+        },
+        {
+            'name': 'tool_result_encode_compact',
+            'stdlib': lambda: json.dumps(tool_result, ensure_ascii=False, separators=(',', ':')),
+            'codec': lambda: aihub_codec.dumps(tool_result)
+        },
+        {
+            'name': 'response_line_encode',
+            'stdlib': lambda: json.dumps(response, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+            'codec': lambda: aihub_codec.dumpb(response)
+        },
+    ]
+    
+    results = []
+    for case in cases:
+        identical = case['stdlib']() == case['codec']()
+        stdlib_time = measure(case['stdlib'], min_time)
+        codec_time = measure(case['codec'], min_time)
+        results.append({
+            'name': case['name'],
+            'stdlib_ms': round(stdlib_time * 1000, 4),
+            'codec_ms': round(codec_time * 1000, 4),
+            'speedup': round(stdlib_time / codec_time, 2) if codec_time else None,
+            'identical': identical
+        })
+    
+    return {
+        'benchmark': 'codec',
+        'backend': aihub_codec.BACKEND,
+        'python': platform.python_version(),
+        'parameters': {'datasets': datasets, 'files': files, 'catalog_bytes': len(catalog_text.encode('utf-8'))},
+        'results': results
+    }
+
+
+def main():
+    """벤치마크 실행 후 결과 출력"""
+    parser = argparse.ArgumentParser(description="JSON codec benchmark")
+    parser.add_argument("--datasets", type=int, default=5000, help="Number of catalog entries")
+    parser.add_argument("--files", type=int, default=200, help="Number of files in the tool result")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum seconds per measurement")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+    
+    report = run(args.datasets, args.files, args.min_time)
+    
+    print(f"backend: {report['backend']}")
+    print(f"{'case':<28} {'stdlib ms':>10} {'codec ms':>10} {'speedup':>8}  identical")
+    for result in report['results']:
+        print(
+            f"{result['name']:<28} {result['stdlib_ms']:>10.3f} {result['codec_ms']:>10.3f} "
+            f"{result['speedup']:>7.2f}x  {result['identical']}"
+        )
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    
+    if not all(result['identical'] for result in report['results']):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
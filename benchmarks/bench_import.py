@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+시작 시간 벤치마크
+`python -X importtime`으로 모듈 import 시간을 측정하고, 시작 시점에 불러오면 안 되는
+무거운 모듈(requests, tqdm, tarfile 등)이 import되는지 확인하며, MCP 서버 프로세스가
+initialize/tools/list와 (카탈로그 스냅샷이 있을 때) 첫 list_datasets에 응답하기까지
+걸리는 시간을 측정
+
+사용법:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --runs 10 --max-import-ms 150 --output import.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from aihub_search import DatasetSearchIndex, catalog_digest, parse_catalog  # noqa: E402
+from aihub_snapshot import CatalogSnapshot, snapshot_path  # noqa: E402
+
+# 첫 응답을 측정할 요청 (list_datasets는 미리 만든 스냅샷으로 응답)
+FIRST_REQUESTS = [
+    ('initialize', {}),
+    ('tools/list', {}),
+    ('tools/call', {'name': 'list_datasets', 'arguments': {'limit': 10}})
+]
+
+# 측정할 모듈
+MODULES = ['aihub_mcp_server', 'aihub_client']
+
+# 시작 시점에 import되면 안 되는 모듈 (처음 필요할 때 불러옴)
+DEFERRED_MODULES = ['requests', 'urllib3', 'tqdm', 'tarfile', 'dotenv', 'aihub_http']
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(ROOT), env.get('PYTHONPATH')]))
+    return env
+
+
+def import_time_us(module: str) -> int:
+    """
+    모듈 하나의 누적 import 시간 (마이크로초, -X importtime 기준)
+    
+    Args:
+        module: 모듈 이름
+    
+    Returns:
+        최상위 import의 누적 시간
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True
+    )
+    for line in result.stderr.splitlines():
+        # 형식: "import time: self [us] | cumulative | imported package"
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].rstrip() == f' {module}':
+            return int(parts[1])
+    raise RuntimeError(f"import time of {module} not found")
+
+
+def deferred_modules_loaded(module: str) -> List[str]:
+    """
+    모듈을 import했을 때 함께 불러온, 시작 시점에 불러오면 안 되는 모듈 목록
+    (인터프리터 시작 시 이미 불러온 모듈은 제외)
+    """
+    code = (
+        'import json, sys\n'
+        'before = set(sys.modules)\n'
+        f'import {module}\n'
+        'print(json.dumps(sorted(set(sys.modules) - before)))\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=_env(), check=True)
+    loaded = json.loads(result.stdout)
+    return [name for name in DEFERRED_MODULES if name in loaded]
+
+
+def write_snapshot(cache_dir: str, api_key: str, datasets: int):
+    """방금 받은 것처럼 보이는 데이터셋 목록 스냅샷 생성 (서버가 네트워크 요청 없이 응답)"""
+    body = '\n'.join(f"{index}, 소음 환경 음성인식 데이터 {index}" for index in range(datasets))
+    catalog = {'raw_response': body}
+    index = DatasetSearchIndex.build(parse_catalog(catalog), catalog_digest(catalog))
+    CatalogSnapshot.write(snapshot_path(Path(cache_dir), api_key), body, index, fetched_at=time.time())
+
+
+def first_response_ms(datasets: int) -> Dict[str, float]:
+    """
+    MCP 서버 프로세스를 시작해 FIRST_REQUESTS 각각의 응답을 받기까지 걸린 시간
+    (네트워크 요청이 필요 없는 요청만 보내므로 임의의 API 키로 측정)
+    """
+    with tempfile.TemporaryDirectory() as cache_dir:
+        write_snapshot(cache_dir, 'benchmark', datasets)
+        env = _env()
+        env.update({'AIHUB_API_KEY': 'benchmark', 'AIHUB_CACHE_DIR': cache_dir})
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, str(ROOT / 'aihub_mcp_server.py')],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env
+        )
+        try:
+            timings = {}
+            for request_id, (method, params) in enumerate(FIRST_REQUESTS, 1):
+                request = {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+                process.stdin.write((json.dumps(request) + '\n').encode('utf-8'))
+                process.stdin.flush()
+                line = process.stdout.readline()
+                if not line:
+                    raise RuntimeError("MCP server exited before responding")
+                timings[params.get('name', method)] = round((time.perf_counter() - start) * 1000, 2)
+            return timings
+        finally:
+            process.stdin.close()
+            process.wait(timeout=10)
+
+
+def run(runs: int, datasets: int) -> Dict[str, Any]:
+    """벤치마크 실행"""
+    imports = []
+    for module in MODULES:
+        samples = [import_time_us(module) / 1000 for _ in range(runs)]
+        imports.append({
+            'module': module,
+            'median_ms': round(statistics.median(samples), 2),
+            'min_ms': round(min(samples), 2),
+            'deferred_loaded': deferred_modules_loaded(module)
+        })
+    
+    responses = [first_response_ms(datasets) for _ in range(runs)]
+    first_response = {
+        method: round(statistics.median(timing[method] for timing in responses), 2)
+        for method in responses[0]
+    }
+    
+    return {
+        'benchmark': 'import',
+        'python': platform.python_version(),
+        'parameters': {'runs': runs, 'datasets': datasets},
+        'imports': imports,
+        'first_response_ms': first_response
+    }
+
+
+def main():
+    """벤치마크 실행 후 결과 출력 (회귀가 있으면 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description="Import time / cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs per measurement")
+    parser.add_argument("--datasets", type=int, default=3000, help="Number of datasets in the catalog snapshot")
+    parser.add_argument("--max-import-ms", type=float, help="Fail if aihub_mcp_server import median exceeds this")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+    
+    report = run(max(1, args.runs), args.datasets)
+    
+    failures = []
+    for result in report['imports']:
+        print(
+            f"{result['module']:<20} median {result['median_ms']:>8.2f} ms  min {result['min_ms']:>8.2f} ms"
+            f"  deferred modules loaded: {', '.join(result['deferred_loaded']) or '-'}"
+        )
+        if result['deferred_loaded']:
+            failures.append(f"{result['module']} imports {', '.join(result['deferred_loaded'])} at startup")
+        if args.max_import_ms and result['module'] == 'aihub_mcp_server' and result['median_ms'] > args.max_import_ms:
+            failures.append(f"aihub_mcp_server import took {result['median_ms']} ms (> {args.max_import_ms} ms)")
+    for method, elapsed in report['first_response_ms'].items():
+        print(f"first {method} response: {elapsed:.2f} ms after process start")
+    
+    report['failures'] = failures
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
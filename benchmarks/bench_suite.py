@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+오프라인 벤치마크 모음
+로컬 AI-Hub 스텁 서버(stub_server.py)를 띄우고 다음을 측정
+
+    download          download_dataset 처리량 (구간 수별)
+    extract_and_merge tar 압축 해제와 .partN 병합 시간
+    metadata          동시 요청 수별 파일 트리 조회 지연 시간과 처리량
+    mcp               stdio MCP 서버의 도구 호출 처리량
+
+결과는 JSON으로 저장하며, --baseline으로 이전 릴리스의 결과와 비교할 수 있음
+
+사용법:
+    python benchmarks/bench_suite.py --output results.json
+    python benchmarks/bench_suite.py --only download metadata --latency 0.02 --bandwidth 100
+    python benchmarks/bench_suite.py --baseline previous.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from aihub_client import AIHubAPIError, AIHubClient  # noqa: E402
+from stub_server import StubAIHub  # noqa: E402
+
+BENCHMARKS = ['download', 'extract_and_merge', 'metadata', 'mcp']
+
+MIB = 1024 * 1024
+
+# 릴리스 사이에 비교할 측정값 (요청 수 등 설정값은 제외)
+COMPARED_METRICS = [
+    'median_seconds', 'seconds', 'mib_per_second', 'requests_per_second', 'p50_ms', 'p95_ms', 'p99_ms'
+]
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """정렬된 표본의 q 분위수 (최근접 순위)"""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, max(0, round(q * (len(samples) - 1))))]
+
+
+def make_client(stub: StubAIHub, work_dir: Path, **kwargs) -> AIHubClient:
+    """스텁 서버에 연결하는 클라이언트 (벤치마크마다 별도 캐시 디렉토리)"""
+    cache_dir = Path(tempfile.mkdtemp(prefix='cache-', dir=work_dir))
+    return AIHubClient(api_key=stub.api_key, base_url=stub.url, cache_dir=str(cache_dir), **kwargs)
+
+
+def bench_download(stub: StubAIHub, work_dir: Path, runs: int, segments: List[int]) -> List[Dict[str, Any]]:
+    """
+    download_dataset 처리량 (압축 해제 제외)
+    
+    Args:
+        stub: 스텁 서버
+        work_dir: 작업 디렉토리
+        runs: 구간 수별 반복 횟수
+        segments: 측정할 구간 수 목록
+    
+    Returns:
+        구간 수별 결과
+    """
+    results = []
+    size = len(stub.archive)
+    with make_client(stub, work_dir) as client:
+        for count in segments:
+            samples = []
+            failures = 0
+            for _ in range(runs):
+                output_dir = Path(tempfile.mkdtemp(prefix='download-', dir=work_dir))
+                started = time.perf_counter()
+                try:
+                    client.download_dataset(
+                        '1', output_path=str(output_dir), extract=False, show_progress=False, segments=count
+                    )
+                    samples.append(time.perf_counter() - started)
+                except AIHubAPIError:
+                    failures += 1
+                finally:
+                    shutil.rmtree(output_dir, ignore_errors=True)
+            median = statistics.median(samples) if samples else None
+            results.append({
+                'name': f'download_segments_{count}',
+                'bytes': size,
+                'median_seconds': round(median, 4) if median else None,
+                'mib_per_second': round(size / MIB / median, 2) if median else None,
+                'failures': failures
+            })
+    return results
+
+
+def bench_extract(stub: StubAIHub, work_dir: Path, runs: int) -> List[Dict[str, Any]]:
+    """
+    _extract_and_merge 처리 시간 (한 번 받은 tar를 반복해서 압축 해제)
+    
+    Args:
+        stub: 스텁 서버
+        work_dir: 작업 디렉토리
+        runs: 반복 횟수
+    
+    Returns:
+        결과 (1개)
+    """
+    with make_client(stub, work_dir) as client:
+        archive_dir = Path(tempfile.mkdtemp(prefix='archive-', dir=work_dir))
+        result = client.download_dataset('1', output_path=str(archive_dir), extract=False, show_progress=False)
+        tar_path = result['extracted_files'][0]
+        
+        samples = []
+        verified = True
+        for _ in range(runs):
+            output_dir = Path(tempfile.mkdtemp(prefix='extract-', dir=work_dir))
+            started = time.perf_counter()
+            client._extract_and_merge(tar_path, output_dir)
+            samples.append(time.perf_counter() - started)
+            merged = output_dir / stub.archive_info['merged_path']
+            verified = verified and merged.exists() and merged.stat().st_size == stub.archive_info['merged_size']
+            shutil.rmtree(output_dir, ignore_errors=True)
+        shutil.rmtree(archive_dir, ignore_errors=True)
+    
+    median = statistics.median(samples)
+    return [{
+        'name': 'extract_and_merge',
+        'bytes': len(stub.archive),
+        'members': stub.archive_info['members'],
+        'median_seconds': round(median, 4),
+        'mib_per_second': round(len(stub.archive) / MIB / median, 2),
+        'verified': verified
+    }]
+
+
+def bench_metadata(
+    stub: StubAIHub,
+    work_dir: Path,
+    requests: int,
+    concurrency: List[int],
+    datasets: int
+) -> List[Dict[str, Any]]:
+    """
+    동시 요청 수별 get_dataset_info 지연 시간 (캐시를 끄고 매번 스텁 서버에 요청)
+    
+    Args:
+        stub: 스텁 서버
+        work_dir: 작업 디렉토리
+        requests: 동시 요청 수별 요청 수
+        concurrency: 측정할 동시 요청 수 목록
+        datasets: 스텁 서버의 데이터셋 수 (서로 다른 키로 요청)
+    
+    Returns:
+        동시 요청 수별 결과
+    """
+    results = []
+    with make_client(stub, work_dir, cache_ttl=0, pool_maxsize=max(concurrency)) as client:
+        # 연결 풀 준비
+        client.validate_api_key()
+        
+        def timed(index: int) -> Optional[float]:
+            started = time.perf_counter()
+            try:
+                client.get_dataset_info(str(index % datasets + 1))
+            except AIHubAPIError:
+                return None
+            return time.perf_counter() - started
+        
+        for workers in concurrency:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(timed, range(requests)))
+            elapsed = time.perf_counter() - started
+            latencies = sorted(outcome * 1000 for outcome in outcomes if outcome is not None)
+            results.append({
+                'name': f'metadata_concurrency_{workers}',
+                'requests': requests,
+                'requests_per_second': round(requests / elapsed, 1),
+                'p50_ms': round(percentile(latencies, 0.50), 2),
+                'p95_ms': round(percentile(latencies, 0.95), 2),
+                'p99_ms': round(percentile(latencies, 0.99), 2),
+                'failures': requests - len(latencies)
+            })
+    return results
+
+
+def bench_mcp(stub: StubAIHub, work_dir: Path, requests: int, datasets: int) -> List[Dict[str, Any]]:
+    """
+    stdio MCP 서버 처리량
+    서버 프로세스를 띄워 요청을 한꺼번에 보내고 모든 응답을 받기까지 걸린 시간을 측정
+    (한 번 조회한 데이터셋만 요청하므로 서버 내부 처리와 직렬화 비용이 주로 측정됨)
+    
+    Args:
+        stub: 스텁 서버
+        work_dir: 작업 디렉토리
+        requests: 보낼 도구 호출 수
+        datasets: 조회할 데이터셋 수
+    
+    Returns:
+        결과 (1개)
+    """
+    env = dict(os.environ)
+    env.update({
+        'PYTHONPATH': os.pathsep.join(filter(None, [str(ROOT), env.get('PYTHONPATH')])),
+        'AIHUB_API_KEY': stub.api_key,
+        'AIHUB_API_BASE_URL': stub.url,
+        'AIHUB_CACHE_DIR': tempfile.mkdtemp(prefix='cache-', dir=work_dir)
+    })
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / 'aihub_mcp_server.py')],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env
+    )
+    
+    def call(request_id: int) -> Dict[str, Any]:
+        kind = request_id % 3
+        if kind == 0:
+            tool = {'name': 'get_dataset_info', 'arguments': {'dataset_key': str(request_id % datasets + 1), 'limit': 50}}
+        elif kind == 1:
+            tool = {'name': 'list_datasets', 'arguments': {'limit': 100}}
+        else:
+            tool = {'name': 'search_datasets', 'arguments': {'query': '음성인식 데이터'}}
+        return {'jsonrpc': '2.0', 'id': request_id, 'method': 'tools/call', 'params': tool}
+    
+    def exchange(request_ids: range) -> float:
+        # 요청은 별도 스레드에서 보내 파이프 버퍼가 차도 응답을 계속 읽을 수 있게 함
+        def send():
+            for request_id in request_ids:
+                process.stdin.write((json.dumps(call(request_id), ensure_ascii=False) + '\n').encode('utf-8'))
+            process.stdin.flush()
+        
+        started = time.perf_counter()
+        sender = threading.Thread(target=send)
+        sender.start()
+        pending = set(request_ids)
+        while pending:
+            line = process.stdout.readline()
+            if not line:
+                raise RuntimeError("MCP server exited before responding")
+            pending.discard(json.loads(line).get('id'))
+        sender.join()
+        return time.perf_counter() - started
+    
+    try:
+        # 준비: 조회할 데이터셋과 목록을 캐시에 올림
+        exchange(range(0, 3 * datasets))
+        elapsed = exchange(range(3 * datasets, 3 * datasets + requests))
+    finally:
+        process.stdin.close()
+        process.wait(timeout=30)
+    
+    return [{
+        'name': 'mcp_tool_calls',
+        'requests': requests,
+        'seconds': round(elapsed, 4),
+        'requests_per_second': round(requests / elapsed, 1)
+    }]
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """
+    이전 결과와 비교한 줄 목록 (이름이 같은 결과의 COMPARED_METRICS 항목별 비율)
+    
+    Args:
+        report: 이번 결과
+        baseline: 이전 결과
+    
+    Returns:
+        출력할 줄 목록
+    """
+    previous = {result['name']: result for result in baseline.get('results', [])}
+    lines = []
+    for result in report['results']:
+        before = previous.get(result['name'])
+        if before is None:
+            continue
+        for metric in COMPARED_METRICS:
+            value, old = result.get(metric), before.get(metric)
+            if value is None or not old:
+                continue
+            lines.append(f"{result['name']:<28} {metric:<20} {old:>12} -> {value:>12}  ({value / old:.2f}x)")
+    return lines
+
+
+def main():
+    """벤치마크 실행 후 결과 출력"""
+    parser = argparse.ArgumentParser(description="Offline benchmark suite against a local AI-Hub stub")
+    parser.add_argument("--only", nargs='+', choices=BENCHMARKS, help="Benchmarks to run (default: all)")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions for download/extract benchmarks")
+    parser.add_argument("--segments", type=int, nargs='+', default=[1, 4], help="Download segment counts to measure")
+    parser.add_argument("--parts", type=int, default=4, help="Number of .partN members in the archive")
+    parser.add_argument("--part-size-mb", type=float, default=16, help="Size of each .partN member (MiB)")
+    parser.add_argument("--datasets", type=int, default=1000, help="Number of datasets in the stub catalog")
+    parser.add_argument("--files", type=int, default=200, help="Number of files per dataset tree")
+    parser.add_argument("--metadata-requests", type=int, default=200, help="Requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs='+', default=[1, 8, 32], help="Concurrency levels")
+    parser.add_argument("--mcp-requests", type=int, default=600, help="Tool calls to send to the MCP server")
+    parser.add_argument("--latency", type=float, default=0.01, help="Stub latency per response (seconds)")
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="Stub per-response bandwidth cap (MiB/s)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Stub probability of a 503 response")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Stub probability of dropping a download")
+    parser.add_argument("--seed", type=int, default=0, help="Fault injection seed")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--baseline", help="Compare with a previous JSON result file")
+    args = parser.parse_args()
+    
+    # 재시도 경고 등 클라이언트 로그는 결과 출력과 섞이지 않도록 줄임
+    logging.basicConfig(level=logging.ERROR)
+    selected = args.only or BENCHMARKS
+    parameters = {key: value for key, value in vars(args).items() if key not in ('output', 'baseline', 'only')}
+    
+    stub = StubAIHub(
+        datasets=args.datasets,
+        files=args.files,
+        parts=args.parts,
+        part_size=int(args.part_size_mb * MIB),
+        latency=args.latency,
+        bandwidth=args.bandwidth * MIB,
+        fail_rate=args.fail_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed
+    )
+    work_dir = Path(tempfile.mkdtemp(prefix='aihub-bench-'))
+    results: List[Dict[str, Any]] = []
+    try:
+        with stub:
+            if 'download' in selected:
+                results += bench_download(stub, work_dir, args.runs, args.segments)
+            if 'extract_and_merge' in selected:
+                results += bench_extract(stub, work_dir, args.runs)
+            if 'metadata' in selected:
+                results += bench_metadata(stub, work_dir, args.metadata_requests, args.concurrency, args.datasets)
+            if 'mcp' in selected:
+                results += bench_mcp(stub, work_dir, args.mcp_requests, min(args.datasets, 50))
+            stub_stats = stub.stats()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    report = {
+        'benchmark': 'suite',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'parameters': parameters,
+        'results': results,
+        'stub': stub_stats
+    }
+    
+    for result in results:
+        metrics = ', '.join(f"{key}={value}" for key, value in result.items() if key != 'name')
+        print(f"{result['name']:<28} {metrics}")
+    print(f"{'stub':<28} " + ', '.join(f"{key}={value}" for key, value in stub_stats.items()))
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        print(f"\ncompared with {args.baseline}:")
+        for line in compare(report, baseline):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+AI-Hub 스텁 서버
+벤치마크를 네트워크 없이 실행할 수 있도록 AI-Hub API의 주요 엔드포인트를 흉내 내는 로컬 HTTP 서버
+
+    /api/keyValidate.do     API 키 검증
+    /info/dataset.do        데이터셋 목록 (ETag/304 지원)
+    /info/{key}.do          데이터셋 파일 트리 (ETag/304 지원)
+    /down/0.5/{key}.do      .partN 분할 멤버가 들어 있는 tar (Range 지원)
+
+응답 지연, 응답별 대역폭 제한, 503 응답과 다운로드 중 연결 끊김을 주입할 수 있음
+
+사용법:
+    python benchmarks/stub_server.py --port 8765 --latency 0.02 --bandwidth 50
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import random
+import re
+import socket
+import tarfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+# 응답 본문을 나누어 보내는 단위 (대역폭 제한 계산 단위)
+SEND_CHUNK_SIZE = 64 * 1024
+
+_RANGE_PATTERN = re.compile(r'^bytes=(\d+)-(\d*)$')
+_INFO_PATTERN = re.compile(r'^/info/(\d+)\.do$')
+_DOWNLOAD_PATTERN = re.compile(r'^/down/0\.5/(\d+)\.do$')
+
+
+def make_catalog(count: int) -> str:
+    """데이터셋 목록 응답 본문 ("키, 이름" 줄 형식)"""
+    subjects = ['음성인식', '한국어 대화', '자율주행 영상', '의료 영상', '문서 OCR', 'Korean speech corpus']
+    lines = [
+        f"{key}, {subjects[key % len(subjects)]} 데이터 {key}"
+        for key in range(1, count + 1)
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def make_file_tree(dataset_key: str, files: int) -> str:
+    """
+    파일 트리 응답 본문 (AI-Hub 트리 텍스트 형식)
+    
+    Args:
+        dataset_key: 데이터셋 키
+        files: 파일 수 (Training/Validation에 나누어 배치)
+    
+    Returns:
+        트리 텍스트
+    """
+    lines = ["공지사항: 벤치마크용 스텁 응답입니다.", f"    └─{dataset_key}.벤치마크 데이터셋 {dataset_key}"]
+    splits = [('1.Training', files - files // 5), ('2.Validation', files // 5)]
+    splits = [(name, count) for name, count in splits if count > 0]
+    file_sn = int(dataset_key) * 100000
+    for split_index, (split_name, count) in enumerate(splits):
+        last_split = split_index == len(splits) - 1
+        lines.append(f"        {'└─' if last_split else '├─'}{split_name}")
+        prefix = '        ' + ('    ' if last_split else '│  ')
+        for index in range(count):
+            file_sn += 1
+            marker = '└─' if index == count - 1 else '├─'
+            size = f"{(index % 900) + 100} MB"
+            lines.append(f"{prefix}{marker}{split_name[2:3]}S{index:05d}.zip | {size} | {file_sn}")
+    return '\n'.join(lines) + '\n'
+
+
+def make_dataset_tar(parts: int, part_size: int, extra_files: int = 4) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    다운로드 응답 tar 생성
+    큰 파일 하나를 parts개의 .partN 멤버로 나누어 넣고, 작은 일반 파일을 함께 넣음
+    
+    Args:
+        parts: 분할 멤버 수
+        part_size: 분할 멤버 하나의 크기 (바이트)
+        extra_files: 함께 넣을 작은 파일 수
+    
+    Returns:
+        (tar 바이트, {'merged_path', 'merged_size', 'merged_sha256', 'members'})
+    """
+    payload = os.urandom(parts * part_size)
+    buffer = io.BytesIO()
+    merged_path = 'dataset/01.원천데이터/sample.zip'
+    with tarfile.open(fileobj=buffer, mode='w', format=tarfile.PAX_FORMAT) as tar:
+        for index in range(parts):
+            info = tarfile.TarInfo(f"{merged_path}.part{index}")
+            info.size = part_size
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(payload[index * part_size:(index + 1) * part_size]))
+        for index in range(extra_files):
+            data = f'{{"id": {index}, "label": "sample"}}\n'.encode('utf-8')
+            info = tarfile.TarInfo(f"dataset/02.라벨링데이터/label_{index:04d}.json")
+            info.size = len(data)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue(), {
+        'merged_path': merged_path,
+        'merged_size': len(payload),
+        'merged_sha256': hashlib.sha256(payload).hexdigest(),
+        'members': parts + extra_files
+    }
+
+
+class StubAIHub:
+    """
+    로컬 AI-Hub 스텁 서버 (백그라운드 스레드에서 실행)
+    
+    사용 예:
+        with StubAIHub(datasets=500, latency=0.02) as stub:
+            client = AIHubClient(api_key=stub.api_key, base_url=stub.url)
+    """
+    
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        api_key: str = 'benchmark',
+        datasets: int = 1000,
+        files: int = 200,
+        parts: int = 4,
+        part_size: int = 4 * 1024 * 1024,
+        extra_files: int = 4,
+        latency: float = 0.0,
+        bandwidth: float = 0.0,
+        fail_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            host: 바인딩할 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            api_key: 허용할 API 키 (apikey 헤더)
+            datasets: 데이터셋 목록 크기
+            files: 데이터셋별 파일 트리의 파일 수
+            parts: 다운로드 tar의 분할 멤버 수
+            part_size: 분할 멤버 하나의 크기 (바이트)
+            extra_files: 다운로드 tar에 함께 넣을 작은 파일 수
+            latency: 모든 응답 앞에 추가할 지연 (초)
+            bandwidth: 응답 하나의 최대 전송 속도 (바이트/초, 0이면 제한 없음)
+            fail_rate: 503(Retry-After: 0)으로 응답할 확률
+            drop_rate: 다운로드 응답을 절반만 보내고 연결을 끊을 확률
+            seed: 오류 주입 난수 시드
+        """
+        self.api_key = api_key
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.fail_rate = fail_rate
+        self.drop_rate = drop_rate
+        self.files = files
+        self.catalog = make_catalog(datasets).encode('utf-8')
+        self.archive, self.archive_info = make_dataset_tar(parts, part_size, extra_files)
+        self.archive_etag = '"%s"' % hashlib.sha1(self.archive).hexdigest()[:16]
+        
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._trees: Dict[str, bytes] = {}
+        self._stats = {'requests': 0, 'not_modified': 0, 'failures_injected': 0, 'drops_injected': 0, 'bytes_sent': 0}
+        
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """AIHubClient의 base_url로 사용할 주소"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> 'StubAIHub':
+        """백그라운드 스레드에서 요청 처리 시작"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="aihub-stub", daemon=True)
+        self._thread.start()
+        return self
+    
+    def serve_forever(self):
+        """현재 스레드에서 요청 처리 (Ctrl+C 또는 stop()으로 종료)"""
+        self._server.serve_forever()
+    
+    def stop(self):
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def __enter__(self) -> 'StubAIHub':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+    
+    def stats(self) -> Dict[str, int]:
+        """처리한 요청 수, 304 응답 수, 주입한 오류 수, 보낸 바이트 수"""
+        with self._lock:
+            return dict(self._stats)
+    
+    def reset_stats(self):
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+    
+    def file_tree(self, dataset_key: str) -> bytes:
+        """데이터셋별 파일 트리 응답 본문 (처음 요청할 때 생성)"""
+        with self._lock:
+            tree = self._trees.get(dataset_key)
+            if tree is None:
+                tree = make_file_tree(dataset_key, self.files).encode('utf-8')
+                self._trees[dataset_key] = tree
+            return tree
+    
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self._stats[key] += amount
+    
+    def _chance(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < rate
+    
+    def _handler_class(self):
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘이 지연 ACK와 겹쳐 응답이 늦어지지 않게 함
+            disable_nagle_algorithm = True
+            
+            def log_message(self, format, *args):
+                pass
+            
+            def do_GET(self):
+                stub._count('requests')
+                if stub.latency > 0:
+                    time.sleep(stub.latency)
+                if stub._chance(stub.fail_rate):
+                    stub._count('failures_injected')
+                    self._send(503, b'Service Unavailable', {'Retry-After': '0'})
+                    return
+                
+                path = self.path.split('?', 1)[0]
+                if self.headers.get('apikey') != stub.api_key:
+                    self._send(401, b'Invalid API key')
+                elif path == '/api/keyValidate.do':
+                    self._send(200, b'OK')
+                elif path == '/info/dataset.do':
+                    self._send_metadata(stub.catalog)
+                elif _INFO_PATTERN.match(path):
+                    self._send_metadata(stub.file_tree(_INFO_PATTERN.match(path).group(1)))
+                elif _DOWNLOAD_PATTERN.match(path):
+                    self._send_archive()
+                else:
+                    self._send(404, b'Not Found')
+            
+            def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self._write(body)
+            
+            def _send_metadata(self, body: bytes):
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+                if self.headers.get('If-None-Match') == etag:
+                    stub._count('not_modified')
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self._send(200, body, {'ETag': etag, 'Content-Type': 'text/plain; charset=utf-8'})
+            
+            def _send_archive(self):
+                archive = stub.archive
+                total = len(archive)
+                start, end = 0, total - 1
+                match = _RANGE_PATTERN.match(self.headers.get('Range', ''))
+                if_range = self.headers.get('If-Range')
+                partial = match is not None and (if_range is None or if_range == stub.archive_etag)
+                if partial:
+                    start = int(match.group(1))
+                    end = min(int(match.group(2)), total - 1) if match.group(2) else total - 1
+                    if start > end:
+                        self._send(416, b'', {'Content-Range': f'bytes */{total}'})
+                        return
+                
+                self.send_response(206 if partial else 200)
+                if partial:
+                    self.send_header('Content-Range', f'bytes {start}-{end}/{total}')
+                self.send_header('Accept-Ranges', 'bytes')
+                self.send_header('ETag', stub.archive_etag)
+                self.send_header('Content-Type', 'application/x-tar')
+                self.send_header('Content-Length', str(end - start + 1))
+                self.end_headers()
+                
+                body = memoryview(archive)[start:end + 1]
+                if stub._chance(stub.drop_rate):
+                    # 본문 절반만 보내고 연결 끊기
+                    stub._count('drops_injected')
+                    self._write(body[:len(body) // 2])
+                    self.close_connection = True
+                    try:
+                        self.connection.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        # 클라이언트가 이미 연결을 끊은 경우
+                        pass
+                    return
+                self._write(body)
+            
+            def _write(self, body):
+                started = time.monotonic()
+                sent = 0
+                try:
+                    for offset in range(0, len(body), SEND_CHUNK_SIZE):
+                        chunk = body[offset:offset + SEND_CHUNK_SIZE]
+                        self.wfile.write(chunk)
+                        sent += len(chunk)
+                        if stub.bandwidth > 0:
+                            delay = sent / stub.bandwidth - (time.monotonic() - started)
+                            if delay > 0:
+                                time.sleep(delay)
+                except (BrokenPipeError, ConnectionResetError):
+                    # 클라이언트가 본문을 다 받기 전에 연결을 닫음 (분할 다운로드의 첫 응답 등)
+                    self.close_connection = True
+                finally:
+                    stub._count('bytes_sent', sent)
+        
+        return Handler
+
+
+def main():
+    """스텁 서버를 포그라운드에서 실행"""
+    parser = argparse.ArgumentParser(description="Local AI-Hub stand-in server for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8765, help="Port")
+    parser.add_argument("--api-key", default="benchmark", help="Accepted API key")
+    parser.add_argument("--datasets", type=int, default=1000, help="Number of datasets in the catalog")
+    parser.add_argument("--files", type=int, default=200, help="Number of files per dataset tree")
+    parser.add_argument("--parts", type=int, default=4, help="Number of .partN members in the download tar")
+    parser.add_argument("--part-size-mb", type=float, default=4, help="Size of each .partN member (MiB)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Added latency per response (seconds)")
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="Per-response bandwidth cap (MiB/s, 0 = unlimited)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Probability of a 503 response")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Probability of dropping a download mid-body")
+    args = parser.parse_args()
+    
+    stub = StubAIHub(
+        host=args.host,
+        port=args.port,
+        api_key=args.api_key,
+        datasets=args.datasets,
+        files=args.files,
+        parts=args.parts,
+        part_size=int(args.part_size_mb * 1024 * 1024),
+        latency=args.latency,
+        bandwidth=args.bandwidth * 1024 * 1024,
+        fail_rate=args.fail_rate,
+        drop_rate=args.drop_rate
+    )
+    print(f"AI-Hub stub listening on {stub.url} (AIHUB_API_BASE_URL={stub.url}, AIHUB_API_KEY={stub.api_key})")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,15 @@ setup(
     packages=find_packages(),
     py_modules=[
         "aihub_client",
+        "aihub_async_client",
+        "aihub_cache",
+        "aihub_codec",
+        "aihub_filetree",
+        "aihub_http",
+        "aihub_ratelimit",
+        "aihub_retry",
+        "aihub_search",
+        "aihub_snapshot",
         "aihub_dataset_query", 
         "aihub_mcp_server",
         "example_usage"
@@ -48,6 +57,12 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "async": [
+            "aiohttp>=3.8",
+        ],
+        "fast": [
+            "orjson>=3.6",
+        ],
         "dev": [
             "pytest>=6.0",
             "black>=21.0",
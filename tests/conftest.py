@@ -0,0 +1,66 @@
+"""
+테스트 공통 설정
+저장소 루트의 모듈과 benchmarks/stub_server.py를 import할 수 있게 하고,
+네트워크 없이 로컬 스텁 서버로 클라이언트를 실행하는 fixture 제공
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from stub_server import StubAIHub  # noqa: E402
+
+# 분할 다운로드(MIN_SEGMENT_SIZE 이상)가 동작하는 최소 크기의 tar
+STUB_PARTS = 3
+STUB_PART_SIZE = 6 * 1024 * 1024
+
+
+@pytest.fixture(autouse=True)
+def aihub_env(tmp_path, monkeypatch):
+    """사용자 환경(.env, ~/.cache/aihub)과 분리된 클라이언트 설정"""
+    monkeypatch.setenv('AIHUB_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setenv('AIHUB_RETRY_BACKOFF', '0')
+    monkeypatch.setenv('AIHUB_RETRY_MAX_ATTEMPTS', '5')
+    for name in (
+        'AIHUB_API_KEY', 'AIHUB_API_BASE_URL', 'AIHUB_DOWNLOAD_SEGMENTS', 'AIHUB_DOWNLOAD_RESUME',
+        'AIHUB_STREAM_EXTRACT', 'AIHUB_CACHE_TTL', 'AIHUB_METADATA_RATE', 'AIHUB_DOWNLOAD_RATE',
+        'AIHUB_RATE_LIMIT_SHARED', 'AIHUB_CATALOG_SNAPSHOT', 'AIHUB_JSON_BACKEND'
+    ):
+        monkeypatch.delenv(name, raising=False)
+    # load_dotenv()가 작업 디렉토리의 .env를 읽지 않도록 빈 디렉토리에서 실행
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture(scope='session')
+def stub_server():
+    """테스트 세션 동안 공유하는 스텁 서버 (tar 생성 비용을 한 번만 지불)"""
+    with StubAIHub(datasets=250, files=50, parts=STUB_PARTS, part_size=STUB_PART_SIZE, seed=1) as stub:
+        yield stub
+
+
+@pytest.fixture
+def stub(stub_server):
+    """오류 주입 설정과 통계를 테스트마다 초기화한 스텁 서버"""
+    stub_server.latency = 0.0
+    stub_server.bandwidth = 0.0
+    stub_server.fail_rate = 0.0
+    stub_server.drop_rate = 0.0
+    stub_server.reset_stats()
+    yield stub_server
+    stub_server.fail_rate = 0.0
+    stub_server.drop_rate = 0.0
+
+
+@pytest.fixture
+def client(stub):
+    """스텁 서버에 연결한 AIHubClient"""
+    from aihub_client import AIHubClient
+    
+    aihub_client = AIHubClient(api_key=stub.api_key, base_url=stub.url)
+    yield aihub_client
+    aihub_client.close()
@@ -0,0 +1,48 @@
+"""비동기 클라이언트 테스트 (aiohttp가 설치된 경우)"""
+
+import asyncio
+import hashlib
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from aihub_async_client import AsyncAIHubClient  # noqa: E402
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_metadata_requests(stub):
+    async def main():
+        async with AsyncAIHubClient(api_key=stub.api_key, base_url=stub.url) as client:
+            assert await client.validate_api_key()
+            datasets = await client.get_datasets()
+            info = await client.get_dataset_info('7')
+            return datasets, info
+    
+    datasets, info = run(main())
+    
+    assert datasets['raw_response'] == stub.catalog.decode('utf-8')
+    assert info['raw_response'] == stub.file_tree('7').decode('utf-8')
+
+
+@pytest.mark.parametrize('drop_rate', [0.0, 0.5])
+def test_segmented_download_resumes_dropped_segments(stub, tmp_path, drop_rate, monkeypatch):
+    monkeypatch.setenv('AIHUB_RETRY_MAX_ATTEMPTS', '20')
+    
+    async def main():
+        async with AsyncAIHubClient(api_key=stub.api_key, base_url=stub.url) as client:
+            return await client.download_dataset(
+                '101', output_path=str(tmp_path / 'out'), show_progress=False, extract=False, segments=2
+            )
+    
+    stub.drop_rate = drop_rate
+    result = run(main())
+    
+    assert result['downloaded_size'] == len(stub.archive)
+    archive = tmp_path / 'out' / '101.tar'
+    assert hashlib.sha256(archive.read_bytes()).digest() == hashlib.sha256(stub.archive).digest()
+    if drop_rate:
+        assert stub.stats()['drops_injected'] > 0
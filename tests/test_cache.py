@@ -0,0 +1,131 @@
+"""메타데이터 캐시 테스트 (sqlite 캐시, 메모리 LRU, 요청 병합, 조건부 재검증)"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from aihub_cache import MetadataCache, SingleFlight, SizedLRUCache, approximate_size
+
+
+def test_metadata_cache_put_get_delete(tmp_path):
+    cache = MetadataCache(tmp_path / 'm.sqlite3', ttl=60)
+    cache.put('k', 'body', etag='"e"')
+    
+    entry = cache.get('k')
+    assert entry['body'] == 'body' and entry['etag'] == '"e"' and entry['fresh']
+    cache.delete('k')
+    assert cache.get('k') is None
+    cache.close()
+
+
+def test_metadata_cache_close_closes_every_thread_connection(tmp_path):
+    cache = MetadataCache(tmp_path / 'm.sqlite3', ttl=60)
+    connections = []
+    
+    def use():
+        cache.put('k', 'v')
+        connections.append(cache._connection())
+    
+    threads = [threading.Thread(target=use) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cache.close()
+    
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+    # 마지막 연결을 닫으면 WAL 파일이 정리됨
+    assert not (tmp_path / 'm.sqlite3-wal').exists()
+    # 닫은 뒤에도 다시 사용할 수 있음
+    assert cache.get('k')['body'] == 'v'
+    cache.close()
+
+
+def test_approximate_size_counts_nested_values():
+    shared = 'x' * 1000
+    flat = approximate_size({'a': 1})
+    nested = approximate_size({'a': [shared, shared, {'b': shared}]})
+    
+    assert nested > flat + 1000
+    # 같은 객체는 한 번만 셈
+    assert nested < flat + 2000 + 1000
+
+
+def test_sized_lru_evicts_least_recently_used():
+    cache = SizedLRUCache(max_bytes=30)
+    cache.put('a', 1, 10)
+    cache.put('b', 2, 10)
+    cache.put('c', 3, 10)
+    assert cache.get('a') == 1
+    cache.put('d', 4, 10)
+    
+    assert cache.get('b') is None
+    assert [cache.get(key) for key in ('a', 'c', 'd')] == [1, 3, 4]
+    assert cache.stats()['bytes'] == 30
+    assert cache.stats()['evictions'] == 1
+
+
+def test_sized_lru_skips_oversized_and_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    cache = SizedLRUCache(max_bytes=10, ttl=5)
+    cache.put('big', 'v', 11)
+    cache.put('k', 'v', 5)
+    
+    assert cache.get('big') is None
+    assert cache.get('k') == 'v'
+    now[0] += 5
+    assert cache.get('k') is None
+    assert cache.stats()['bytes'] == 0
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'result'
+    
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do('k', fetch)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do('k', fetch))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.stats()['coalesced'] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join()
+    
+    assert results == ['result'] * 4
+    assert len(calls) == 1
+    assert flight.stats() == {'calls': 4, 'coalesced': 3, 'in_flight': 0}
+
+
+def test_client_revalidates_with_etag(client, stub):
+    client.cache.ttl = 0
+    first = client.get_datasets()
+    client.info_cache.invalidate()
+    second = client.get_datasets()
+    
+    assert first == second
+    assert stub.stats()['not_modified'] == 1
+
+
+def test_client_memory_cache_charges_parsed_size(client):
+    client.get_dataset_info('7')
+    
+    stats = client.info_cache.stats()
+    assert stats['entries'] >= 1
+    assert stats['bytes'] >= approximate_size(client.get_dataset_info('7'))
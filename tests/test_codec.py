@@ -0,0 +1,73 @@
+"""JSON 코덱 테스트 (빠른 백엔드의 출력이 표준 json과 같은지)"""
+
+import json
+
+import pytest
+
+import aihub_codec
+
+SAMPLES = [
+    {'dataset_key': '71', 'name': '한국어 대화', 'size': 123456789, 'ratio': 0.25, 'tags': ['음성', None, True]},
+    [1e16, 2.5e-7, 0.00001, 1.5, -0.0, 12345678901234567890],
+    {'text': 'value 1e5 and 0.00001 inside a string', 'nested': {'a': [{'b': []}]}},
+    {'emoji': '\U0001f600', 'control': '\x00\n\t"\\', 'empty': {}},
+]
+
+
+def stdlib_dumps(obj, indent=False):
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+@pytest.fixture(params=['orjson', 'msgspec', 'json'])
+def backend(request, monkeypatch):
+    """설치된 백엔드마다 같은 테스트를 실행"""
+    if request.param != 'json' and getattr(aihub_codec, request.param) is None:
+        pytest.skip(f"{request.param} is not installed")
+    monkeypatch.setattr(aihub_codec, 'BACKEND', request.param)
+    if request.param == 'msgspec':
+        monkeypatch.setattr(aihub_codec, '_msgspec_encoder', aihub_codec.msgspec.json.Encoder(), raising=False)
+        monkeypatch.setattr(aihub_codec, '_msgspec_decoder', aihub_codec.msgspec.json.Decoder(), raising=False)
+    return request.param
+
+
+@pytest.mark.parametrize('indent', [False, True])
+@pytest.mark.parametrize('sample', SAMPLES)
+def test_dumps_matches_stdlib(backend, sample, indent):
+    expected = stdlib_dumps(sample, indent)
+    
+    assert aihub_codec.dumps(sample, indent=indent) == expected
+    assert aihub_codec.dumpb(sample, indent=indent) == expected.encode('utf-8')
+
+
+@pytest.mark.parametrize('sample', SAMPLES)
+def test_loads_round_trip(backend, sample):
+    text = stdlib_dumps(sample)
+    
+    assert aihub_codec.loads(text) == json.loads(text)
+    assert aihub_codec.loads(text.encode('utf-8')) == json.loads(text)
+
+
+def test_loads_falls_back_for_non_standard_input(backend):
+    assert aihub_codec.loads('[NaN, 123456789012345678901234567890]')[1] == 123456789012345678901234567890
+
+
+def test_non_string_keys_fall_back_to_stdlib(backend):
+    assert aihub_codec.dumps({1: 'a'}) == '{"1":"a"}'
+
+
+def test_loads_rejects_invalid_json(backend):
+    with pytest.raises(ValueError):
+        aihub_codec.loads('{not json')
+
+
+@pytest.mark.parametrize('data, mismatch', [
+    (b'[1e16]', True),
+    (b'[2.5e-7]', True),
+    (b'[0.00001]', True),
+    (b'["type"]', False),
+    (b'[1.5,100]', False),
+])
+def test_float_mismatch(data, mismatch):
+    assert aihub_codec._float_mismatch(data) is mismatch
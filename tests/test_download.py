@@ -0,0 +1,126 @@
+"""다운로드 경로 테스트 (분할/단일 스트림, 이어받기, 연결 끊김 복구)"""
+
+import hashlib
+import threading
+from pathlib import Path
+
+import pytest
+
+from aihub_client import SPILL_DIR_NAME, AIHubAPIError, _DownloadJournal
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def assert_extracted(stub, output_dir: Path):
+    """분할 멤버가 원본 그대로 병합되고 임시 파일이 남지 않았는지 확인"""
+    info = stub.archive_info
+    merged = output_dir / info['merged_path']
+    assert merged.stat().st_size == info['merged_size']
+    assert sha256_file(merged) == info['merged_sha256']
+    assert len(list((output_dir / 'dataset' / '02.라벨링데이터').iterdir())) == info['members'] - 3
+    leftovers = [
+        path.name for path in output_dir.rglob('*')
+        if '.part' in path.name or path.name.startswith(SPILL_DIR_NAME) or path.name.endswith('.aihub_assembling')
+    ]
+    assert leftovers == []
+
+
+@pytest.mark.parametrize('segments', [1, 4])
+def test_download_and_extract(client, stub, tmp_path, segments):
+    result = client.download_dataset('101', output_path=str(tmp_path / 'out'), show_progress=False, segments=segments)
+    
+    assert result['success']
+    assert result['downloaded_size'] == len(stub.archive)
+    assert_extracted(stub, tmp_path / 'out')
+
+
+def test_stream_extract(client, stub, tmp_path):
+    result = client.download_dataset(
+        '101', output_path=str(tmp_path / 'out'), show_progress=False, stream_extract=True
+    )
+    
+    assert result['downloaded_size'] == len(stub.archive)
+    assert_extracted(stub, tmp_path / 'out')
+
+
+def test_download_without_extract_keeps_archive(client, stub, tmp_path):
+    result = client.download_dataset('101', output_path=str(tmp_path / 'out'), show_progress=False, extract=False)
+    
+    archive = tmp_path / 'out' / '101.tar'
+    assert result['extracted_files'] == [str(archive)]
+    assert archive.read_bytes() == stub.archive
+
+
+def test_segmented_download_recovers_from_dropped_connections(client, stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(client.retry_policies['download'], 'max_attempts', 20)
+    stub.drop_rate = 0.5
+    
+    client.download_dataset('101', output_path=str(tmp_path / 'out'), show_progress=False, segments=2)
+    
+    assert stub.stats()['drops_injected'] > 0
+    assert_extracted(stub, tmp_path / 'out')
+
+
+def test_resume_probe_requests_one_byte(client, stub, tmp_path):
+    client.download_dataset('101', output_path=str(tmp_path / 'out'), show_progress=False, resume=True, segments=1)
+    
+    # 첫 요청은 1바이트만 받고, 나머지는 구간 요청으로 한 번씩만 받음
+    assert stub.stats()['bytes_sent'] == len(stub.archive) + 1
+    assert_extracted(stub, tmp_path / 'out')
+
+
+def test_resume_after_cancel(client, stub, tmp_path):
+    output_dir = tmp_path / 'out'
+    total = len(stub.archive)
+    cancel_event = threading.Event()
+    
+    def cancel_midway(received, _total):
+        if received >= total // 3:
+            cancel_event.set()
+    
+    with pytest.raises(AIHubAPIError):
+        client.download_dataset(
+            '101', output_path=str(output_dir), show_progress=False, resume=True, segments=2,
+            progress_callback=cancel_midway, cancel_event=cancel_event
+        )
+    
+    # 부분 파일과 저널이 남아 있어야 함
+    partial = output_dir / client._partial_file_name('101', 'all')
+    assert partial.exists()
+    journal_path = partial.with_name(partial.name + '.json')
+    assert journal_path.exists()
+    
+    stub.reset_stats()
+    result = client.download_dataset('101', output_path=str(output_dir), show_progress=False, resume=True)
+    
+    assert result['resumed_size'] > 0
+    assert result['downloaded_size'] == total
+    # 이미 받은 구간은 다시 받지 않음
+    assert stub.stats()['bytes_sent'] <= total - result['resumed_size'] + 1
+    assert not partial.exists()
+    assert not journal_path.exists()
+    assert_extracted(stub, output_dir)
+
+
+def test_journal_merges_ranges_and_reports_gaps(tmp_path):
+    meta = {'url': 'u', 'file_sn': 'all', 'total_size': 100, 'etag': '"x"', 'last_modified': None}
+    journal = _DownloadJournal(tmp_path / 'j.journal', meta)
+    journal.add(10, 10)
+    journal.add(40, 10)
+    journal.add(20, 5)
+    
+    assert journal.ranges == [[10, 25], [40, 50]]
+    assert journal.completed_bytes() == 25
+    assert journal.missing() == [(0, 9), (25, 39), (50, 99)]
+    
+    journal.save()
+    loaded = _DownloadJournal.load(tmp_path / 'j.journal', meta)
+    assert loaded is not None and loaded.ranges == journal.ranges
+    # 서버 파일이 바뀌면(ETag 불일치) 저널을 버림
+    assert _DownloadJournal.load(tmp_path / 'j.journal', dict(meta, etag='"y"')) is None
@@ -0,0 +1,144 @@
+"""tar 압축 해제 중 분할 파일(.partN) 조립 테스트"""
+
+import io
+import logging
+import tarfile
+import threading
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from aihub_client import SPILL_DIR_NAME, AIHubClient, _PartAssembler
+
+
+def make_tar(path: Path, members: List[Tuple[str, bytes]]) -> Path:
+    with tarfile.open(path, 'w', format=tarfile.PAX_FORMAT) as tar:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def extract(client: AIHubClient, tar_path: Path, output_dir: Path) -> List[str]:
+    with tarfile.open(tar_path, 'r') as tar:
+        return client._extract_members(tar, output_dir)
+
+
+@pytest.fixture
+def offline_client():
+    aihub_client = AIHubClient(api_key='test', base_url='http://127.0.0.1:9', cache_ttl=0)
+    yield aihub_client
+    aihub_client.close()
+
+
+@pytest.mark.parametrize('order', [[0, 1, 2, 3], [2, 0, 3, 1], [3, 2, 1, 0]])
+def test_parts_are_assembled_in_number_order(offline_client, tmp_path, order):
+    pieces = [bytes([index]) * (1000 + index) for index in range(4)]
+    tar_path = make_tar(tmp_path / 'a.tar', [(f"data/big.bin.part{index}", pieces[index]) for index in order])
+    
+    extracted = extract(offline_client, tar_path, tmp_path / 'out')
+    
+    assert extracted == [str(tmp_path / 'out' / 'data' / 'big.bin')]
+    assert (tmp_path / 'out' / 'data' / 'big.bin').read_bytes() == b''.join(pieces)
+    assert sorted(path.name for path in (tmp_path / 'out' / 'data').iterdir()) == ['big.bin']
+    assert not any(path.name.startswith(SPILL_DIR_NAME) for path in (tmp_path / 'out').iterdir())
+
+
+def test_single_part_keeps_its_name(offline_client, tmp_path):
+    tar_path = make_tar(tmp_path / 'a.tar', [('data/only.bin.part0', b'abc'), ('data/label.json', b'{}')])
+    
+    extracted = extract(offline_client, tar_path, tmp_path / 'out')
+    
+    assert sorted(extracted) == sorted([
+        str(tmp_path / 'out' / 'data' / 'label.json'),
+        str(tmp_path / 'out' / 'data' / 'only.bin.part0')
+    ])
+    assert (tmp_path / 'out' / 'data' / 'only.bin.part0').read_bytes() == b'abc'
+
+
+@pytest.mark.parametrize('name', ['../escape.bin.part0', 'data/../../escape.bin.part1'])
+def test_part_outside_output_dir_is_rejected(offline_client, tmp_path, name):
+    tar_path = make_tar(tmp_path / 'a.tar', [(name, b'x'), ('data/ok.bin.part0', b'y')])
+    
+    with pytest.raises(ValueError):
+        extract(offline_client, tar_path, tmp_path / 'out')
+    assert not (tmp_path / 'escape.bin').exists()
+    assert not (tmp_path / 'escape.bin.part0').exists()
+
+
+def test_absolute_part_name_is_made_relative(offline_client, tmp_path):
+    tar_path = make_tar(tmp_path / 'a.tar', [('/abs/big.bin.part0', b'ab'), ('/abs/big.bin.part1', b'cd')])
+    
+    extracted = extract(offline_client, tar_path, tmp_path / 'out')
+    
+    assert extracted == [str(tmp_path / 'out' / 'abs' / 'big.bin')]
+    assert (tmp_path / 'out' / 'abs' / 'big.bin').read_bytes() == b'abcd'
+
+
+def test_concurrent_assemblers_use_separate_spill_dirs(offline_client, tmp_path):
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    logger = logging.getLogger(__name__)
+    # 두 조립기가 같은 출력 디렉토리에서 순서가 어긋난 조각을 동시에 보관
+    tars = []
+    for label in ('a', 'b'):
+        pieces = [(label + str(index)).encode() * 500 for index in range(3)]
+        members = [(f"{label}/f.bin.part{index}", pieces[index]) for index in (2, 1, 0)]
+        tar_path = make_tar(tmp_path / f'{label}.tar', members)
+        tars.append((label, tar_path, b''.join(pieces)))
+    
+    assemblers = [_PartAssembler(output_dir, offline_client._merge_files, logger) for _ in tars]
+    barrier = threading.Barrier(len(tars), timeout=10)
+    errors = []
+    
+    def run(assembler, tar_path):
+        try:
+            with tarfile.open(tar_path, 'r') as tar:
+                members = tar.getmembers()
+                assembler.add(tar, members[0])
+                barrier.wait()
+                for member in members[1:]:
+                    assembler.add(tar, member)
+            assembler.finish()
+        except Exception as e:  # pragma: no cover - 실패 시 원인 보고용
+            errors.append(e)
+    
+    threads = [
+        threading.Thread(target=run, args=(assembler, tar_path))
+        for assembler, (_, tar_path, _) in zip(assemblers, tars)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    for label, _, expected in tars:
+        assert (output_dir / label / 'f.bin').read_bytes() == expected
+    assert sorted(path.name for path in output_dir.iterdir()) == ['a', 'b']
+
+
+def test_leftover_part_files_are_merged(offline_client, tmp_path):
+    directory = tmp_path / 'parts'
+    directory.mkdir()
+    for index in (10, 2, 1):
+        (directory / f"x.zip.part{index}").write_bytes(str(index).encode())
+    (directory / 'notes.part.txt').write_bytes(b'keep')
+    
+    stats = offline_client._merge_part_files(directory)
+    
+    assert stats['merged_files'] == 1
+    assert (directory / 'x.zip').read_bytes() == b'1210'
+    assert sorted(path.name for path in directory.iterdir()) == ['notes.part.txt', 'x.zip']
+
+
+@pytest.mark.parametrize('filename, number', [
+    ('a.zip.part0', 0),
+    ('a.zip.part12', 12),
+    ('a.part3.zip', 0),
+    ('a.zip', 0)
+])
+def test_extract_part_number(offline_client, filename, number):
+    assert offline_client._extract_part_number(filename) == number
@@ -0,0 +1,120 @@
+"""MCP 서버 테스트 (커서 페이지네이션, JSON-RPC 알림 처리)"""
+
+import pytest
+
+from aihub_mcp_server import AIHubMCPServer, MCPServerProtocol, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def server(stub, monkeypatch):
+    monkeypatch.setenv('AIHUB_API_BASE_URL', stub.url)
+    monkeypatch.setenv('AIHUB_CATALOG_SNAPSHOT', 'false')
+    mcp_server = AIHubMCPServer(api_key=stub.api_key)
+    yield mcp_server
+    mcp_server.client.close()
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(300, 'scope')
+    
+    assert decode_cursor(cursor, 'scope') == 300
+    assert decode_cursor(None, 'scope') == 0
+    assert decode_cursor('', 'scope') == 0
+
+
+@pytest.mark.parametrize('cursor', [
+    encode_cursor(10, 'other scope'),
+    'not a cursor',
+    '!!!',
+    'LTE6YWJj'
+])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 'scope')
+
+
+def test_list_datasets_pages_cover_catalog_once(server):
+    keys = []
+    cursor = None
+    while True:
+        result = server.execute_tool('list_datasets', {'limit': 100, 'cursor': cursor})
+        assert result['success']
+        keys.extend(entry['dataset_key'] for entry in result['data']['datasets'])
+        cursor = result['data']['next_cursor']
+        if cursor is None:
+            break
+    
+    assert keys == [str(key) for key in range(1, 251)]
+
+
+def test_list_datasets_rejects_foreign_cursor(server):
+    result = server.execute_tool('list_datasets', {'cursor': encode_cursor(100, 'stale digest')})
+    
+    assert not result['success']
+    assert result['error_type'] == 'invalid_parameter'
+
+
+def test_dataset_files_page_and_children_only_on_first_page(server):
+    path = '7.벤치마크 데이터셋 7'
+    first = server.execute_tool('get_dataset_info', {'dataset_key': '7', 'path': path, 'limit': 1})['data']
+    
+    assert first['file_count'] == 50
+    assert first['child_count'] == 2
+    assert [child['path'] for child in first['children']] == [f'{path}/1.Training']
+    assert first['children'][0]['file_count'] == 40
+    
+    files = list(first['files'])
+    cursor = first['next_cursor']
+    while cursor is not None:
+        parameters = {'dataset_key': '7', 'path': path, 'limit': 20, 'cursor': cursor}
+        data = server.execute_tool('get_dataset_info', parameters)['data']
+        assert 'children' not in data
+        files.extend(data['files'])
+        cursor = data['next_cursor']
+    
+    assert len(files) == 50
+    assert len({entry['file_sn'] for entry in files}) == 50
+
+
+def test_dataset_info_accepts_null_path(server):
+    result = server.execute_tool('get_dataset_info', {'dataset_key': '7', 'path': None})
+    
+    assert result['success']
+    assert result['data']['file_count'] == 50
+
+
+def test_dataset_info_unknown_path(server):
+    result = server.execute_tool('get_dataset_info', {'dataset_key': '7', 'path': 'missing'})
+    
+    assert not result['success']
+    assert result['error_type'] == 'invalid_parameter'
+
+
+def test_notifications_get_no_response(server):
+    protocol = MCPServerProtocol(server)
+    
+    assert protocol.handle_request({'jsonrpc': '2.0', 'method': 'notifications/initialized'}) is None
+    assert protocol.handle_request({'jsonrpc': '2.0', 'method': 'unknown/notification'}) is None
+    assert protocol.handle_request([{'jsonrpc': '2.0', 'method': 'notifications/initialized'}]) is None
+
+
+def test_batch_answers_only_requests(server):
+    protocol = MCPServerProtocol(server)
+    
+    responses = protocol.handle_request([
+        {'jsonrpc': '2.0', 'method': 'notifications/initialized'},
+        {'jsonrpc': '2.0', 'id': 1, 'method': 'tools/list'},
+        {'jsonrpc': '2.0', 'id': 2, 'method': 'unknown'}
+    ])
+    
+    assert [response['id'] for response in responses] == [1, 2]
+    assert 'tools' in responses[0]['result']
+    assert responses[1]['error']['code'] == -32601
+
+
+def test_initialized_with_id_is_answered(server):
+    protocol = MCPServerProtocol(server)
+    
+    response = protocol.handle_request({'jsonrpc': '2.0', 'id': 5, 'method': 'notifications/initialized'})
+    
+    assert response == {'jsonrpc': '2.0', 'id': 5, 'result': {}}
@@ -0,0 +1,65 @@
+"""토큰 버킷 속도 제한 테스트"""
+
+import time
+
+import pytest
+
+import aihub_ratelimit
+from aihub_ratelimit import FileTokenBucket, TokenBucket, create_rate_limiter, shared_name
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic을 대체하는 수동 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_burst_then_rate(clock):
+    bucket = TokenBucket(rate=2.0, burst=3)
+    
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    clock[0] += 0.5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_tokens_do_not_accumulate_past_burst(clock):
+    bucket = TokenBucket(rate=10.0, burst=2)
+    clock[0] += 60
+    
+    assert [bucket.reserve() == 0.0 for _ in range(3)] == [True, True, False]
+
+
+def test_default_burst_is_rate():
+    assert TokenBucket(rate=5.0).burst == 5
+    assert TokenBucket(rate=0.5).burst == 1
+
+
+@pytest.mark.skipif(aihub_ratelimit.fcntl is None, reason="file locks require fcntl")
+def test_file_bucket_is_shared_between_instances(tmp_path):
+    path = tmp_path / 'bucket'
+    first = FileTokenBucket(path, rate=0.1, burst=2)
+    second = FileTokenBucket(path, rate=0.1, burst=2)
+    
+    assert first.reserve() == 0.0
+    assert second.reserve() == 0.0
+    assert first.reserve() > 0
+    assert second.reserve() > 0
+
+
+def test_create_rate_limiter(tmp_path):
+    assert create_rate_limiter(0) is None
+    assert type(create_rate_limiter(3.0)) is TokenBucket
+    if aihub_ratelimit.fcntl is not None:
+        assert isinstance(create_rate_limiter(3.0, shared_path=tmp_path / 'b'), FileTokenBucket)
+
+
+def test_shared_name_hides_api_key():
+    name = shared_name('metadata', 'secret-key')
+    
+    assert name.startswith('metadata-')
+    assert 'secret' not in name
+    assert name != shared_name('metadata', 'other-key')
@@ -0,0 +1,74 @@
+"""재시도 정책과 재시도 예산 테스트"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from aihub_retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, None),
+    ('', None),
+    ('0', 0.0),
+    (' 7 ', 7.0),
+    ('soon', None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    wait = parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+    
+    assert wait is not None and 25 <= wait <= 31
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+
+
+def test_policy_allows_idempotent_methods_until_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+    
+    assert policy.allows('get', 1)
+    assert policy.allows('GET', 2)
+    assert not policy.allows('GET', 3)
+    assert not policy.allows('POST', 1)
+    assert policy.should_retry_status(503)
+    assert not policy.should_retry_status(404)
+
+
+def test_policy_delay_uses_capped_full_jitter():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+    
+    for attempt, cap in ((1, 1.0), (2, 2.0), (3, 4.0), (10, 4.0)):
+        delays = [policy.delay(attempt) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert max(delays) > cap / 2
+
+
+def test_policy_delay_prefers_retry_after():
+    policy = RetryPolicy(max_retry_after=60.0)
+    
+    assert policy.delay(1, '5') == 5.0
+    assert policy.delay(1, '120') is None
+    assert RetryPolicy(respect_retry_after=False, backoff_base=1.0).delay(1, '120') <= 1.0
+
+
+def test_budget_allows_min_retries_then_ratio_of_requests():
+    budget = RetryBudget(ratio=0.5, min_retries=2, window=60.0)
+    
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+    for _ in range(4):
+        budget.record_request()
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+def test_budget_window_expires_old_retries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    budget = RetryBudget(ratio=0.0, min_retries=1, window=10.0)
+    
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    now[0] += 11
+    assert budget.try_acquire()